@@ -4,7 +4,11 @@ Flask 애플리케이션을 생성하고 설정하는 팩토리 함수
 """
 
 from flask import Flask
-from .routes import register_routes
+from .repositories.connection_pool import configure_pool
+from .repositories.hospital_cache import configure_hospital_cache
+from .repositories.usage_rollup_store import configure_usage_rollups
+from .services.artifact_store import configure_artifact_store
+from .services.map_prerender import configure_map_prerender
 import os
 from datetime import timedelta
 
@@ -20,6 +24,21 @@ def create_app(config_name='development'):
     # 설정 로드
     app.config.from_object(f'config.{config_name.title()}Config')
     
+    # 공유 MySQL 커넥션 풀 설정
+    configure_pool(app.config)
+    
+    # 병원 스냅샷 캐시 설정
+    configure_hospital_cache(app.config)
+    
+    # 이용인원 롤업 갱신 주기 설정
+    configure_usage_rollups(app.config)
+    
+    # 생성 파일(지도, Excel) 저장소 설정
+    configure_artifact_store(app.config)
+    
+    # 지도 사전 생성 스케줄러 (MAP_PRERENDER가 켜져 있을 때만 시작)
+    configure_map_prerender(app.config)
+    
     # 비밀 키 설정 (세션, CSRF 등을 위해)
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     
@@ -28,7 +47,9 @@ def create_app(config_name='development'):
     app.config['SESSION_COOKIE_HTTPONLY'] = True
     app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
     
-    # 라우트 등록
+    # 라우트 등록 (컨트롤러가 import 시 DB에 연결하므로 앱을 만들 때 import,
+    # app 패키지만 import하는 지도 사전 생성 작업 프로세스/스크립트는 연결하지 않음)
+    from .routes import register_routes
     register_routes(app)
     
     # 에러 핸들러 등록
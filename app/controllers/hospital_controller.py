@@ -3,32 +3,50 @@ Hospital Controller
 병원 관련 HTTP 요청을 처리하는 컨트롤러
 """
 
-from flask import request, jsonify, render_template, redirect, url_for, flash
+from flask import current_app, request, jsonify, render_template, redirect, url_for, flash, Response
 from ..services.hospital_service import HospitalService
 from ..repositories.testdb_hospital_repository import TestDBHospitalRepository
 from ..repositories.hospital_crud_repository import HospitalCrudRepository
-from ..services.folium_map_service import FoliumMapService
+from ..services.folium_map_service import FoliumMapService, RENDER_MODES
+from ..services.hospital_import_service import (
+    HospitalImportError, HospitalImportService, SUPPORTED_EXTENSIONS
+)
+from ..repositories.connection_pool import get_connection, get_pool
+from ..repositories.hospital_cache import hospital_cache
+from ..repositories.usage_rollup_store import usage_rollups
+from ..services.hospital_geojson_service import GEOJSON_PRECISION, HospitalGeoJsonService, parse_bbox
+from ..services.density_service import DensityService
+from ..services.chart_service import ChartService
+from ..services.map_cache import folium_map_cache
+from ..services.map_prerender import map_prerenderer
+import json
 import os
-import pymysql
+import tempfile
 
 class HospitalController:
+    # /api/hospitals/batch 한 번에 조회할 수 있는 최대 ID 수
+    MAX_BATCH_IDS = 500
+    # /api/hospitals/crud 페이지 크기 상한
+    MAX_PAGE_SIZE = 200
+    # /api/hospitals/nearest 최대 k
+    MAX_NEAREST = 100
+    # /api/hospitals/bulk 한 번에 적용할 수 있는 최대 작업 수
+    MAX_BULK_OPERATIONS = 1000
+    # /api/map/folium 지도를 백그라운드에서 생성 중일 때 다시 요청할 간격 (초)
+    MAP_RETRY_AFTER = 2
+    
     def __init__(self):
         # TestDB 리포지토리를 사용하여 서비스 초기화
         testdb_repository = TestDBHospitalRepository()
         self.service = HospitalService(testdb_repository)
+        # 지도 레이어용 GeoJSON
+        self.geojson_service = HospitalGeoJsonService(testdb_repository)
+        # 병원/이용인원 밀도 격자
+        self.density_service = DensityService(testdb_repository)
+        # 이용인원/연도별 현황 차트 데이터
+        self.chart_service = ChartService()
         # CRUD 전용 리포지토리
         self.crud_repository = HospitalCrudRepository()
-        # MySQL 연결 설정
-        import os
-        self.db_config = {
-            'host': '121.157.160.22',
-            'port': 3306,
-            'user': 'root',
-            'password': os.environ.get('MYSQL_PASSWORD', 'zzaaqq'),
-            'database': 'testdb',
-            'charset': 'utf8mb4',
-            'cursorclass': pymysql.cursors.DictCursor
-        }
         
     def index(self):
         """병원 목록 페이지"""
@@ -49,14 +67,56 @@ class HospitalController:
         except Exception as e:
             return jsonify({'error': str(e)}), 500
             
+    def batch(self):
+        """여러 병원 상세 정보를 한 번에 조회 (?ids=1,2,3)"""
+        try:
+            raw_ids = ','.join(request.args.getlist('ids'))
+            try:
+                hospital_ids = [int(value) for value in raw_ids.split(',') if value.strip()]
+            except ValueError:
+                return jsonify({'error': 'ids는 쉼표로 구분된 정수여야 합니다'}), 400
+            if not hospital_ids:
+                return jsonify({'error': 'ids 파라미터가 필요합니다'}), 400
+            if len(hospital_ids) > self.MAX_BATCH_IDS:
+                return jsonify({'error': f'한 번에 최대 {self.MAX_BATCH_IDS}개까지 조회할 수 있습니다'}), 400
+            
+            crud_format = request.args.get('format', '') == 'crud'
+            hospitals = self.service.get_hospitals_by_ids(hospital_ids, crud_format=crud_format)
+            return jsonify(hospitals)
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+            
     def get_hospitals_for_crud(self):
-        """CRUD용 병원 목록 조회 (검색 및 필터링 지원)"""
+        """
+        CRUD용 병원 목록 조회 (검색, 필터링, 정렬, 페이지네이션 지원)
+        
+        page_size를 주면 keyset 페이지네이션: 응답 헤더 X-Total-Count(전체 건수),
+        X-Next-Cursor(다음 페이지 after 값)를 함께 반환
+        """
         try:
             search = request.args.get('search', '').strip()
             filter_type = request.args.get('filter_type', '').strip()
+            sort = request.args.get('sort', '연번').strip()
+            page_size = request.args.get('page_size', type=int)
+            after = request.args.get('after', '').strip() or None
             
-            hospitals = self.crud_repository.find_all_for_crud(search, filter_type)
-            return jsonify(hospitals)
+            try:
+                if page_size is None:
+                    hospitals = self.crud_repository.find_all_for_crud(search, filter_type, sort=sort)
+                    total, next_cursor = len(hospitals), None
+                else:
+                    page_size = max(1, min(page_size, self.MAX_PAGE_SIZE))
+                    hospitals, total, next_cursor = self.crud_repository.find_page_for_crud(
+                        search, filter_type, sort=sort, page_size=page_size, after=after
+                    )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            
+            response = jsonify(hospitals)
+            response.headers['X-Total-Count'] = str(total)
+            if next_cursor:
+                response.headers['X-Next-Cursor'] = next_cursor
+            return response
         except Exception as e:
             print(f"CRUD 조회 오류: {e}")
             return jsonify({'error': str(e)}), 500
@@ -94,6 +154,94 @@ class HospitalController:
             print(f"CRUD 삭제 오류: {e}")
             return jsonify({'error': str(e)}), 500
     
+    def bulk_hospitals_crud(self):
+        """
+        CRUD용 병원 일괄 생성/수정/삭제 (한 트랜잭션)
+        
+        요청: [{"op": "create", "data": {...}}, {"op": "update", "id": 1, "data": {...}},
+               {"op": "delete", "id": 2}] 또는 {"operations": [...]}
+        
+        생성은 다중 행 INSERT 한 문장으로 저장하며, 결과의 id는 그 문장의 첫 연번(LAST_INSERT_ID())부터
+        요청 순서대로 매긴 값 (InnoDB가 행 수를 아는 INSERT 한 문장의 AUTO_INCREMENT 값을 연속으로 할당)
+        """
+        try:
+            payload = request.get_json(silent=True)
+            operations = payload.get('operations') if isinstance(payload, dict) else payload
+            if not isinstance(operations, list) or not operations:
+                return jsonify({'error': '작업 목록(operations)이 필요합니다'}), 400
+            if len(operations) > self.MAX_BULK_OPERATIONS:
+                return jsonify({'error': f'한 번에 최대 {self.MAX_BULK_OPERATIONS}개까지 처리할 수 있습니다'}), 400
+            
+            errors = self.crud_repository.validate_bulk(operations)
+            if errors:
+                return jsonify({'error': '잘못된 작업이 있어 적용하지 않았습니다', 'errors': errors}), 400
+            
+            results = self.crud_repository.bulk_apply(operations)
+            summary = {}
+            for result in results:
+                summary[result['status']] = summary.get(result['status'], 0) + 1
+            return jsonify({'success': True, 'results': results, 'summary': summary})
+        except Exception as e:
+            print(f"CRUD 일괄 처리 오류: {e}")
+            return jsonify({'error': str(e)}), 500
+    
+    def import_hospitals(self):
+        """
+        병원 목록 파일(xlsx/csv) 업로드 가져오기
+        
+        form: file(필수), dry_run=1(검증만), progress=1(묶음마다 NDJSON으로 진행 상황 스트리밍)
+        
+        업로드 크기 상한은 앱 설정 MAX_CONTENT_LENGTH (request.files를 읽기 전에 확인)
+        """
+        max_bytes = current_app.config.get('MAX_CONTENT_LENGTH')
+        if max_bytes and request.content_length and request.content_length > max_bytes:
+            return jsonify({'error': f'파일은 {max_bytes // (1024 * 1024)}MB 이하여야 합니다'}), 413
+        
+        upload = request.files.get('file')
+        if upload is None or not upload.filename:
+            return jsonify({'error': 'file 필드로 파일을 올려주세요'}), 400
+        extension = os.path.splitext(upload.filename)[1].lower()
+        if extension not in SUPPORTED_EXTENSIONS:
+            return jsonify({'error': f"{', '.join(SUPPORTED_EXTENSIONS)} 파일만 가져올 수 있습니다"}), 400
+        
+        dry_run = request.values.get('dry_run', '') in ('1', 'true')
+        stream = request.values.get('progress', '') in ('1', 'true')
+        
+        # 업로드를 임시 파일로 흘려 쓴 뒤 묶음 단위로 읽음 (메모리에 전체를 올리지 않음)
+        handle, path = tempfile.mkstemp(suffix=extension, prefix='hospital_import_')
+        os.close(handle)
+        try:
+            upload.save(path)
+            service = HospitalImportService(self.crud_repository)
+        except Exception as e:
+            os.remove(path)
+            print(f"병원 가져오기 오류: {e}")
+            return jsonify({'error': str(e)}), 500
+        
+        if stream:
+            def generate():
+                try:
+                    for summary in service.iter_import(path, dry_run=dry_run):
+                        yield json.dumps(summary, ensure_ascii=False) + '\n'
+                except Exception as e:
+                    print(f"병원 가져오기 오류: {e}")
+                    yield json.dumps({'done': True, 'error': str(e)}, ensure_ascii=False) + '\n'
+            
+            response = Response(generate(), mimetype='application/x-ndjson')
+            response.call_on_close(lambda: os.path.exists(path) and os.remove(path))
+            return response
+        
+        try:
+            summary = service.import_file(path, dry_run=dry_run)
+            return jsonify({'success': True, **summary})
+        except HospitalImportError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            print(f"병원 가져오기 오류: {e}")
+            return jsonify({'error': str(e)}), 500
+        finally:
+            os.remove(path)
+    
     def create(self):
         """새 병원 생성"""
         try:
@@ -164,11 +312,32 @@ class HospitalController:
         except Exception as e:
             return jsonify({'error': str(e)}), 500
             
+    def nearest(self):
+        """가장 가까운 위탁병원 k개 (?lat=&lng=&k=&type=&min_beds=)"""
+        try:
+            lat = request.args.get('lat', type=float)
+            lng = request.args.get('lng', type=float)
+            if lat is None or lng is None:
+                return jsonify({'error': 'lat, lng 파라미터가 필요합니다'}), 400
+            if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+                return jsonify({'error': 'lat은 -90에서 90, lng는 -180에서 180 사이여야 합니다'}), 400
+            k = request.args.get('k', 5, type=int)
+            if not 1 <= k <= self.MAX_NEAREST:
+                return jsonify({'error': f'k는 1에서 {self.MAX_NEAREST} 사이여야 합니다'}), 400
+            hospital_type = request.args.get('type', '').strip() or None
+            min_beds = request.args.get('min_beds', type=int)
+            
+            hospitals = self.service.get_nearest_hospitals(
+                lat, lng, k, hospital_type=hospital_type, min_beds=min_beds
+            )
+            return jsonify(hospitals)
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+            
     def api_list(self):
         """API용 병원 목록"""
         try:
-            hospitals = self.service.get_all_hospitals()
-            return jsonify(hospitals)
+            return Response(self.service.get_all_hospitals_json(), mimetype='application/json')
         except Exception as e:
             return jsonify({'error': str(e)}), 500
     
@@ -192,49 +361,67 @@ class HospitalController:
             return jsonify({'error': f'테이블 목록 확인 실패: {str(e)}'}), 500
     
     def generate_folium_map(self):
-        """Folium을 사용한 지도 생성"""
+        """Folium을 사용한 지도 생성 (지역, 옵션, 데이터가 같으면 캐시된 파일 재사용)"""
         try:
             from flask import request
             
             # 지역 파라미터 가져오기
             region = request.args.get('region', '').strip()
             
-            map_service = FoliumMapService()
+            # 전국 지도 렌더링 옵션 (지정한 값만 캐시 키에 포함)
+            options = {}
+            for name, cast in (('center_lat', float), ('center_lng', float), ('zoom_start', int)):
+                value = request.args.get(name, type=cast)
+                if value is not None:
+                    options[name] = value
             
-            # 지역별 또는 전국 지도 생성
-            if region:
-                filepath = map_service.create_region_map(region)
-                if not filepath:
+            # 마커 표시 방식 (지정하지 않으면 병원 수에 따라 자동 선택)
+            render_mode = request.args.get('mode', '').strip()
+            if render_mode:
+                if render_mode not in RENDER_MODES:
                     return jsonify({
                         'success': False,
-                        'error': f'{region} 지역의 병원 데이터가 없습니다.'
-                    }), 404
-            else:
-                filepath = map_service.create_hospital_map()
-            
-            filename = os.path.basename(filepath)
-            
-            # 병원 수 계산 (지역별 필터링 적용)
-            from ..repositories.testdb_hospital_repository import TestDBHospitalRepository
-            repo = TestDBHospitalRepository()
-            hospitals = repo.find_all()
-            
-            if region:
-                hospital_count = sum(1 for h in hospitals if region in h.address)
-            else:
-                hospital_count = len(hospitals)
+                        'error': f"mode는 {', '.join(RENDER_MODES)} 중 하나여야 합니다."
+                    }), 400
+                options['render_mode'] = render_mode
             
-            # 파일을 URL 경로로 변환 (파일명만 사용)
-            map_url = f'/{filename}'
+            # 사전 생성 중이면 준비된 지도(이전 데이터의 지도 포함)만 바로 내보내고,
+            # 아직 없는 지도는 백그라운드에서 생성하며 202로 다시 요청하도록 안내
+            # (사전 생성을 켜지 않은 환경은 지도를 만들 다른 주체가 없으므로 요청에서 생성)
+            prerendering = map_prerenderer.running
+            result = folium_map_cache.get_or_render(
+                region, allow_stale=prerendering, background=prerendering, **options
+            )
+            if result is None:
+                return jsonify({
+                    'success': False,
+                    'error': f'{region} 지역의 병원 데이터가 없습니다.'
+                }), 404
+            if result['pending']:
+                response = jsonify({
+                    'success': False,
+                    'pending': True,
+                    'message': f'지도를 생성하고 있습니다. ({region if region else "전국"})',
+                    'retry_after': self.MAP_RETRY_AFTER,
+                    'hospital_count': result['hospital_count'],
+                    'region': region,
+                    'data_version': result['data_version']
+                })
+                response.headers['Retry-After'] = str(self.MAP_RETRY_AFTER)
+                return response, 202
             
             return jsonify({
                 'success': True,
                 'message': f'지도가 성공적으로 생성되었습니다. ({region if region else "전국"})',
-                'filepath': filepath,
-                'filename': filename,
-                'map_url': map_url,
-                'hospital_count': hospital_count,
-                'region': region
+                'filepath': result['filepath'],
+                'filename': result['filename'],
+                'map_url': f"/maps/{result['filename']}",
+                'hospital_count': result['hospital_count'],
+                'region': region,
+                'render_mode': result['render_mode'],
+                'cache_hit': result['cache_hit'],
+                'stale': result['stale'],
+                'data_version': result['data_version']
             })
         except Exception as e:
             import traceback
@@ -245,6 +432,112 @@ class HospitalController:
                 'error': f'지도 생성 실패: {str(e)}'
             }), 500
     
+    def hospital_popup(self, hospital_id):
+        """지도 마커 팝업 HTML (마커를 처음 클릭할 때 조회, ETag로 재검증)"""
+        try:
+            popup = self.service.get_hospital_popup(hospital_id)
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+        if popup is None:
+            return jsonify({'success': False, 'error': '병원을 찾을 수 없습니다'}), 404
+        
+        response = Response(popup['html'], mimetype='text/html')
+        response.set_etag(popup['etag'])
+        # 같은 팝업을 다시 열 때는 1분 동안 브라우저 캐시 사용
+        response.headers['Cache-Control'] = 'private, max-age=60'
+        response.headers['X-Data-Version'] = str(popup['data_version'])
+        return response.make_conditional(request)
+    
+    def hospitals_geojson(self):
+        """지도 레이어용 병원 GeoJSON (If-None-Match가 같으면 304)"""
+        try:
+            layer = self.geojson_service.get_layer(
+                region=request.args.get('region', ''),
+                hospital_type=request.args.get('type', ''),
+                precision=request.args.get('precision', default=GEOJSON_PRECISION, type=int),
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+        
+        response = Response(layer['body'], mimetype='application/geo+json')
+        response.set_etag(layer['etag'])
+        # 브라우저가 캐시하되 매번 ETag로 재검증 (데이터가 같으면 본문 없이 304)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Total-Count'] = str(layer['count'])
+        response.headers['X-Data-Version'] = str(layer['data_version'])
+        return response.make_conditional(request)
+    
+    def hospital_clusters(self):
+        """줌 레벨별 병원 클러스터 GeoJSON (z, bbox=west,south,east,north)"""
+        try:
+            zoom = request.args.get('z', type=int)
+            if zoom is None:
+                raise ValueError('z(줌 레벨)는 필수입니다.')
+            layer = self.geojson_service.get_clusters(
+                zoom,
+                bbox=parse_bbox(request.args.get('bbox', '').strip()),
+                precision=request.args.get('precision', default=GEOJSON_PRECISION, type=int),
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+        
+        response = Response(layer['body'], mimetype='application/geo+json')
+        response.set_etag(layer['etag'])
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Total-Count'] = str(layer['total'])
+        response.headers['X-Data-Version'] = str(layer['data_version'])
+        return response.make_conditional(request)
+    
+    def hospitals_in_bbox(self):
+        """지도 영역 안의 병원 GeoJSON (min_lat, min_lng, max_lat, max_lng, limit, type)"""
+        try:
+            bounds = [request.args.get(name, type=float)
+                      for name in ('min_lat', 'min_lng', 'max_lat', 'max_lng')]
+            if any(value is None for value in bounds):
+                raise ValueError('min_lat, min_lng, max_lat, max_lng는 필수 숫자 파라미터입니다.')
+            layer = self.geojson_service.get_in_box(
+                *bounds,
+                limit=request.args.get('limit', default=500, type=int),
+                hospital_type=request.args.get('type', ''),
+                precision=request.args.get('precision', default=GEOJSON_PRECISION, type=int),
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+        
+        response = Response(layer['body'], mimetype='application/geo+json')
+        response.set_etag(layer['etag'])
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Total-Count'] = str(layer['total'])
+        response.headers['X-Data-Version'] = str(layer['data_version'])
+        return response.make_conditional(request)
+    
+    def density_grid(self):
+        """줌 레벨별 밀도 격자 JSON (source=hospitals|usage, z, bbox, period=YYYYMM)"""
+        try:
+            grid = self.density_service.get_grid(
+                source=request.args.get('source', 'hospitals').strip(),
+                zoom=request.args.get('z', default=7, type=int),
+                bbox=parse_bbox(request.args.get('bbox', '').strip()),
+                period=request.args.get('period', '').strip() or None,
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+        
+        body = json.dumps({'success': True, 'data': grid}, ensure_ascii=False, separators=(',', ':'))
+        response = Response(body, mimetype='application/json')
+        response.add_etag()
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Data-Version'] = str(grid['data_version'])
+        return response.make_conditional(request)
+    
     def export_to_excel(self):
         """병원 데이터를 Excel로 내보내기"""
         try:
@@ -255,7 +548,8 @@ class HospitalController:
                 'success': True,
                 'message': 'Excel 파일이 성공적으로 생성되었습니다.',
                 'filepath': filepath,
-                'filename': os.path.basename(filepath)
+                'filename': os.path.basename(filepath),
+                'download_url': f'/downloads/{os.path.basename(filepath)}'
             })
         except Exception as e:
             return jsonify({
@@ -263,20 +557,36 @@ class HospitalController:
                 'error': f'Excel 내보내기 실패: {str(e)}'
             }), 500
     
+    def chart_data(self, chart_id):
+        """차트 Figure JSON (chart1~chart7) 또는 차트 앱 데이터 (chartData)"""
+        try:
+            chart = self.chart_service.get_chart(chart_id)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 404
+        except Exception as e:
+            print(f"차트 데이터 생성 오류: {e}")
+            return jsonify({'success': False, 'error': str(e)}), 500
+        
+        response = Response(chart['body'], mimetype='application/json')
+        response.set_etag(chart['etag'])
+        # 데이터 버전이 같으면 본문 없이 304
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Data-Version'] = chart['data_version']
+        return response.make_conditional(request)
+    
     def get_yearly_statistics(self):
         """연도별 통계 데이터 조회 (위탁병원현황_연도별현황)"""
         try:
-            connection = pymysql.connect(**self.db_config)
-            with connection.cursor() as cursor:
-                sql = """
-                SELECT 광역지자체, `2022년12월`, `2023년12월`, `2024년12월`
-                FROM 위탁병원현황_연도별현황
-                ORDER BY `2024년12월` DESC
-                """
-                cursor.execute(sql)
-                results = cursor.fetchall()
+            with get_connection() as connection:
+                with connection.cursor() as cursor:
+                    sql = """
+                    SELECT 광역지자체, `2022년12월`, `2023년12월`, `2024년12월`
+                    FROM 위탁병원현황_연도별현황
+                    ORDER BY `2024년12월` DESC
+                    """
+                    cursor.execute(sql)
+                    results = cursor.fetchall()
                 
-            connection.close()
             return jsonify({'success': True, 'data': results})
         except Exception as e:
             print(f"연도별 통계 조회 오류: {e}")
@@ -285,27 +595,56 @@ class HospitalController:
     def get_yearly_total_trend(self):
         """연도별 전체 합계 추세 데이터 조회 (Chart 2용)"""
         try:
-            connection = pymysql.connect(**self.db_config)
-            with connection.cursor() as cursor:
-                sql = """
-                SELECT 
-                    SUM(`2022년12월`) as `2022`,
-                    SUM(`2023년12월`) as `2023`,
-                    SUM(`2024년12월`) as `2024`
-                FROM 위탁병원현황_연도별현황
-                """
-                cursor.execute(sql)
-                result = cursor.fetchone()
+            with get_connection() as connection:
+                with connection.cursor() as cursor:
+                    sql = """
+                    SELECT 
+                        SUM(`2022년12월`) as `2022`,
+                        SUM(`2023년12월`) as `2023`,
+                        SUM(`2024년12월`) as `2024`
+                    FROM 위탁병원현황_연도별현황
+                    """
+                    cursor.execute(sql)
+                    result = cursor.fetchone()
                 
-                # 데이터를 배열 형태로 변환
-                trend_data = [
-                    {'year': '2022년12월', 'total': result['2022'] if result['2022'] else 0},
-                    {'year': '2023년12월', 'total': result['2023'] if result['2023'] else 0},
-                    {'year': '2024년12월', 'total': result['2024'] if result['2024'] else 0}
-                ]
+                    # 데이터를 배열 형태로 변환
+                    trend_data = [
+                        {'year': '2022년12월', 'total': result['2022'] if result['2022'] else 0},
+                        {'year': '2023년12월', 'total': result['2023'] if result['2023'] else 0},
+                        {'year': '2024년12월', 'total': result['2024'] if result['2024'] else 0}
+                    ]
                 
-            connection.close()
             return jsonify({'success': True, 'data': trend_data})
         except Exception as e:
             print(f"연도별 합계 조회 오류: {e}")
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
+    def get_pool_stats(self):
+        """공유 MySQL 커넥션 풀 상태 및 카운터 조회"""
+        try:
+            return jsonify({'success': True, 'data': get_pool().stats()})
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
+    def get_cache_stats(self):
+        """병원 스냅샷 캐시 상태(데이터 버전, 적중/갱신 횟수) 조회"""
+        try:
+            return jsonify({'success': True, 'data': hospital_cache.stats()})
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
+    def get_usage_rollup_stats(self):
+        """이용인원 롤업 상태(데이터 버전, 마지막 연월, 증분/전체 갱신 횟수) 조회"""
+        try:
+            return jsonify({'success': True, 'data': usage_rollups.stats()})
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
+    def get_map_cache_stats(self):
+        """생성된 지도 캐시와 사전 생성 상태 조회"""
+        try:
+            data = folium_map_cache.stats()
+            data['prerender'] = map_prerenderer.stats()
+            return jsonify({'success': True, 'data': data})
+        except Exception as e:
             return jsonify({'success': False, 'error': str(e)}), 500
\ No newline at end of file
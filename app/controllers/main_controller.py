@@ -5,40 +5,18 @@ Main Controller
 
 from flask import render_template
 from ..services.hospital_service import HospitalService
+from ..repositories.testdb_hospital_repository import TestDBHospitalRepository
 
 class MainController:
     def __init__(self):
-        self.hospital_service = HospitalService()
+        # 지도/목록과 같은 위탁병원현황 스냅샷 사용 (시도 통계는 지역 색인 조회)
+        self.hospital_service = HospitalService(TestDBHospitalRepository())
         
     def index(self):
         """메인 페이지 - 누구나 접근 가능"""
         try:
-            # 통계 데이터 수집
-            hospitals = self.hospital_service.get_all_hospitals()
-            
-            # 지역별 통계 (시도 기준)
-            provinces = set()
-            departments = set()
-            
-            for hospital in hospitals:
-                # 주소에서 시도 추출 (간단한 방법)
-                if hospital.get('address'):
-                    address_parts = hospital['address'].split()
-                    if address_parts:
-                        province = address_parts[0]
-                        # 특별시, 광역시, 도 등이 포함된 경우만 추가
-                        if any(suffix in province for suffix in ['시', '도', '특별시', '광역시']):
-                            provinces.add(province)
-                
-                # 진료과목 수집
-                if hospital.get('medical_departments'):
-                    departments.update(hospital['medical_departments'])
-            
-            context = {
-                'total_hospitals': len(hospitals),
-                'total_provinces': len(provinces),
-                'total_departments': len(departments)
-            }
+            # 통계 데이터 (스냅샷마다 한 번만 계산)
+            context = self.hospital_service.get_overview_stats()
             
             return render_template('index.html', **context)
             
@@ -52,13 +30,8 @@ class MainController:
             return render_template('index.html', **context)
     
     def map_view(self):
-        """지도 전용 페이지"""
-        try:
-            hospitals = self.hospital_service.get_all_hospitals()
-            return render_template('map.html', hospitals=hospitals)
-        except Exception as e:
-            print(f"지도 페이지 오류: {e}")
-            return render_template('map.html', hospitals=[])
+        """지도 전용 페이지 (병원 데이터는 /api/map/hospitals.geojson에서 불러옴)"""
+        return render_template('map.html')
     
     def folium_map(self):
         """Folium 지도 페이지"""
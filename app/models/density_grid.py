@@ -0,0 +1,75 @@
+"""
+Density Grid
+위경도 점(가중치)을 줌 레벨별 격자로 집계하는 밀도 격자 (NumPy histogram2d)
+"""
+
+import math
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 집계 범위 (서, 남, 동, 북) - 제주/울릉도/독도 포함
+KOREA_BOUNDS = (124.0, 33.0, 132.0, 39.0)
+
+# 밀도를 계산하는 줌 범위 (범위를 벗어난 줌은 가장 가까운 줌의 격자 사용)
+DENSITY_MIN_ZOOM = 5
+DENSITY_MAX_ZOOM = 12
+# 격자 셀 한 변의 화면 크기 (px, 256px 타일 기준)
+DENSITY_CELL_PIXELS = 32
+
+
+def clamp_zoom(zoom: int) -> int:
+    """밀도 격자를 만드는 줌 범위로 제한"""
+    return min(max(int(zoom), DENSITY_MIN_ZOOM), DENSITY_MAX_ZOOM)
+
+
+def cell_size(zoom: int, bounds: Tuple[float, float, float, float] = KOREA_BOUNDS) -> Tuple[float, float]:
+    """
+    줌 레벨의 격자 셀 크기 (위도 간격, 경도 간격)
+
+    화면에서 DENSITY_CELL_PIXELS 크기의 정사각형이 되도록
+    위도 간격은 집계 범위 중간 위도의 cos만큼 줄인다.
+    """
+    lng_step = DENSITY_CELL_PIXELS * 360.0 / (256 * 2 ** clamp_zoom(zoom))
+    middle = math.radians((bounds[1] + bounds[3]) / 2)
+    return lng_step * math.cos(middle), lng_step
+
+
+def bin_density(lats: Sequence[float], lngs: Sequence[float], weights: Optional[Sequence[float]] = None,
+                zoom: int = 7, bounds: Tuple[float, float, float, float] = KOREA_BOUNDS) -> Dict[str, Any]:
+    """
+    점 목록을 격자 셀별 합계로 집계
+
+    Returns:
+        {'zoom', 'cell_size': [위도 간격, 경도 간격], 'bounds', 'cells': [[중심 위도, 중심 경도, 값]],
+         'max', 'total'} - 값이 0인 셀과 범위 밖의 점은 제외
+    """
+    zoom = clamp_zoom(zoom)
+    lat_step, lng_step = cell_size(zoom, bounds)
+    west, south, east, north = bounds
+    lat_edges = np.arange(south, north + lat_step, lat_step)
+    lng_edges = np.arange(west, east + lng_step, lng_step)
+
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=float)
+    if lats.size:
+        grid, _, _ = np.histogram2d(lats, lngs, bins=[lat_edges, lng_edges], weights=weights)
+    else:
+        grid = np.zeros((len(lat_edges) - 1, len(lng_edges) - 1))
+
+    rows, cols = np.nonzero(grid)
+    values = grid[rows, cols]
+    center_lats = np.round(lat_edges[rows] + lat_step / 2, 4)
+    center_lngs = np.round(lng_edges[cols] + lng_step / 2, 4)
+    cells = [[lat, lng, int(value) if float(value).is_integer() else round(float(value), 3)]
+             for lat, lng, value in zip(center_lats.tolist(), center_lngs.tolist(), values.tolist())]
+    return {
+        'zoom': zoom,
+        'cell_size': [round(lat_step, 6), round(lng_step, 6)],
+        'bounds': list(bounds),
+        'cells': cells,
+        'max': float(values.max()) if values.size else 0.0,
+        'total': float(values.sum()),
+    }
@@ -4,9 +4,17 @@ Hospital Model
 """
 
 class Hospital:
+    # 인스턴스 __dict__ 없이 고정 속성만 보관 (스냅샷의 수천 개 객체 메모리 절감)
+    __slots__ = (
+        'hospital_id', 'name', 'address', 'latitude', 'longitude',
+        'medical_departments', 'bed_count', 'department_count',
+        'sigungu', 'phone', 'street_address', 'detail_address'
+    )
+    
     def __init__(self, hospital_id=None, name=None, address=None, 
                  latitude=None, longitude=None, medical_departments=None,
-                 bed_count=None, department_count=None):
+                 bed_count=None, department_count=None, sigungu=None,
+                 phone=None, street_address=None, detail_address=None):
         self.hospital_id = hospital_id
         self.name = name
         self.address = address
@@ -15,6 +23,11 @@ class Hospital:
         self.medical_departments = medical_departments or []
         self.bed_count = bed_count
         self.department_count = department_count
+        # 위탁병원현황 원본 컬럼 (시군구, 전화번호, 주소, 상세주소)
+        self.sigungu = sigungu
+        self.phone = phone
+        self.street_address = street_address
+        self.detail_address = detail_address
     
     @property
     def hospital_type(self):
@@ -35,6 +48,22 @@ class Hospital:
             'hospital_type': self.hospital_type
         }
         
+    def to_crud_dict(self):
+        """위탁병원현황 컬럼명(한글) 형식의 딕셔너리로 변환 (CRUD 화면용)"""
+        return {
+            '연번': self.hospital_id,
+            '시군구': self.sigungu or '',
+            '요양기관명': self.name,
+            '종별': self.hospital_type,
+            '병상수': self.bed_count,
+            '진료과수': self.department_count,
+            '전화번호': self.phone or '',
+            '주소': self.street_address or '',
+            '상세주소': self.detail_address or '',
+            '경도': self.longitude or 0,
+            '위도': self.latitude or 0
+        }
+        
     @classmethod
     def from_dict(cls, data):
         """딕셔너리에서 객체 생성"""
@@ -0,0 +1,195 @@
+"""
+Hospital Cluster Index
+줌 레벨별 병원 좌표 클러스터 (Web Mercator 격자를 줌마다 반으로 나누는 계층형 집계)
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 클러스터를 만드는 줌 범위 (MAX_ZOOM보다 크게 확대하면 개별 병원 표시)
+MIN_ZOOM = 0
+MAX_ZOOM = 16
+# 격자 셀 한 변의 화면 크기 (px, 256px 타일 기준) - 이 간격 안의 병원을 하나로 묶음
+CELL_PIXELS = 64
+TILE_SIZE = 256
+# Web Mercator가 표현하는 위도 한계
+MAX_LATITUDE = 85.05112878
+
+Cell = Tuple[int, int]
+Point = Tuple[float, float, str]  # (위도, 경도, 종별)
+
+
+def project(lat: float, lng: float) -> Tuple[float, float]:
+    """위경도를 [0, 1) 범위의 Web Mercator 좌표로 변환"""
+    lat = max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))
+    x = (lng + 180.0) / 360.0
+    sin = math.sin(math.radians(lat))
+    y = 0.5 - math.log((1 + sin) / (1 - sin)) / (4 * math.pi)
+    return min(max(x, 0.0), 1.0 - 1e-12), min(max(y, 0.0), 1.0 - 1e-12)
+
+
+def cells_per_axis(zoom: int) -> int:
+    """줌 레벨의 격자 셀 수 (한 축) - 줌이 1 오를 때마다 두 배라 셀이 4개로 정확히 나뉨"""
+    return (TILE_SIZE // CELL_PIXELS) << zoom
+
+
+class _Cluster:
+    """격자 셀 하나의 합계 (더하고 빼기만 하므로 증분 갱신이 정확함)"""
+
+    __slots__ = ('count', 'lat_sum', 'lng_sum', 'id_sum', 'types')
+
+    def __init__(self):
+        self.count = 0
+        self.lat_sum = 0.0
+        self.lng_sum = 0.0
+        self.id_sum = 0  # 병원이 하나뿐이면 그 병원 ID
+        self.types: Dict[str, int] = {}
+
+    def copy(self) -> '_Cluster':
+        cluster = _Cluster()
+        cluster.count, cluster.lat_sum, cluster.lng_sum = self.count, self.lat_sum, self.lng_sum
+        cluster.id_sum, cluster.types = self.id_sum, dict(self.types)
+        return cluster
+
+    def add(self, hospital_id: int, point: Point, sign: int) -> None:
+        lat, lng, kind = point
+        self.count += sign
+        self.lat_sum += sign * lat
+        self.lng_sum += sign * lng
+        self.id_sum += sign * hospital_id
+        remaining = self.types.get(kind, 0) + sign
+        if remaining:
+            self.types[kind] = remaining
+        else:
+            self.types.pop(kind, None)
+
+
+class HospitalClusterIndex:
+    """
+    병원 ID 기준 줌 레벨별 클러스터 색인
+
+    - 줌 z의 셀은 Web Mercator를 (256/CELL_PIXELS)*2^z 칸으로 나눈 격자, z+1 셀 4개가 z 셀 하나에 들어감
+    - 셀마다 병원 수, 좌표 합(중심점), 종별 개수만 보관 (병원 목록은 보관하지 않음)
+    - 조회는 해당 줌의 셀 중 영역(bbox) 안의 것만 반환 (수천 개 마커 대신 수십 개 클러스터)
+    - updated(): 추가/삭제/좌표나 종별이 바뀐 병원만 각 줌의 합계에서 빼고 더한 새 색인 반환
+    """
+
+    def __init__(self, hospitals: Iterable = ()):
+        self._points: Dict[int, Point] = {}
+        self._levels: List[Dict[Cell, _Cluster]] = [{} for _ in range(MIN_ZOOM, MAX_ZOOM + 1)]
+        for hospital_id, point in self._collect(hospitals).items():
+            self._apply(hospital_id, point, 1, None)
+
+    def __len__(self):
+        return len(self._points)
+
+    def updated(self, hospitals: Iterable) -> 'HospitalClusterIndex':
+        """새 병원 목록과의 차이만 반영한 새 색인 (변경되지 않은 셀은 공유, 기존 색인은 그대로)"""
+        current = self._collect(hospitals)
+        index = HospitalClusterIndex()
+        index._points = dict(self._points)
+        index._levels = [dict(level) for level in self._levels]
+        copied: List[set] = [set() for _ in index._levels]
+
+        for hospital_id, point in self._points.items():
+            if current.get(hospital_id) != point:
+                index._apply(hospital_id, point, -1, copied)
+        for hospital_id, point in current.items():
+            if hospital_id not in index._points:
+                index._apply(hospital_id, point, 1, copied)
+        return index
+
+    def clusters(self, zoom: int, bbox: Optional[Tuple[float, float, float, float]] = None) -> List[Dict[str, Any]]:
+        """
+        줌 레벨의 클러스터 목록
+
+        Args:
+            zoom: 지도 줌 (MAX_ZOOM보다 크면 MAX_ZOOM 셀 기준, 병원이 하나인 셀은 개별 병원)
+            bbox: (서, 남, 동, 북) 경위도 영역 (기본: 전체) - 셀이 영역과 겹치면 포함
+                (중심점이 영역 밖이어도 영역 안에 병원이 있을 수 있으므로 중심점이 아니라 셀로 판단)
+
+        Returns:
+            [{'lat', 'lng', 'count', 'types', 'hospital_id'(병원이 하나일 때), 'cell', 'expansion_zoom'}]
+        """
+        level = min(max(int(zoom), MIN_ZOOM), MAX_ZOOM)
+        cells = self._levels[level - MIN_ZOOM]
+        cell_range = self._cell_range(level, bbox) if bbox is not None else None
+        results = []
+        for cell, cluster in cells.items():
+            if cell_range is not None and not (cell_range[0] <= cell[0] <= cell_range[2]
+                                               and cell_range[1] <= cell[1] <= cell_range[3]):
+                continue
+            lat = cluster.lat_sum / cluster.count
+            lng = cluster.lng_sum / cluster.count
+            item = {
+                'lat': lat,
+                'lng': lng,
+                'count': cluster.count,
+                'types': dict(cluster.types),
+                'cell': f'{level}/{cell[0]}/{cell[1]}',
+            }
+            if cluster.count == 1:
+                item['hospital_id'] = cluster.id_sum
+            else:
+                item['expansion_zoom'] = self._expansion_zoom(level, cell)
+            results.append(item)
+        # 큰 클러스터가 위에 그려지도록 병원 수가 많은 순
+        results.sort(key=lambda item: (-item['count'], item['cell']))
+        return results
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _collect(hospitals: Iterable) -> Dict[int, Point]:
+        points = {}
+        for hospital in hospitals:
+            if hospital.latitude is not None and hospital.longitude is not None:
+                points[hospital.hospital_id] = (hospital.latitude, hospital.longitude, hospital.hospital_type)
+        return points
+
+    @staticmethod
+    def _cell_range(level: int, bbox: Tuple[float, float, float, float]) -> Tuple[int, int, int, int]:
+        """bbox와 겹치는 셀 범위 (min_x, min_y, max_x, max_y) - Mercator y는 북쪽이 작음"""
+        size = cells_per_axis(level)
+        west, south, east, north = bbox
+        min_x, min_y = project(north, west)
+        max_x, max_y = project(south, east)
+        return int(min_x * size), int(min_y * size), int(max_x * size), int(max_y * size)
+
+    def _apply(self, hospital_id: int, point: Point, sign: int, copied: Optional[List[set]]) -> None:
+        """모든 줌 레벨의 셀 합계에 병원 하나를 더하거나(1) 뺌(-1)"""
+        if sign > 0:
+            self._points[hospital_id] = point
+        else:
+            self._points.pop(hospital_id, None)
+
+        x, y = project(point[0], point[1])
+        for offset, level in enumerate(self._levels):
+            size = cells_per_axis(MIN_ZOOM + offset)
+            cell = (int(x * size), int(y * size))
+            cluster = level.get(cell)
+            if cluster is None:
+                cluster = level[cell] = _Cluster()
+                if copied is not None:
+                    copied[offset].add(cell)
+            elif copied is not None and cell not in copied[offset]:
+                # 이전 색인과 공유하는 셀은 복사한 뒤 수정
+                cluster = level[cell] = cluster.copy()
+                copied[offset].add(cell)
+            cluster.add(hospital_id, point, sign)
+            if cluster.count == 0:
+                del level[cell]
+
+    def _expansion_zoom(self, level: int, cell: Cell) -> int:
+        """클러스터가 둘 이상으로 나뉘는 첫 줌 (클러스터를 누르면 이 줌으로 확대)"""
+        count = self._levels[level - MIN_ZOOM][cell].count
+        while level < MAX_ZOOM:
+            level += 1
+            children = self._levels[level - MIN_ZOOM]
+            child_cells = [(cell[0] * 2 + dx, cell[1] * 2 + dy) for dx in (0, 1) for dy in (0, 1)]
+            filled = [child for child in child_cells if child in children]
+            if len(filled) != 1 or children[filled[0]].count != count:
+                return level
+            cell = filled[0]
+        return MAX_ZOOM + 1
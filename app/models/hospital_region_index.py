@@ -0,0 +1,145 @@
+"""
+Hospital Region Index
+주소에서 시도/시군구를 한 번만 파싱해 지역별 병원 ID 목록으로 보관하는 색인
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 시도 표기 -> 대표 이름 (REGION_CENTERS 키와 같은 두 글자 이름)
+# '광주시'는 경기도 광주시와 겹치므로 광주광역시 별칭에서 제외
+SIDO_ALIASES: Dict[str, str] = {}
+for _short, _names in (
+    ('서울', ('서울특별시', '서울시')),
+    ('부산', ('부산광역시', '부산시')),
+    ('대구', ('대구광역시', '대구시')),
+    ('인천', ('인천광역시', '인천시')),
+    ('광주', ('광주광역시',)),
+    ('대전', ('대전광역시', '대전시')),
+    ('울산', ('울산광역시', '울산시')),
+    ('세종', ('세종특별자치시', '세종시')),
+    ('경기', ('경기도',)),
+    ('강원', ('강원특별자치도', '강원도')),
+    ('충북', ('충청북도',)),
+    ('충남', ('충청남도',)),
+    ('전북', ('전북특별자치도', '전라북도')),
+    ('전남', ('전라남도',)),
+    ('경북', ('경상북도',)),
+    ('경남', ('경상남도',)),
+    ('제주', ('제주특별자치도', '제주도')),
+):
+    SIDO_ALIASES[_short] = _short
+    for _name in _names:
+        SIDO_ALIASES[_name] = _short
+
+SIGUNGU_SUFFIXES = ('시', '군', '구')
+
+Region = Tuple[str, str]  # (시도, 시군구), 알 수 없으면 빈 문자열
+
+
+def parse_region(address: Optional[str], sigungu: Optional[str] = None) -> Region:
+    """
+    주소에서 (시도, 시군구) 추출
+
+    - 시도: 주소 단어 중 처음 나오는 시도 표기 (서울특별시, 서울, 경기도 ...)
+    - 시군구: sigungu 값이 있으면 그 값, 없으면 시도 바로 다음 단어 (시/군/구로 끝날 때)
+    """
+    # 시군구 값에 시도가 붙어 있으면 ('서울특별시 강남구') 시도가 아닌 첫 단어 사용
+    sigungu = next((token for token in (sigungu or '').split() if token not in SIDO_ALIASES), '')
+    tokens = (address or '').split()
+    for position, token in enumerate(tokens):
+        sido = SIDO_ALIASES.get(token)
+        if sido is None:
+            continue
+        if not sigungu and position + 1 < len(tokens) and tokens[position + 1].endswith(SIGUNGU_SUFFIXES):
+            sigungu = tokens[position + 1]
+        return sido, sigungu
+    return '', sigungu
+
+
+class HospitalRegionIndex:
+    """
+    병원 ID 기준 시도/시군구 색인
+
+    - 병원마다 주소를 한 번만 파싱해 시도별, (시도, 시군구)별, 시군구 이름별 ID 목록 보관
+    - 지역 필터/개수/시도 통계는 목록 조회 (주소 부분 문자열 검사 없음)
+    - ID 목록은 입력 병원 순서 유지
+    - updated(): 주소/시군구가 바뀐 병원만 다시 파싱한 새 색인 반환
+    """
+
+    def __init__(self, hospitals: Iterable = (), parsed: Optional[Dict] = None):
+        # 병원 ID -> ((주소, 시군구), (시도, 시군구)) - 다음 색인이 재사용
+        self._parsed: Dict[int, Tuple[Tuple, Region]] = {}
+        self._sido: Dict[str, List[int]] = {}
+        self._sigungu: Dict[Region, List[int]] = {}
+        self._sigungu_names: Dict[str, List[int]] = {}
+        self.parse_count = 0
+
+        previous = parsed or {}
+        for hospital in hospitals:
+            source = (hospital.address, hospital.sigungu)
+            cached = previous.get(hospital.hospital_id)
+            if cached is not None and cached[0] == source:
+                region = cached[1]
+            else:
+                region = parse_region(*source)
+                self.parse_count += 1
+            self._add(hospital.hospital_id, source, region)
+
+    def __len__(self):
+        return len(self._parsed)
+
+    def updated(self, hospitals: Iterable) -> 'HospitalRegionIndex':
+        """새 병원 목록의 색인 (주소/시군구가 그대로인 병원은 다시 파싱하지 않음)"""
+        return HospitalRegionIndex(hospitals, self._parsed)
+
+    def region_of(self, hospital_id: int) -> Region:
+        """병원의 (시도, 시군구)"""
+        entry = self._parsed.get(hospital_id)
+        return entry[1] if entry else ('', '')
+
+    def ids(self, region: str) -> List[int]:
+        """
+        지역에 속한 병원 ID 목록
+
+        Args:
+            region: '서울', '서울특별시', '서울 강남구', '강남구'(모든 시도의 같은 이름 시군구) 형식
+        """
+        sido, sigungu = self.resolve(region)
+        if sido and sigungu:
+            return list(self._sigungu.get((sido, sigungu), ()))
+        if sido:
+            return list(self._sido.get(sido, ()))
+        return list(self._sigungu_names.get(sigungu, ()))
+
+    def count(self, region: str) -> int:
+        """지역에 속한 병원 수"""
+        return len(self.ids(region))
+
+    def sido_counts(self) -> Dict[str, int]:
+        """시도별 병원 수 (시도를 알 수 없는 병원 제외)"""
+        return {sido: len(ids) for sido, ids in self._sido.items() if sido}
+
+    def sigungu_counts(self, sido: str) -> Dict[str, int]:
+        """시도 안의 시군구별 병원 수"""
+        sido = SIDO_ALIASES.get(sido, sido)
+        return {name: len(ids) for (parent, name), ids in self._sigungu.items()
+                if parent == sido and name}
+
+    @staticmethod
+    def resolve(region: str) -> Region:
+        """지역 조건 문자열을 (시도, 시군구)로 변환 (시도가 아니면 시군구 이름으로 취급)"""
+        tokens = (region or '').split()
+        if not tokens:
+            return '', ''
+        sido = SIDO_ALIASES.get(tokens[0])
+        if sido is None:
+            return '', tokens[0]
+        return sido, tokens[1] if len(tokens) > 1 else ''
+
+    def _add(self, hospital_id: int, source: Tuple, region: Region) -> None:
+        self._parsed[hospital_id] = (source, region)
+        sido, sigungu = region
+        self._sido.setdefault(sido, []).append(hospital_id)
+        self._sigungu.setdefault(region, []).append(hospital_id)
+        if sigungu:
+            self._sigungu_names.setdefault(sigungu, []).append(hospital_id)
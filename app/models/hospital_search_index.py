@@ -0,0 +1,124 @@
+"""
+Hospital Search Index
+병원 스냅샷 위에 만드는 한글 bigram 역색인 (관련도 순 검색)
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+# 필드별 가중치 (요양기관명 일치가 주소 일치보다 중요)
+FIELD_WEIGHTS = (
+    ('name', 4.0),
+    ('sigungu', 2.0),
+    ('street_address', 1.0),
+    ('detail_address', 0.5),
+    ('phone', 1.0),
+)
+
+_SPACE_RE = re.compile(r'\s+')
+
+
+def normalize(text: Optional[str]) -> str:
+    """검색용 정규화 - 소문자, 공백/하이픈 제거"""
+    if not text:
+        return ''
+    return _SPACE_RE.sub('', str(text)).replace('-', '').lower()
+
+
+def ngrams(text: str) -> Set[str]:
+    """정규화된 문자열의 bigram 집합 (한 글자면 그 글자)"""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class HospitalSearchIndex:
+    """
+    병원 목록의 bigram 역색인
+
+    - 색인 필드: 요양기관명, 시군구, 주소, 상세주소, 전화번호
+    - 검색어는 공백으로 나눈 단어를 모두 포함(AND)하는 병원만 반환
+    - 후보는 bigram posting 교집합으로 좁힌 뒤 부분 문자열로 확인 (LIKE '%단어%'와 같은 결과)
+    - 점수: 단어마다 일치한 필드 가중치 중 최댓값, 필드 전체 일치/접두 일치면 가산
+    """
+
+    def __init__(self, hospitals: Sequence):
+        self.ids = [hospital.hospital_id for hospital in hospitals]
+        self._fields: List[Tuple[str, ...]] = []
+        self._postings: Dict[str, Set[int]] = {}
+        self._unigrams: Dict[str, Set[int]] = {}
+
+        for position, hospital in enumerate(hospitals):
+            fields = tuple(normalize(getattr(hospital, name)) for name, _ in FIELD_WEIGHTS)
+            self._fields.append(fields)
+            for text in fields:
+                for gram in ngrams(text):
+                    self._postings.setdefault(gram, set()).add(position)
+                for char in set(text):
+                    self._unigrams.setdefault(char, set()).add(position)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        검색어에 맞는 (행 위치, 점수) 목록을 관련도 순으로 반환
+
+        점수가 같으면 원래 순서(연번)를 유지한다.
+        """
+        terms = [normalize(term) for term in query.split()]
+        terms = [term for term in terms if term]
+        if not terms:
+            return []
+
+        candidates: Optional[Set[int]] = None
+        for term in terms:
+            postings = self._candidates(term)
+            candidates = postings if candidates is None else candidates & postings
+            if not candidates:
+                return []
+
+        results = []
+        for position in candidates:
+            score = self._score(self._fields[position], terms)
+            if score > 0:
+                results.append((position, score))
+        results.sort(key=lambda item: (-item[1], item[0]))
+        return results[:limit] if limit else results
+
+    def search_ids(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """search()와 같지만 행 위치 대신 병원 ID를 반환"""
+        ids = self.ids
+        return [(ids[position], score) for position, score in self.search(query, limit)]
+
+    def _candidates(self, term: str) -> Set[int]:
+        if len(term) == 1:
+            return self._unigrams.get(term, set())
+        grams = sorted(ngrams(term), key=lambda gram: len(self._postings.get(gram, ())))
+        result = set(self._postings.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not result:
+                break
+            result &= self._postings.get(gram, set())
+        return result
+
+    @staticmethod
+    def _score(fields: Tuple[str, ...], terms: List[str]) -> float:
+        total = 0.0
+        for term in terms:
+            best = 0.0
+            for text, (_, weight) in zip(fields, FIELD_WEIGHTS):
+                if term not in text:
+                    continue
+                if text == term:
+                    score = weight * 2
+                elif text.startswith(term):
+                    score = weight * 1.5
+                else:
+                    score = weight
+                best = max(best, score)
+            if best == 0:
+                # 단어 하나라도 어느 필드에도 없으면 불일치 (bigram만 겹친 경우)
+                return 0.0
+            total += best
+        return total
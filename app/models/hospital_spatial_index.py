@@ -0,0 +1,236 @@
+"""
+Hospital Spatial Index
+병원 좌표를 위경도 격자(grid) 셀로 나눠 보관하는 공간 색인 (반경 검색용)
+"""
+
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LAT = 111.32
+
+Cell = Tuple[int, int]
+
+
+def haversine_km(lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """한 지점과 여러 지점 사이의 대원 거리 (km, 벡터 연산)"""
+    lat1, lng1 = math.radians(lat), math.radians(lng)
+    lat2, lng2 = np.radians(lats), np.radians(lngs)
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class HospitalSpatialIndex:
+    """
+    병원 ID 기준 격자 공간 색인
+
+    - cell_size(도) 간격의 위경도 격자 셀마다 병원 ID 집합 보관
+    - 반경 검색은 반경을 덮는 셀의 후보만 거리 계산 (전체 행 스캔 없음)
+    - k-최근접 검색은 가까운 셀부터 고리(ring) 단위로 넓혀 가며 k개가 확정되면 중단
+    - 영역(사각형) 검색은 사각형을 덮는 셀의 후보만 좌표 비교 (지도 화면 단위 조회)
+    - updated(): 바뀐 병원만 반영한 새 색인 반환 (변경되지 않은 셀은 공유, 기존 색인은 그대로)
+    """
+
+    def __init__(self, hospitals: Iterable = (), cell_size: float = 0.05):
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, Set[int]] = {}
+        self._points: Dict[int, Tuple[float, float]] = {}
+        self._bounds: Optional[Tuple[int, int, int, int]] = None  # 셀 범위 (nearest용, 지연 계산)
+        for hospital in hospitals:
+            self._add(hospital.hospital_id, hospital.latitude, hospital.longitude)
+
+    def __len__(self):
+        return len(self._points)
+
+    def updated(self, hospitals: Iterable) -> 'HospitalSpatialIndex':
+        """새 병원 목록과의 차이(추가/삭제/좌표 변경)만 반영한 새 색인"""
+        current = {}
+        for hospital in hospitals:
+            if hospital.latitude is not None and hospital.longitude is not None:
+                current[hospital.hospital_id] = (hospital.latitude, hospital.longitude)
+
+        index = HospitalSpatialIndex(cell_size=self.cell_size)
+        index._cells = dict(self._cells)
+        index._points = dict(self._points)
+        copied: Set[Cell] = set()
+
+        for hospital_id, point in self._points.items():
+            if current.get(hospital_id) != point:
+                index._remove(hospital_id, copied)
+        for hospital_id, point in current.items():
+            if hospital_id not in index._points:
+                index._add(hospital_id, point[0], point[1], copied)
+        return index
+
+    def within(self, lat: float, lng: float, radius_km: float,
+               limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """반경(km) 안의 (병원 ID, 거리 km) 목록을 가까운 순으로 반환"""
+        lat_span = radius_km / KM_PER_DEGREE_LAT
+        lng_span = radius_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 0.01))
+        ids = self._ids_in_box(lat - lat_span, lng - lng_span, lat + lat_span, lng + lng_span)
+        if not ids:
+            return []
+
+        points = np.array([self._points[hospital_id] for hospital_id in ids])
+        distances = haversine_km(lat, lng, points[:, 0], points[:, 1])
+        hits = np.flatnonzero(distances <= radius_km)
+        order = hits[np.lexsort((np.asarray(ids)[hits], distances[hits]))]
+        if limit:
+            order = order[:limit]
+        return [(ids[i], float(distances[i])) for i in order]
+
+    def in_box(self, min_lat: float, min_lng: float, max_lat: float, max_lng: float) -> List[int]:
+        """위경도 사각형 안의 병원 ID 목록 (사각형을 덮는 셀의 후보만 확인, ID 순)"""
+        points = self._points
+        return sorted(
+            hospital_id for hospital_id in self._ids_in_box(min_lat, min_lng, max_lat, max_lng)
+            if min_lat <= points[hospital_id][0] <= max_lat and min_lng <= points[hospital_id][1] <= max_lng
+        )
+
+    def nearest(self, lat: float, lng: float, k: int,
+                accept: Optional[Callable[[int], bool]] = None) -> List[Tuple[int, float]]:
+        """
+        가장 가까운 k개 (병원 ID, 거리 km)를 가까운 순으로 반환
+
+        - 고리는 병원이 있는 셀 범위(_bounds) 안으로 잘라서 확인
+        - 중심이 범위 밖이거나, 확인한 셀 수가 병원이 있는 셀 수를 넘으면 (필터에 맞는 병원이 드문 경우)
+          고리를 더 넓히지 않고 전체 좌표를 한 번에 거리 계산
+
+        Args:
+            accept: 병원 ID를 받아 후보 여부를 돌려주는 필터 (종별, 병상수 등)
+        """
+        if k <= 0 or not self._cells:
+            return []
+        if self._bounds is None:
+            rows = [row for row, _ in self._cells]
+            cols = [col for _, col in self._cells]
+            self._bounds = (min(rows), max(rows), min(cols), max(cols))
+        min_row, max_row, min_col, max_col = self._bounds
+        center_row, center_col = self._cell(lat, lng)
+        if not (min_row <= center_row <= max_row and min_col <= center_col <= max_col):
+            return self._nearest_scan(lat, lng, k, accept)
+        cos_lat = math.cos(math.radians(lat))
+        # 이 고리까지 확인하면 범위 전체를 덮음
+        last_ring = max(center_row - min_row, max_row - center_row, center_col - min_col, max_col - center_col)
+
+        ids: List[int] = []
+        dists: List[float] = []
+        for ring in range(last_ring + 1):
+            ring_ids = [hospital_id
+                        for cell in self._ring_cells(center_row, center_col, ring, self._bounds)
+                        for hospital_id in self._cells.get(cell, ())
+                        if accept is None or accept(hospital_id)]
+            if ring_ids:
+                points = np.array([self._points[hospital_id] for hospital_id in ring_ids])
+                ids.extend(ring_ids)
+                dists.extend(haversine_km(lat, lng, points[:, 0], points[:, 1]).tolist())
+
+            if len(ids) >= k:
+                # 아직 보지 않은 셀까지의 최소 거리보다 k번째 거리가 가까우면 확정
+                kth = sorted(dists)[k - 1]
+                if kth <= self._ring_clearance(lat, lng, center_row, center_col, ring, cos_lat):
+                    break
+            scanned = ((min(center_row + ring, max_row) - max(center_row - ring, min_row) + 1)
+                       * (min(center_col + ring, max_col) - max(center_col - ring, min_col) + 1))
+            if ring < last_ring and scanned > len(self._cells):
+                return self._nearest_scan(lat, lng, k, accept)
+
+        order = sorted(range(len(ids)), key=lambda i: (dists[i], ids[i]))[:k]
+        return [(ids[i], dists[i]) for i in order]
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _cell(self, lat: float, lng: float) -> Cell:
+        return (math.floor(lat / self.cell_size), math.floor(lng / self.cell_size))
+
+    @staticmethod
+    def _ring_cells(center_row: int, center_col: int, ring: int, bounds: Tuple[int, int, int, int]):
+        """중심 셀에서 체비셰프 거리가 정확히 ring인 셀들 (bounds 셀 범위 안만)"""
+        min_row, max_row, min_col, max_col = bounds
+        if ring == 0:
+            yield (center_row, center_col)
+            return
+        col_lo, col_hi = max(center_col - ring, min_col), min(center_col + ring, max_col)
+        for row in (center_row - ring, center_row + ring):
+            if min_row <= row <= max_row:
+                for col in range(col_lo, col_hi + 1):
+                    yield (row, col)
+        row_lo, row_hi = max(center_row - ring + 1, min_row), min(center_row + ring - 1, max_row)
+        for col in (center_col - ring, center_col + ring):
+            if min_col <= col <= max_col:
+                for row in range(row_lo, row_hi + 1):
+                    yield (row, col)
+
+    def _nearest_scan(self, lat: float, lng: float, k: int,
+                      accept: Optional[Callable[[int], bool]]) -> List[Tuple[int, float]]:
+        """전체 좌표를 한 번에 거리 계산한 k-최근접 (격자 탐색이 비효율적인 경우)"""
+        ids = [hospital_id for hospital_id in self._points if accept is None or accept(hospital_id)]
+        if not ids:
+            return []
+        points = np.array([self._points[hospital_id] for hospital_id in ids])
+        distances = haversine_km(lat, lng, points[:, 0], points[:, 1])
+        order = np.lexsort((np.asarray(ids), distances))[:k]
+        return [(ids[i], float(distances[i])) for i in order]
+
+    def _ring_clearance(self, lat: float, lng: float, center_row: int, center_col: int,
+                        ring: int, cos_lat: float) -> float:
+        """ring까지 확인한 셀 범위 밖의 점까지 최소 거리 (km, 보수적 추정)"""
+        size = self.cell_size
+        lat_gap = min(lat - (center_row - ring) * size, (center_row + ring + 1) * size - lat)
+        lng_gap = min(lng - (center_col - ring) * size, (center_col + ring + 1) * size - lng)
+        # 범위 가장자리 위도에서 경도 1도가 가장 짧으므로 그 값을 사용
+        edge_lat = min(abs(lat) + lat_gap, 89.0)
+        lng_km = lng_gap * KM_PER_DEGREE_LAT * min(cos_lat, math.cos(math.radians(edge_lat)))
+        # 구면 거리는 평면 근사보다 약간 짧을 수 있어 여유를 둠
+        return min(lat_gap * KM_PER_DEGREE_LAT, lng_km) * 0.99
+
+    def _ids_in_box(self, min_lat: float, min_lng: float,
+                    max_lat: float, max_lng: float) -> List[int]:
+        min_row, min_col = self._cell(min_lat, min_lng)
+        max_row, max_col = self._cell(max_lat, max_lng)
+        ids: List[int] = []
+        if (max_row - min_row + 1) * (max_col - min_col + 1) > len(self._cells):
+            # 반경이 매우 크면 셀을 모두 훑는 편이 빠름
+            for (row, col), members in self._cells.items():
+                if min_row <= row <= max_row and min_col <= col <= max_col:
+                    ids.extend(members)
+            return ids
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                members = self._cells.get((row, col))
+                if members:
+                    ids.extend(members)
+        return ids
+
+    def _add(self, hospital_id: int, lat: Optional[float], lng: Optional[float],
+             copied: Optional[Set[Cell]] = None) -> None:
+        if lat is None or lng is None:
+            return
+        cell = self._cell(lat, lng)
+        members = self._cells.get(cell)
+        if members is None:
+            members = self._cells[cell] = set()
+            if copied is not None:
+                copied.add(cell)
+        elif copied is not None and cell not in copied:
+            # 이전 색인과 공유 중인 셀은 복사한 뒤 수정 (copy-on-write)
+            members = self._cells[cell] = set(members)
+            copied.add(cell)
+        members.add(hospital_id)
+        self._points[hospital_id] = (lat, lng)
+
+    def _remove(self, hospital_id: int, copied: Set[Cell]) -> None:
+        lat, lng = self._points.pop(hospital_id)
+        cell = self._cell(lat, lng)
+        members = self._cells[cell]
+        if cell not in copied:
+            members = self._cells[cell] = set(members)
+            copied.add(cell)
+        members.discard(hospital_id)
+        if not members:
+            del self._cells[cell]
+            copied.discard(cell)
@@ -0,0 +1,83 @@
+"""
+Hospital Store
+병원 스냅샷의 직렬화 캐시 (행 JSON 조각 + 필터용 열 배열)
+"""
+
+import json
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def _encode_categories(values: Iterable[Optional[str]]) -> Tuple[List[str], np.ndarray]:
+    """문자열 열을 (카테고리 목록, 코드 배열)로 변환 - 같은 문자열은 한 번만 저장(intern)"""
+    categories: List[str] = []
+    index: Dict[str, int] = {}
+    codes = []
+    for value in values:
+        key = sys.intern(value or '')
+        code = index.get(key)
+        if code is None:
+            code = index[key] = len(categories)
+            categories.append(key)
+        codes.append(code)
+    return categories, np.asarray(codes, dtype=np.uint16)
+
+
+class HospitalStore:
+    """
+    병원 스냅샷의 직렬화 캐시
+
+    Hospital 객체는 스냅샷이 그대로 보관하고, 이 캐시는 그 위에 추가로 만드는 구조다.
+
+    - 각 행의 JSON 조각을 스냅샷마다 한 번만 직렬화해 두고 응답 시 이어 붙임
+    - 종별/병상수 필터를 객체 순회 없이 처리하도록 id, 병상수, 종별 코드만 NumPy 배열로 보관
+    """
+
+    def __init__(self, hospitals: Sequence):
+        count = len(hospitals)
+        self.ids = np.fromiter((h.hospital_id for h in hospitals), dtype=np.int64, count=count)
+        self.bed_count = np.fromiter((h.bed_count or 0 for h in hospitals), dtype=np.int32, count=count)
+        self.type_names, self.type_codes = _encode_categories(h.hospital_type for h in hospitals)
+
+        self._positions = {int(hospital_id): i for i, hospital_id in enumerate(self.ids)}
+        self._row_json = [json.dumps(h.to_dict(), ensure_ascii=False) for h in hospitals]
+        self._all_json: Optional[str] = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def position(self, hospital_id: int) -> Optional[int]:
+        """병원 ID의 행 위치"""
+        return self._positions.get(hospital_id)
+
+    def matches(self, hospital_type: Optional[str] = None, min_beds: Optional[int] = None) -> np.ndarray:
+        """조건에 맞는 행 마스크 (행 위치 순)"""
+        mask = np.ones(len(self.ids), dtype=bool)
+        if hospital_type:
+            if hospital_type not in self.type_names:
+                return np.zeros(len(self.ids), dtype=bool)
+            mask &= self.type_codes == self.type_names.index(hospital_type)
+        if min_beds:
+            mask &= self.bed_count >= min_beds
+        return mask
+
+    def filter(self, hospital_type: Optional[str] = None, min_beds: Optional[int] = None) -> np.ndarray:
+        """
+        조건에 맞는 행 위치 배열 (벡터 연산)
+
+        Args:
+            hospital_type: 종별
+            min_beds: 최소 병상수
+        """
+        return np.flatnonzero(self.matches(hospital_type, min_beds))
+
+    def to_json(self, positions: Optional[Iterable[int]] = None) -> str:
+        """행 위치(없으면 전체)를 JSON 배열 문자열로 직렬화"""
+        if positions is None:
+            if self._all_json is None:
+                self._all_json = '[' + ','.join(self._row_json) + ']'
+            return self._all_json
+        row_json = self._row_json
+        return '[' + ','.join(row_json[i] for i in positions) + ']'
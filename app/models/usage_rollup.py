@@ -0,0 +1,114 @@
+"""
+Usage Rollup
+위탁병원 이용인원의 연월/광역지자체 합계 셀과 상위 단위 롤업 ((연도, 월), (연도, 광역지자체), 광역지자체, 연도)
+"""
+
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Cell = Tuple[int, int, str]  # (연도, 월, 광역지자체)
+Period = Tuple[int, int]     # (연도, 월)
+
+# 롤업 단위 -> 셀 키에서 그 단위의 키를 만드는 함수
+LEVELS = {
+    'month': lambda year, month, region: (year, month),
+    'year_region': lambda year, month, region: (year, region),
+    'region': lambda year, month, region: (region,),
+    'year': lambda year, month, region: (year,),
+}
+
+
+class UsageRollup:
+    """
+    이용인원 롤업
+
+    - 셀: (연도, 월, 광역지자체) -> [인원 합계, 원본 행 수]
+    - 상위 단위 합계를 셀과 함께 유지하므로 차트/통계는 원본 행이나 셀을 다시 묶지 않고 바로 읽음
+    - replaced(): 일부 연월의 셀만 바꾼 새 롤업 (바뀐 셀만 상위 합계에서 빼고 더함, 기존 롤업은 그대로)
+    - fingerprint: 셀 내용 해시 (내용이 같으면 같은 값)
+    """
+
+    def __init__(self, rows: Iterable[Tuple] = ()):
+        self._cells: Dict[Cell, List] = {}
+        self._levels: Dict[str, Dict[tuple, List]] = {level: {} for level in LEVELS}
+        for year, month, region, people, count in rows:
+            self._apply((int(year), int(month), region), float(people), int(count), 1)
+        self.fingerprint = self._digest()
+
+    def __len__(self):
+        return len(self._cells)
+
+    def replaced(self, periods: Iterable[Period], rows: Iterable[Tuple]) -> 'UsageRollup':
+        """
+        periods 연월의 셀을 rows로 교체한 새 롤업
+
+        Args:
+            periods: 교체할 연월 (rows에 없는 연월의 셀은 삭제)
+            rows: (연도, 월, 광역지자체, 인원, 행 수) - periods 안의 연월만
+        """
+        periods = {(int(year), int(month)) for year, month in periods}
+        rollup = UsageRollup.__new__(UsageRollup)
+        rollup._cells = {cell: list(value) for cell, value in self._cells.items()}
+        rollup._levels = {level: {key: list(value) for key, value in totals.items()}
+                          for level, totals in self._levels.items()}
+        for cell in [cell for cell in rollup._cells if cell[:2] in periods]:
+            people, count = rollup._cells[cell]
+            rollup._apply(cell, people, count, -1)
+        for year, month, region, people, count in rows:
+            if (int(year), int(month)) in periods:
+                rollup._apply((int(year), int(month), region), float(people), int(count), 1)
+        rollup.fingerprint = rollup._digest()
+        return rollup
+
+    @property
+    def periods(self) -> List[Period]:
+        """데이터가 있는 연월 (오래된 순)"""
+        return sorted(self._levels['month'])
+
+    @property
+    def latest(self) -> Optional[Period]:
+        """가장 최근 연월"""
+        months = self._levels['month']
+        return max(months) if months else None
+
+    def rows(self) -> List[Tuple[int, int, str, float, int]]:
+        """(연도, 월, 광역지자체, 인원, 행 수) 셀 목록 (연도/월/광역지자체 순)"""
+        return [cell + tuple(value) for cell, value in sorted(self._cells.items())]
+
+    def monthly(self) -> List[Tuple[int, int, float, int]]:
+        """(연도, 월, 인원, 행 수) 연월별 합계"""
+        return self._level('month')
+
+    def year_regions(self) -> List[Tuple[int, str, float, int]]:
+        """(연도, 광역지자체, 인원, 행 수) 연도/광역지자체별 합계"""
+        return self._level('year_region')
+
+    def regions(self) -> List[Tuple[str, float, int]]:
+        """(광역지자체, 인원, 행 수) 전체 기간 광역지자체별 합계 (이름 순)"""
+        return self._level('region')
+
+    def years(self) -> List[Tuple[int, float, int]]:
+        """(연도, 인원, 행 수) 연도별 합계"""
+        return self._level('year')
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _level(self, level: str) -> List[tuple]:
+        return [key + tuple(value) for key, value in sorted(self._levels[level].items())]
+
+    def _apply(self, cell: Cell, people: float, count: int, sign: int) -> None:
+        """셀 하나와 모든 상위 합계에 값을 더하거나(1) 뺌(-1), 행 수가 0이 되면 삭제"""
+        for totals, key in [(self._cells, cell)] + [
+                (self._levels[level], make_key(*cell)) for level, make_key in LEVELS.items()]:
+            entry = totals.setdefault(key, [0.0, 0])
+            entry[0] += sign * people
+            entry[1] += sign * count
+            if entry[1] <= 0:
+                del totals[key]
+
+    def _digest(self) -> str:
+        payload = json.dumps(self.rows(), ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
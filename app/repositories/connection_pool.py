@@ -0,0 +1,329 @@
+"""
+MySQL Connection Pool
+모든 리포지토리와 컨트롤러가 공유하는 애플리케이션 범위 MySQL 커넥션 풀
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Mapping, Optional
+
+import pymysql
+
+
+class PoolTimeoutError(Exception):
+    """풀에서 커넥션을 기다리다 시간이 초과된 경우"""
+
+
+class ConnectionPool:
+    """
+    스레드 안전한 pymysql 커넥션 풀
+
+    - min_size/max_size: 유지할 최소 커넥션 수와 동시에 열 수 있는 최대 커넥션 수
+    - 대여 시 헬스 체크(ping): 마지막 사용 후 ping_interval 초가 지난 커넥션만 확인
+    - 유휴 재연결: idle_timeout 초 이상 쉬었던 커넥션은 닫고 새로 연결
+    - 스레드별 대여: 같은 스레드에서 중첩 대여하면 같은 커넥션을 재사용
+    """
+
+    def __init__(self, connect_kwargs: Dict[str, Any], min_size: int = 1,
+                 max_size: int = 8, idle_timeout: float = 300,
+                 wait_timeout: float = 30, ping_interval: float = 5,
+                 connect=None):
+        if max_size < 1:
+            raise ValueError('max_size는 1 이상이어야 합니다')
+        self.connect_kwargs = dict(connect_kwargs)
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.wait_timeout = wait_timeout
+        self.ping_interval = ping_interval
+        self._connect = connect or pymysql.connect
+
+        self._idle = []  # (connection, last_used) 스택 - 최근 사용한 커넥션부터 재사용
+        self._size = 0   # 열려 있는 전체 커넥션 수 (유휴 + 대여 중)
+        self._closed = False
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._counters = {
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'reconnects': 0,
+            'created': 0,
+            'discarded': 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    @contextmanager
+    def connection(self):
+        """커넥션을 대여하고 블록이 끝나면 풀에 반납하는 컨텍스트 매니저"""
+        conn = self.acquire()
+        try:
+            yield conn
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+            # 끊긴 커넥션은 풀로 돌려보내지 않음
+            self._local.broken = True
+            raise
+        finally:
+            self.release(conn)
+
+    def acquire(self):
+        """현재 스레드용 커넥션 대여 (중첩 대여 시 같은 커넥션 반환)"""
+        local = self._local
+        if getattr(local, 'conn', None) is not None:
+            local.depth += 1
+            return local.conn
+
+        conn = self._checkout()
+        local.conn = conn
+        local.depth = 1
+        local.broken = False
+        return conn
+
+    def release(self, conn) -> None:
+        """커넥션 반납 (가장 바깥쪽 대여가 끝날 때 실제로 풀에 돌려놓음)"""
+        local = self._local
+        if getattr(local, 'conn', None) is not conn:
+            self._checkin(conn, discard=True)
+            return
+
+        local.depth -= 1
+        if local.depth > 0:
+            return
+
+        broken = getattr(local, 'broken', False)
+        local.conn = None
+        local.broken = False
+        self._checkin(conn, discard=broken)
+
+    def fill(self) -> None:
+        """min_size만큼 유휴 커넥션을 미리 열어둠 (실패해도 예외를 올리지 않음)"""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                conn = self._open()
+            except Exception as e:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                print(f"커넥션 풀 초기화 오류: {e}")
+                return
+            with self._cond:
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태와 누적 카운터"""
+        with self._cond:
+            idle = len(self._idle)
+            result = dict(self._counters)
+            result.update({
+                'size': self._size,
+                'idle': idle,
+                'in_use': self._size - idle,
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+            })
+            return result
+
+    def close(self) -> None:
+        """유휴 커넥션을 모두 닫고 풀을 종료 (대여 중인 커넥션은 반납 시 닫힘)"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _open(self):
+        conn = self._connect(**self.connect_kwargs)
+        with self._cond:
+            self._counters['created'] += 1
+        return conn
+
+    def _checkout(self):
+        deadline = time.monotonic() + self.wait_timeout
+        conn, last_used = None, None
+        with self._cond:
+            waited = False
+            while True:
+                if self._closed:
+                    raise PoolTimeoutError('커넥션 풀이 종료되었습니다')
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                if not waited:
+                    self._counters['waits'] += 1
+                    waited = True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters['timeouts'] += 1
+                    raise PoolTimeoutError(
+                        f'{self.wait_timeout}초 동안 사용 가능한 커넥션이 없습니다 '
+                        f'(max_size={self.max_size})'
+                    )
+                self._cond.wait(remaining)
+            self._counters['checkouts'] += 1
+
+        try:
+            if conn is None:
+                return self._open()
+            return self._validate(conn, last_used)
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def _validate(self, conn, last_used: float):
+        """대여 직전 헬스 체크 및 유휴 재연결"""
+        idle_for = time.monotonic() - last_used
+        if self.idle_timeout and idle_for >= self.idle_timeout:
+            return self._reconnect(conn)
+        if idle_for >= self.ping_interval:
+            try:
+                conn.ping(reconnect=False)
+            except Exception:
+                return self._reconnect(conn)
+        return conn
+
+    def _reconnect(self, conn):
+        self._close_quietly(conn)
+        new_conn = self._open()
+        with self._cond:
+            self._counters['reconnects'] += 1
+        return new_conn
+
+    def _checkin(self, conn, discard: bool = False) -> None:
+        if not discard:
+            try:
+                # 읽기 트랜잭션 스냅샷이 다음 대여자에게 남지 않도록 정리
+                conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._cond:
+            if discard or self._closed or not getattr(conn, 'open', True):
+                self._size -= 1
+                self._counters['discarded'] += 1
+                close_conn = True
+            else:
+                self._idle.append((conn, time.monotonic()))
+                close_conn = False
+            self._cond.notify()
+
+        if close_conn:
+            self._close_quietly(conn)
+
+    @staticmethod
+    def _close_quietly(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+# ----------------------------------------------------------------------
+# 애플리케이션 범위 싱글톤
+# ----------------------------------------------------------------------
+_pool: Optional[ConnectionPool] = None
+_pool_settings: Optional[Dict[str, Any]] = None
+_pool_lock = threading.Lock()
+
+
+def _env_settings() -> Dict[str, Any]:
+    """환경 변수 기반 기본 설정 (앱 밖의 스크립트에서도 동일하게 사용)"""
+    return {
+        'MYSQL_HOST': os.environ.get('MYSQL_HOST') or '121.157.160.22',
+        'MYSQL_PORT': int(os.environ.get('MYSQL_PORT') or 3306),
+        'MYSQL_USER': os.environ.get('MYSQL_USER') or 'root',
+        'MYSQL_PASSWORD': os.environ.get('MYSQL_PASSWORD') or 'zzaaqq',
+        'MYSQL_DATABASE': os.environ.get('MYSQL_DATABASE') or 'testdb',
+        'MYSQL_CONNECT_TIMEOUT': int(os.environ.get('MYSQL_CONNECT_TIMEOUT') or 30),
+        'MYSQL_POOL_MIN_SIZE': int(os.environ.get('MYSQL_POOL_MIN_SIZE') or 1),
+        'MYSQL_POOL_MAX_SIZE': int(os.environ.get('MYSQL_POOL_MAX_SIZE') or 8),
+        'MYSQL_POOL_IDLE_TIMEOUT': float(os.environ.get('MYSQL_POOL_IDLE_TIMEOUT') or 300),
+        'MYSQL_POOL_WAIT_TIMEOUT': float(os.environ.get('MYSQL_POOL_WAIT_TIMEOUT') or 30),
+        'MYSQL_POOL_PING_INTERVAL': float(os.environ.get('MYSQL_POOL_PING_INTERVAL') or 5),
+    }
+
+
+def _create_pool(settings: Dict[str, Any]) -> ConnectionPool:
+    return ConnectionPool(
+        connect_kwargs={
+            'host': settings['MYSQL_HOST'],
+            'port': int(settings['MYSQL_PORT']),
+            'user': settings['MYSQL_USER'],
+            'password': settings['MYSQL_PASSWORD'],
+            'database': settings['MYSQL_DATABASE'],
+            'charset': 'utf8mb4',
+            'cursorclass': pymysql.cursors.DictCursor,
+            'connect_timeout': int(settings['MYSQL_CONNECT_TIMEOUT']),
+        },
+        min_size=int(settings['MYSQL_POOL_MIN_SIZE']),
+        max_size=int(settings['MYSQL_POOL_MAX_SIZE']),
+        idle_timeout=float(settings['MYSQL_POOL_IDLE_TIMEOUT']),
+        wait_timeout=float(settings['MYSQL_POOL_WAIT_TIMEOUT']),
+        ping_interval=float(settings['MYSQL_POOL_PING_INTERVAL']),
+    )
+
+
+def configure_pool(config: Optional[Mapping[str, Any]] = None) -> None:
+    """
+    앱 설정(app.config)으로 공유 풀 설정
+
+    설정 값이 바뀐 경우에만 기존 풀을 닫고 다음 대여 때 새 풀을 생성한다.
+    """
+    global _pool, _pool_settings
+    settings = _env_settings()
+    if config:
+        settings.update({key: config[key] for key in settings if key in config})
+
+    with _pool_lock:
+        if settings == _pool_settings:
+            return
+        old_pool = _pool
+        _pool, _pool_settings = None, settings
+
+    if old_pool is not None:
+        old_pool.close()
+
+
+def get_pool() -> ConnectionPool:
+    """공유 커넥션 풀 반환 (처음 호출될 때 생성)"""
+    global _pool, _pool_settings
+    pool = _pool
+    if pool is not None:
+        return pool
+
+    with _pool_lock:
+        if _pool is None:
+            if _pool_settings is None:
+                _pool_settings = _env_settings()
+            _pool = _create_pool(_pool_settings)
+            created = True
+        else:
+            created = False
+        pool = _pool
+
+    if created:
+        pool.fill()
+    return pool
+
+
+def get_connection():
+    """공유 풀에서 커넥션을 대여하는 컨텍스트 매니저"""
+    return get_pool().connection()
@@ -0,0 +1,275 @@
+"""
+Hospital Snapshot Cache
+위탁병원현황 전체 데이터를 메모리에 보관하는 버전 관리 스냅샷 캐시
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from ..models.hospital import Hospital
+from ..models.hospital_cluster_index import HospitalClusterIndex
+from ..models.hospital_region_index import HospitalRegionIndex
+from ..models.hospital_search_index import HospitalSearchIndex
+from ..models.hospital_spatial_index import HospitalSpatialIndex
+from ..models.hospital_store import HospitalStore
+
+
+class HospitalSnapshot:
+    """한 시점의 위탁병원현황 데이터 (읽기 전용으로 공유)"""
+
+    # 이전 스냅샷의 구조를 바뀐 부분만 반영해 이어받을 수 있는 파생 구조
+    # (이름 -> (이전 구조, 새 스냅샷) -> 새 구조)
+    INCREMENTAL_BUILDERS: Dict[str, Callable[[Any, 'HospitalSnapshot'], Any]] = {
+        'spatial_index': lambda index, snapshot: index.updated(snapshot.hospitals),
+        'region_index': lambda index, snapshot: index.updated(snapshot.hospitals),
+        'cluster_index': lambda index, snapshot: index.updated(snapshot.hospitals),
+    }
+
+    def __init__(self, hospitals: List[Hospital], version: int,
+                 fingerprint: str, loaded_at: float):
+        self.hospitals = tuple(hospitals)
+        self.by_id = {hospital.hospital_id: hospital for hospital in self.hospitals}
+        self.version = version          # 데이터 내용이 바뀔 때마다 1씩 증가
+        self.fingerprint = fingerprint  # 전체 행 내용의 해시
+        self.loaded_at = loaded_at
+        self._derived: Dict[str, Any] = {}
+        # 파생 구조가 다른 파생 구조로 만들어질 수 있으므로 (지역 색인 -> 통계) 재진입 가능한 잠금
+        self._derived_lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.hospitals)
+
+    def derived(self, name: str, builder: Callable[['HospitalSnapshot'], Any]) -> Any:
+        """스냅샷에서 파생된 인덱스/구조를 한 번만 만들어 재사용"""
+        try:
+            return self._derived[name]
+        except KeyError:
+            pass
+        with self._derived_lock:
+            if name not in self._derived:
+                self._derived[name] = builder(self)
+            return self._derived[name]
+
+    def carry_over(self, previous: 'HospitalSnapshot') -> None:
+        """이전 스냅샷에서 이미 만든 파생 구조를 증분 갱신해 이어받음"""
+        for name, update in self.INCREMENTAL_BUILDERS.items():
+            old = previous._derived.get(name)
+            if old is not None and name not in self._derived:
+                self._derived[name] = update(old, self)
+
+    @property
+    def store(self) -> HospitalStore:
+        """직렬화 캐시 (행 JSON 조각, 종별/병상수 필터)"""
+        return self.derived('store', lambda snapshot: HospitalStore(snapshot.hospitals))
+
+    @property
+    def search_index(self) -> HospitalSearchIndex:
+        """병원 검색용 bigram 역색인"""
+        return self.derived('search_index', lambda snapshot: HospitalSearchIndex(snapshot.hospitals))
+
+    @property
+    def spatial_index(self) -> HospitalSpatialIndex:
+        """반경 검색용 격자 공간 색인"""
+        return self.derived('spatial_index', lambda snapshot: HospitalSpatialIndex(snapshot.hospitals))
+
+    @property
+    def cluster_index(self) -> HospitalClusterIndex:
+        """줌 레벨별 좌표 클러스터 색인"""
+        return self.derived('cluster_index', lambda snapshot: HospitalClusterIndex(snapshot.hospitals))
+
+    @property
+    def region_index(self) -> HospitalRegionIndex:
+        """시도/시군구별 병원 ID 색인"""
+        return self.derived('region_index', lambda snapshot: HospitalRegionIndex(snapshot.hospitals))
+
+    def in_region(self, region: str) -> List[Hospital]:
+        """지역(시도, '시도 시군구', 시군구)에 속한 병원 (빈 문자열이면 전체)"""
+        if not region:
+            return list(self.hospitals)
+        by_id = self.by_id
+        return [by_id[hospital_id] for hospital_id in self.region_index.ids(region)]
+
+
+EMPTY_SNAPSHOT = HospitalSnapshot([], 0, '', 0.0)
+
+
+class HospitalSnapshotCache:
+    """
+    위탁병원현황 스냅샷 캐시
+
+    - 데이터 버전: 새로 읽은 데이터의 fingerprint가 바뀌었을 때만 version 증가
+    - 쓰기 무효화: invalidate() 호출 시 스냅샷을 stale로 표시하고 재조회 시작
+    - stale-while-revalidate: 만료/무효화된 스냅샷을 즉시 반환하고 백그라운드에서 갱신
+    - single-flight: 동시에 몇 건의 요청이 와도 DB 재조회는 한 번만 수행
+    """
+
+    def __init__(self, loader: Optional[Callable[[], Tuple[List[Hospital], str]]] = None,
+                 ttl: float = 300.0, stale_while_revalidate: bool = True):
+        self._loader = loader or _default_loader
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+
+        self._lock = threading.Lock()
+        self._snapshot: Optional[HospitalSnapshot] = None
+        self._stale = True
+        self._expires_at = 0.0
+        self._generation = 0           # invalidate() 호출 횟수
+        self._refreshing: Optional[threading.Event] = None
+        self._counters = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'refreshes': 0,
+            'refresh_errors': 0,
+            'invalidations': 0,
+        }
+
+    @property
+    def data_version(self) -> int:
+        """현재 스냅샷의 데이터 버전 (아직 읽지 않았으면 0)"""
+        snapshot = self._snapshot
+        return snapshot.version if snapshot else 0
+
+    def get(self, allow_stale: bool = True) -> HospitalSnapshot:
+        """
+        현재 스냅샷 반환 (필요하면 갱신)
+
+        allow_stale=False면 무효화/만료된 스냅샷 대신 갱신이 끝날 때까지 기다림
+        (방금 쓴 데이터를 바로 읽어야 하는 CRUD 화면용)
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and not self._is_expired():
+                self._counters['hits'] += 1
+                return snapshot
+
+            if snapshot is not None and self.stale_while_revalidate and allow_stale:
+                self._counters['stale_hits'] += 1
+                self._start_background_refresh()
+                return snapshot
+
+            self._counters['misses'] += 1
+            event, leader = self._begin_refresh()
+
+        if leader:
+            self._refresh(event)
+        else:
+            event.wait()
+
+        with self._lock:
+            return self._snapshot or EMPTY_SNAPSHOT
+
+    def invalidate(self) -> None:
+        """데이터 변경 알림 - 스냅샷을 stale로 표시하고 재조회 시작"""
+        with self._lock:
+            self._generation += 1
+            self._counters['invalidations'] += 1
+            self._stale = True
+            if self._snapshot is not None and self.stale_while_revalidate:
+                self._start_background_refresh()
+
+    def refresh(self) -> HospitalSnapshot:
+        """즉시 재조회 (진행 중인 갱신이 있으면 그 결과를 기다림)"""
+        with self._lock:
+            event, leader = self._begin_refresh()
+        if leader:
+            self._refresh(event)
+        else:
+            event.wait()
+        with self._lock:
+            return self._snapshot or EMPTY_SNAPSHOT
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태와 누적 카운터"""
+        with self._lock:
+            snapshot = self._snapshot
+            result = dict(self._counters)
+            result.update({
+                'data_version': snapshot.version if snapshot else 0,
+                'fingerprint': snapshot.fingerprint if snapshot else '',
+                'row_count': len(snapshot) if snapshot else 0,
+                'loaded_at': snapshot.loaded_at if snapshot else None,
+                'stale': self._is_expired(),
+                'refreshing': self._refreshing is not None,
+            })
+            return result
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _is_expired(self) -> bool:
+        return self._stale or time.monotonic() >= self._expires_at
+
+    def _begin_refresh(self) -> Tuple[threading.Event, bool]:
+        if self._refreshing is not None:
+            return self._refreshing, False
+        self._refreshing = threading.Event()
+        return self._refreshing, True
+
+    def _start_background_refresh(self) -> None:
+        event, leader = self._begin_refresh()
+        if leader:
+            threading.Thread(target=self._refresh, args=(event,),
+                             name='hospital-cache-refresh', daemon=True).start()
+
+    def _refresh(self, event: threading.Event) -> None:
+        with self._lock:
+            generation = self._generation
+        try:
+            hospitals, fingerprint = self._loader()
+            with self._lock:
+                previous = self._snapshot
+                if previous is not None and previous.fingerprint == fingerprint:
+                    # 내용이 같으면 기존 스냅샷(버전) 유지
+                    snapshot = previous
+                else:
+                    version = previous.version + 1 if previous else 1
+                    snapshot = HospitalSnapshot(hospitals, version, fingerprint, time.time())
+            if snapshot is not previous and previous is not None:
+                # 공간 색인 등은 락 밖에서 바뀐 행만 반영해 미리 만들어 둠
+                snapshot.carry_over(previous)
+            with self._lock:
+                self._snapshot = snapshot
+                # 조회 중에 다시 무효화되었다면 여전히 stale
+                self._stale = self._generation != generation
+                self._expires_at = time.monotonic() + self.ttl
+                self._counters['refreshes'] += 1
+        except Exception as e:
+            print(f"병원 스냅샷 갱신 오류: {e}")
+            with self._lock:
+                self._counters['refresh_errors'] += 1
+        finally:
+            with self._lock:
+                self._refreshing = None
+            event.set()
+
+
+def _default_loader() -> Tuple[List[Hospital], str]:
+    from .testdb_hospital_repository import TestDBHospitalRepository
+    return TestDBHospitalRepository(cache=False).load_hospitals()
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# 애플리케이션 공유 캐시
+hospital_cache = HospitalSnapshotCache(
+    ttl=float(os.environ.get('HOSPITAL_CACHE_TTL') or 300),
+    stale_while_revalidate=_env_bool('HOSPITAL_CACHE_STALE_WHILE_REVALIDATE', True),
+)
+
+
+def configure_hospital_cache(config: Optional[Mapping[str, Any]] = None) -> None:
+    """앱 설정(app.config)으로 공유 캐시 설정"""
+    if not config:
+        return
+    if 'HOSPITAL_CACHE_TTL' in config:
+        hospital_cache.ttl = float(config['HOSPITAL_CACHE_TTL'])
+    if 'HOSPITAL_CACHE_STALE_WHILE_REVALIDATE' in config:
+        hospital_cache.stale_while_revalidate = bool(config['HOSPITAL_CACHE_STALE_WHILE_REVALIDATE'])
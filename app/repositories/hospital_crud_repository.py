@@ -3,71 +3,237 @@ Hospital CRUD Repository
 testdb.위탁병원현황 테이블에 직접 연결하는 CRUD 리포지토리
 """
 
-import pymysql
-from typing import List, Dict, Any, Optional
+import base64
+import json
+from typing import List, Dict, Any, Optional, Tuple
+from .connection_pool import ConnectionPool, get_pool
+from .hospital_cache import hospital_cache
 
 class HospitalCrudRepository:
-    def __init__(self):
-        self.connection_config = {
-            'host': 'localhost',
-            'user': 'root',
-            'password': 'zzaaqq',
-            'database': 'testdb',
-            'charset': 'utf8mb4',
-            'cursorclass': pymysql.cursors.DictCursor
-        }
+    def __init__(self, pool: Optional[ConnectionPool] = None, cache=hospital_cache):
+        # 지정하지 않으면 애플리케이션 공유 커넥션 풀 사용
+        self._pool = pool
+        # 쓰기 후 무효화할 병원 스냅샷 캐시
+        self._cache = cache
     
     def _get_connection(self):
-        """MySQL 연결 생성"""
-        return pymysql.connect(**self.connection_config)
+        """공유 커넥션 풀에서 MySQL 연결 대여"""
+        return (self._pool or get_pool()).connection()
+    
+    def invalidate_cache(self):
+        """쓰기 후 병원 스냅샷 캐시 무효화"""
+        if self._cache is not None:
+            self._cache.invalidate()
+    
+    # 정렬 가능한 컬럼 (ddl1.sql의 정렬용 인덱스와 맞춰 유지)
+    SORTABLE_COLUMNS = ('연번', '요양기관명', '시군구', '종별', '병상수', '진료과수')
+    # 검색어 관련도 순 정렬 (검색 색인 점수 기준)
+    RELEVANCE_SORT = 'relevance'
+    # 생성/수정 시 저장하는 컬럼 (연번 제외)
+    CRUD_COLUMNS = ('시군구', '요양기관명', '종별', '병상수', '진료과수',
+                    '전화번호', '주소', '상세주소', '경도', '위도')
+    BULK_OPERATIONS = ('create', 'update', 'delete')
+    
+    def _search_ranking(self, search: str, filter_type: str = '') -> List[Tuple[int, float]]:
+        """검색 색인으로 (연번, 점수) 목록을 관련도 순으로 조회 (종별 필터 적용)"""
+        # 방금 쓴 데이터가 검색되도록 무효화된 스냅샷은 갱신을 기다림
+        snapshot = self._cache.get(allow_stale=False)
+        ranking = snapshot.search_index.search_ids(search)
+        if filter_type:
+            store = snapshot.store
+            matching = store.matches(hospital_type=filter_type)
+            ranking = [item for item in ranking if matching[store.position(item[0])]]
+        return ranking
+    
+    def _uses_search_index(self, search: str) -> bool:
+        """검색어를 검색 색인으로 처리할지 여부 ('구'/'시'로 끝나면 시군구 일치 검색)"""
+        return bool(search) and not (search.endswith('구') or search.endswith('시'))
+    
+    def _build_filters(self, search: str = '', filter_type: str = '',
+                       ranking: Optional[List[Tuple[int, float]]] = None):
+        """검색어/종별 조건을 WHERE 절과 파라미터로 변환"""
+        query = ' WHERE 1=1'
+        params = []
+        
+        # 종별 필터링
+        if filter_type:
+            query += ' AND 종별 = %s'
+            params.append(filter_type)
+        
+        # 검색어 필터링 (요양기관명, 주소, 시군구, 상세주소, 전화번호)
+        if search:
+            # If search term ends with '구' or '시', treat as 시군구 exact match
+            if not self._uses_search_index(search):
+                query += ' AND 시군구 = %s'
+                params.append(search)
+            elif ranking is not None:
+                # 검색 색인에서 찾은 연번만 (LIKE '%검색어%' 전체 스캔 대신)
+                if ranking:
+                    query += f" AND 연번 IN ({', '.join(['%s'] * len(ranking))})"
+                    params.extend(hospital_id for hospital_id, _ in ranking)
+                else:
+                    query += ' AND 1=0'
+            else:
+                query += ' AND (요양기관명 LIKE %s OR 주소 LIKE %s OR 시군구 LIKE %s OR 상세주소 LIKE %s OR 전화번호 LIKE %s)'
+                search_param = f'%{search}%'
+                params.extend([search_param, search_param, search_param, search_param, search_param])
+        
+        return query, params
+    
+    def _prepare_search(self, search: str, filter_type: str, sort: str):
+        """검색 색인 조회 - 색인을 쓸 수 없으면 (None, 정렬)로 LIKE 검색에 맡김"""
+        ranking = None
+        if self._uses_search_index(search) and self._cache is not None:
+            try:
+                ranking = self._search_ranking(search, filter_type)
+            except Exception as e:
+                print(f"검색 색인 조회 오류: {e}")
+        if (sort or '').strip() == self.RELEVANCE_SORT and ranking is None:
+            # 검색어가 없거나 색인을 쓸 수 없으면 관련도 대신 연번 순
+            sort = '연번'
+        return ranking, sort
+    
+    def _parse_sort(self, sort: str):
+        """정렬 파라미터('병상수', '-병상수')를 (컬럼, 내림차순 여부)로 변환"""
+        sort = (sort or '연번').strip()
+        descending = sort.startswith('-')
+        column = sort.lstrip('-+')
+        if column not in self.SORTABLE_COLUMNS:
+            raise ValueError(f'정렬할 수 없는 컬럼입니다: {column}')
+        return column, descending
+    
+    def _select_ranked(self, ranking: List[Tuple[int, float]]) -> List[Dict[str, Any]]:
+        """관련도 순 연번 목록의 행을 조회해 같은 순서로 반환"""
+        if not ranking:
+            return []
+        placeholders = ', '.join(['%s'] * len(ranking))
+        with self._get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT * FROM 위탁병원현황 WHERE 연번 IN ({placeholders})',
+                               [hospital_id for hospital_id, _ in ranking])
+                rows = {row['연번']: row for row in cursor.fetchall()}
+        return [self._row_to_dict(rows[hospital_id]) for hospital_id, _ in ranking if hospital_id in rows]
+    
+    def _row_to_dict(self, row) -> Dict[str, Any]:
+        """위탁병원현황 행을 CRUD 화면용 딕셔너리로 변환"""
+        return {
+            '연번': row['연번'],
+            '시군구': row['시군구'],
+            '요양기관명': row['요양기관명'],
+            '종별': row['종별'],
+            '병상수': row['병상수'],
+            '진료과수': row['진료과수'],
+            '전화번호': row['전화번호'],
+            '주소': row['주소'],
+            '상세주소': row['상세주소'] or '',
+            '경도': float(row['경도']) if row['경도'] else 0,
+            '위도': float(row['위도']) if row['위도'] else 0
+        }
     
-    def find_all_for_crud(self, search: str = '', filter_type: str = '') -> List[Dict[str, Any]]:
+    def find_all_for_crud(self, search: str = '', filter_type: str = '',
+                          sort: str = '연번') -> List[Dict[str, Any]]:
         """CRUD용 병원 목록 조회 (검색 및 필터링)"""
-        hospitals = []
+        ranking, sort = self._prepare_search(search, filter_type, sort)
+        if sort == self.RELEVANCE_SORT:
+            return self._select_ranked(ranking)
+        
+        column, descending = self._parse_sort(sort)
+        where, params = self._build_filters(search, filter_type, ranking)
+        direction = 'DESC' if descending else 'ASC'
+        query = f'SELECT * FROM 위탁병원현황{where} ORDER BY {column} {direction}, 연번 {direction}'
         
         with self._get_connection() as connection:
             with connection.cursor() as cursor:
-                # 기본 쿼리
-                query = 'SELECT * FROM 위탁병원현황 WHERE 1=1'
-                params = []
-                
-                # 종별 필터링
-                if filter_type:
-                    query += ' AND 종별 = %s'
-                    params.append(filter_type)
-                
-                # 검색어 필터링 (요양기관명, 주소, 시군구, 상세주소, 전화번호)
-                if search:
-                    # If search term ends with '구' or '시', treat as 시군구 exact match
-                    if search.endswith('구') or search.endswith('시'):
-                        query += ' AND 시군구 = %s'
-                        params.append(search)
-                    else:
-                        query += ' AND (요양기관명 LIKE %s OR 주소 LIKE %s OR 시군구 LIKE %s OR 상세주소 LIKE %s OR 전화번호 LIKE %s)'
-                        search_param = f'%{search}%'
-                        params.extend([search_param, search_param, search_param, search_param, search_param])
-                
-                query += ' ORDER BY 연번'
-                
                 cursor.execute(query, params)
-                rows = cursor.fetchall()
+                return [self._row_to_dict(row) for row in cursor.fetchall()]
+    
+    def find_page_for_crud(self, search: str = '', filter_type: str = '', sort: str = '연번',
+                           page_size: int = 50, after: Optional[str] = None
+                           ) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
+        """
+        CRUD용 병원 목록 한 페이지 조회 (keyset 페이지네이션)
+        
+        Args:
+            sort: 정렬 컬럼, '-'를 붙이면 내림차순 (예: '-병상수'), 'relevance'면 검색어 관련도 순
+            page_size: 페이지 크기
+            after: 이전 페이지 응답의 next_cursor
+            
+        Returns:
+            (현재 페이지 목록, 조건에 맞는 전체 건수, 다음 페이지 커서 또는 None)
+        """
+        ranking, sort = self._prepare_search(search, filter_type, sort)
+        if sort == self.RELEVANCE_SORT:
+            return self._find_ranked_page(ranking, page_size, after)
+        
+        column, descending = self._parse_sort(sort)
+        where, params = self._build_filters(search, filter_type, ranking)
+        direction = 'DESC' if descending else 'ASC'
+        
+        page_where, page_params = where, list(params)
+        if after:
+            last_value, last_id = self._decode_cursor(after)
+            op = '<' if descending else '>'
+            if column == '연번':
+                page_where += f' AND 연번 {op} %s'
+                page_params.append(last_id)
+            else:
+                # (정렬값, 연번) 순서로 마지막 행 다음부터 - 정렬 컬럼 인덱스(+PK)를 그대로 사용
+                page_where += f' AND ({column} {op} %s OR ({column} = %s AND 연번 {op} %s))'
+                page_params.extend([last_value, last_value, last_id])
+        
+        with self._get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT COUNT(*) AS count FROM 위탁병원현황{where}', params)
+                total = cursor.fetchone()['count']
                 
-                for row in rows:
-                    hospitals.append({
-                        '연번': row['연번'],
-                        '시군구': row['시군구'],
-                        '요양기관명': row['요양기관명'],
-                        '종별': row['종별'],
-                        '병상수': row['병상수'],
-                        '진료과수': row['진료과수'],
-                        '전화번호': row['전화번호'],
-                        '주소': row['주소'],
-                        '상세주소': row['상세주소'] or '',
-                        '경도': float(row['경도']) if row['경도'] else 0,
-                        '위도': float(row['위도']) if row['위도'] else 0
-                    })
-        
-        return hospitals
+                cursor.execute(
+                    f'SELECT * FROM 위탁병원현황{page_where} '
+                    f'ORDER BY {column} {direction}, 연번 {direction} LIMIT %s',
+                    page_params + [page_size + 1]
+                )
+                rows = cursor.fetchall()
+        
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            next_cursor = self._encode_cursor(last[column], last['연번'])
+        
+        return [self._row_to_dict(row) for row in rows], total, next_cursor
+    
+    def _find_ranked_page(self, ranking: List[Tuple[int, float]], page_size: int,
+                          after: Optional[str]) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
+        """관련도 순 한 페이지 조회 - 커서는 (점수, 연번), 순위는 메모리 색인에서 계산"""
+        total = len(ranking)
+        start = 0
+        if after:
+            last_score, last_id = self._decode_cursor(after)
+            last_key = (-float(last_score), last_id)
+            start = next((i for i, (hospital_id, score) in enumerate(ranking)
+                          if (-score, hospital_id) > last_key), total)
+        page = ranking[start:start + page_size]
+        
+        next_cursor = None
+        if start + page_size < total:
+            last_id, last_score = page[-1]
+            next_cursor = self._encode_cursor(last_score, last_id)
+        return self._select_ranked(page), total, next_cursor
+    
+    @staticmethod
+    def _encode_cursor(value, hospital_id: int) -> str:
+        """(정렬값, 연번)을 URL 안전한 커서 문자열로 변환"""
+        raw = json.dumps([value, hospital_id], ensure_ascii=False).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+    
+    @staticmethod
+    def _decode_cursor(cursor: str):
+        """커서 문자열을 (정렬값, 연번)으로 복원"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            value, hospital_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            return value, int(hospital_id)
+        except Exception:
+            raise ValueError('잘못된 페이지 커서입니다')
     
     def find_by_id(self, hospital_id: int) -> Optional[Dict[str, Any]]:
         """ID로 병원 조회"""
@@ -75,22 +241,11 @@ class HospitalCrudRepository:
             with connection.cursor() as cursor:
                 cursor.execute('SELECT * FROM 위탁병원현황 WHERE 연번 = %s', (hospital_id,))
                 row = cursor.fetchone()
-                
-                if row:
-                    return {
-                        '연번': row['연번'],
-                        '시군구': row['시군구'],
-                        '요양기관명': row['요양기관명'],
-                        '종별': row['종별'],
-                        '병상수': row['병상수'],
-                        '진료과수': row['진료과수'],
-                        '전화번호': row['전화번호'],
-                        '주소': row['주소'],
-                        '상세주소': row['상세주소'] or '',
-                        '경도': float(row['경도']) if row['경도'] else 0,
-                        '위도': float(row['위도']) if row['위도'] else 0
-                    }
-                return None
+                return self._row_to_dict(row) if row else None
+    
+    def _crud_values(self, data: Dict[str, Any]) -> Tuple:
+        """CRUD_COLUMNS 순서의 파라미터 튜플"""
+        return tuple(data.get(column) for column in self.CRUD_COLUMNS)
     
     def create_crud(self, data: Dict[str, Any]) -> int:
         """병원 생성"""
@@ -100,19 +255,9 @@ class HospitalCrudRepository:
                     INSERT INTO 위탁병원현황 
                     (시군구, 요양기관명, 종별, 병상수, 진료과수, 전화번호, 주소, 상세주소, 경도, 위도)
                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ''', (
-                    data.get('시군구'),
-                    data.get('요양기관명'),
-                    data.get('종별'),
-                    data.get('병상수'),
-                    data.get('진료과수'),
-                    data.get('전화번호'),
-                    data.get('주소'),
-                    data.get('상세주소'),
-                    data.get('경도'),
-                    data.get('위도')
-                ))
+                ''', self._crud_values(data))
                 connection.commit()
+                self.invalidate_cache()
                 return cursor.lastrowid
     
     def update_crud(self, hospital_id: int, data: Dict[str, Any]) -> bool:
@@ -125,20 +270,9 @@ class HospitalCrudRepository:
                         진료과수 = %s, 전화번호 = %s, 주소 = %s, 상세주소 = %s, 
                         경도 = %s, 위도 = %s
                     WHERE 연번 = %s
-                ''', (
-                    data.get('시군구'),
-                    data.get('요양기관명'),
-                    data.get('종별'),
-                    data.get('병상수'),
-                    data.get('진료과수'),
-                    data.get('전화번호'),
-                    data.get('주소'),
-                    data.get('상세주소'),
-                    data.get('경도'),
-                    data.get('위도'),
-                    hospital_id
-                ))
+                ''', self._crud_values(data) + (hospital_id,))
                 connection.commit()
+                self.invalidate_cache()
                 return cursor.rowcount > 0
     
     def delete_crud(self, hospital_id: int) -> bool:
@@ -147,4 +281,185 @@ class HospitalCrudRepository:
             with connection.cursor() as cursor:
                 cursor.execute('DELETE FROM 위탁병원현황 WHERE 연번 = %s', (hospital_id,))
                 connection.commit()
+                self.invalidate_cache()
                 return cursor.rowcount > 0
+    
+    def _insert_many(self, cursor, rows: List[Dict[str, Any]]) -> None:
+        """연번 없는 행들을 다중 행 INSERT 한 문장으로 추가 (executemany)"""
+        cursor.executemany(f'''
+            INSERT INTO 위탁병원현황 ({', '.join(self.CRUD_COLUMNS)})
+            VALUES ({', '.join(['%s'] * len(self.CRUD_COLUMNS))})
+        ''', [self._crud_values(row) for row in rows])
+    
+    def _insert_returning_ids(self, cursor, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        연번 없는 행들을 다중 행 INSERT ... VALUES (...), (...) 한 문장으로 추가하고 할당된 연번 반환
+        
+        행 수를 미리 아는 INSERT 한 문장(simple insert)의 AUTO_INCREMENT 값은 한 번에 연속으로 할당되므로
+        첫 연번(LAST_INSERT_ID(), cursor.lastrowid)부터 행 수만큼이 새 연번이다.
+        executemany는 문장 길이에 따라 여러 문장으로 나눌 수 있어 직접 한 문장을 만든다.
+        """
+        placeholders = '(' + ', '.join(['%s'] * len(self.CRUD_COLUMNS)) + ')'
+        cursor.execute(
+            f"INSERT INTO 위탁병원현황 ({', '.join(self.CRUD_COLUMNS)}) "
+            f"VALUES {', '.join([placeholders] * len(rows))}",
+            [value for row in rows for value in self._crud_values(row)]
+        )
+        if cursor.rowcount != len(rows):
+            raise RuntimeError(f'추가된 행 수가 다릅니다 (요청 {len(rows)}, 추가 {cursor.rowcount})')
+        first_id = cursor.lastrowid
+        return list(range(first_id, first_id + len(rows)))
+    
+    def _upsert_many(self, cursor, rows: List[Dict[str, Any]]) -> None:
+        """연번이 있는 행들을 INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 저장 (executemany)"""
+        columns = ('연번',) + self.CRUD_COLUMNS
+        assignments = ', '.join(f'{column} = VALUES({column})' for column in self.CRUD_COLUMNS)
+        cursor.executemany(f'''
+            INSERT INTO 위탁병원현황 ({', '.join(columns)})
+            VALUES ({', '.join(['%s'] * len(columns))})
+            ON DUPLICATE KEY UPDATE {assignments}
+        ''', [(row['연번'],) + self._crud_values(row) for row in rows])
+    
+    def validate_bulk(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """일괄 작업 목록 검증 - 잘못된 항목의 {'index', 'error'} 목록 (비어 있으면 정상)"""
+        errors = []
+        seen_ids = set()
+        for index, operation in enumerate(operations):
+            error = None
+            if not isinstance(operation, dict):
+                error = '작업은 객체여야 합니다'
+            elif operation.get('op') not in self.BULK_OPERATIONS:
+                error = f"op는 {', '.join(self.BULK_OPERATIONS)} 중 하나여야 합니다"
+            else:
+                op = operation['op']
+                if op != 'create':
+                    hospital_id = operation.get('id')
+                    if not isinstance(hospital_id, int) or isinstance(hospital_id, bool):
+                        error = 'id(연번)는 정수여야 합니다'
+                    elif hospital_id in seen_ids:
+                        error = f'같은 연번({hospital_id})이 여러 번 지정되었습니다'
+                    else:
+                        seen_ids.add(hospital_id)
+                if error is None and op != 'delete':
+                    error = self._validate_row(operation.get('data'))
+            if error:
+                errors.append({'index': index, 'error': error})
+        return errors
+    
+    def _validate_row(self, data) -> Optional[str]:
+        """생성/수정 데이터 검증 (위탁병원현황 컬럼은 모두 NOT NULL)"""
+        if not isinstance(data, dict):
+            return 'data는 객체여야 합니다'
+        missing = [column for column in self.CRUD_COLUMNS
+                   if column != '상세주소' and data.get(column) in (None, '')]
+        if missing:
+            return f"필수 항목이 없습니다: {', '.join(missing)}"
+        try:
+            int(data['병상수'])
+            int(data['진료과수'])
+            float(data['경도'])
+            float(data['위도'])
+        except (TypeError, ValueError):
+            return '병상수/진료과수는 정수, 경도/위도는 숫자여야 합니다'
+        return None
+    
+    def bulk_apply(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        생성/수정/삭제 작업 목록을 한 트랜잭션으로 적용
+        
+        - 생성은 다중 행 INSERT 한 문장 (첫 연번 LAST_INSERT_ID()부터 행 수만큼을 결과 id로 사용)
+        - 수정은 executemany로 INSERT ... ON DUPLICATE KEY UPDATE 한 번
+        - 삭제는 DELETE ... WHERE 연번 IN (...) 한 번
+        - 수정/삭제 대상 연번은 먼저 FOR UPDATE로 잠그고, 없는 연번은 not_found로 건너뜀
+        - 오류가 나면 전체 롤백, 성공하면 커밋 후 캐시를 한 번만 무효화
+        
+        validate_bulk()를 통과한 작업 목록을 받는다고 가정한다.
+        
+        Returns:
+            요청 순서대로 {'index', 'op', 'id', 'status'} 목록
+        """
+        results: List[Dict[str, Any]] = [
+            {'index': index, 'op': operation['op'], 'id': operation.get('id')}
+            for index, operation in enumerate(operations)
+        ]
+        creates = [i for i, operation in enumerate(operations) if operation['op'] == 'create']
+        targets = [operation['id'] for operation in operations if operation['op'] != 'create']
+        updates, deletes = [], []
+        
+        with self._get_connection() as connection:
+            try:
+                with connection.cursor() as cursor:
+                    existing = set()
+                    if targets:
+                        placeholders = ', '.join(['%s'] * len(targets))
+                        cursor.execute(
+                            f'SELECT 연번 FROM 위탁병원현황 WHERE 연번 IN ({placeholders}) FOR UPDATE',
+                            targets
+                        )
+                        existing = {row['연번'] for row in cursor.fetchall()}
+                    
+                    for i, operation in enumerate(operations):
+                        if operation['op'] == 'create':
+                            continue
+                        if operation['id'] not in existing:
+                            results[i]['status'] = 'not_found'
+                        elif operation['op'] == 'update':
+                            updates.append(i)
+                        else:
+                            deletes.append(i)
+                    
+                    if creates:
+                        new_ids = self._insert_returning_ids(cursor, [operations[i]['data'] for i in creates])
+                        for i, new_id in zip(creates, new_ids):
+                            results[i].update(id=new_id, status='created')
+                    
+                    if updates:
+                        self._upsert_many(cursor, [dict(operations[i]['data'], 연번=operations[i]['id'])
+                                                   for i in updates])
+                        for i in updates:
+                            results[i]['status'] = 'updated'
+                    
+                    if deletes:
+                        placeholders = ', '.join(['%s'] * len(deletes))
+                        cursor.execute(f'DELETE FROM 위탁병원현황 WHERE 연번 IN ({placeholders})',
+                                       [operations[i]['id'] for i in deletes])
+                        for i in deletes:
+                            results[i]['status'] = 'deleted'
+                
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+        
+        if creates or updates or deletes:
+            self.invalidate_cache()
+        return results
+    
+    def upsert_chunk(self, rows: List[Dict[str, Any]], invalidate: bool = True) -> Dict[str, int]:
+        """
+        검증된 행 묶음을 한 트랜잭션으로 저장 (가져오기용)
+        
+        연번이 있는 행은 INSERT ... ON DUPLICATE KEY UPDATE(upsert), 없는 행은 INSERT.
+        둘 다 executemany 다중 행 문장 하나씩으로 처리한다.
+        
+        Returns:
+            {'inserted': 연번 없이 추가한 행 수, 'upserted': 연번 기준 추가/수정한 행 수}
+        """
+        with_id = [row for row in rows if row.get('연번') is not None]
+        without_id = [row for row in rows if row.get('연번') is None]
+        
+        with self._get_connection() as connection:
+            try:
+                with connection.cursor() as cursor:
+                    if without_id:
+                        self._insert_many(cursor, without_id)
+                    if with_id:
+                        self._upsert_many(cursor, with_id)
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+        
+        if invalidate and rows:
+            self.invalidate_cache()
+        return {'inserted': len(without_id), 'upserted': len(with_id)}
@@ -63,6 +63,28 @@ class HospitalRepository:
                 )
             return None
             
+    def get_many(self, hospital_ids: List[int]) -> List[Hospital]:
+        """여러 ID의 병원을 한 번에 조회 (요청 순서 유지)"""
+        hospital_ids = list(dict.fromkeys(hospital_ids))
+        if not hospital_ids:
+            return []
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            placeholders = ', '.join(['?'] * len(hospital_ids))
+            cursor.execute(f'SELECT * FROM hospitals WHERE id IN ({placeholders})', hospital_ids)
+            found = {
+                row[0]: Hospital(
+                    hospital_id=row[0],
+                    name=row[1],
+                    address=row[2],
+                    latitude=row[3],
+                    longitude=row[4],
+                    medical_departments=json.loads(row[5]) if row[5] else []
+                )
+                for row in cursor.fetchall()
+            }
+        return [found[hospital_id] for hospital_id in hospital_ids if hospital_id in found]
+            
     def find_all(self) -> List[Hospital]:
         """모든 병원 조회"""
         hospitals = []
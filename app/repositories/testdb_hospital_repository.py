@@ -3,57 +3,83 @@ TestDB MySQL Repository
 testdb.위탁병원현황 테이블을 사용하는 병원 리포지토리
 """
 
-import pymysql
+import hashlib
 import json
-from typing import List, Optional
+import time
+from typing import Iterable, List, Optional, Tuple
 from ..models.hospital import Hospital
+from .connection_pool import ConnectionPool, get_pool
+from .hospital_cache import HospitalSnapshot, HospitalSnapshotCache, hospital_cache
 
 class TestDBHospitalRepository:
-    def __init__(self, host='121.157.160.22', port=3306, user='root', password='zzaaqq', database='testdb'):
-        self.connection_config = {
-            'host': host,
-            'port': port,
-            'user': user,
-            'password': password,
-            'database': database,
-            'charset': 'utf8mb4',
-            'cursorclass': pymysql.cursors.DictCursor,
-            'connect_timeout': 30
-        }
+    def __init__(self, pool: Optional[ConnectionPool] = None, cache=None):
+        # 지정하지 않으면 애플리케이션 공유 커넥션 풀 사용
+        self._pool = pool
+        # 스냅샷 캐시: 기본은 공유 캐시, 별도 풀을 쓰면 전용 캐시, False면 캐시 사용 안 함
+        if cache is None:
+            cache = hospital_cache if pool is None else HospitalSnapshotCache(self.load_hospitals)
+        self._cache = cache or None
         
     def _get_connection(self):
-        """MySQL 연결 생성"""
-        return pymysql.connect(**self.connection_config)
+        """공유 커넥션 풀에서 MySQL 연결 대여"""
+        return (self._pool or get_pool()).connection()
         
     def find_all(self) -> List[Hospital]:
-        """위탁병원현황 테이블에서 모든 병원 조회"""
+        """위탁병원현황 테이블의 모든 병원 조회 (스냅샷 캐시 사용)"""
+        if self._cache is None:
+            try:
+                return self.load_hospitals()[0]
+            except Exception as e:
+                print(f"데이터베이스 조회 오류: {e}")
+                print("테이블 구조를 확인해주세요.")
+                return []
+        return list(self._cache.get().hospitals)
+    
+    def snapshot(self) -> HospitalSnapshot:
+        """현재 병원 스냅샷 (캐시 미사용 시 DB에서 바로 생성)"""
+        if self._cache is None:
+            hospitals, fingerprint = self.load_hospitals()
+            return HospitalSnapshot(hospitals, 0, fingerprint, time.time())
+        return self._cache.get()
+    
+    def invalidate_cache(self):
+        """데이터 변경 후 스냅샷 캐시 무효화"""
+        if self._cache is not None:
+            self._cache.invalidate()
+    
+    def load_hospitals(self) -> Tuple[List[Hospital], str]:
+        """위탁병원현황 테이블 전체를 DB에서 읽어 (병원 목록, 내용 fingerprint) 반환"""
         hospitals = []
-        try:
-            with self._get_connection() as connection:
-                with connection.cursor() as cursor:
-                    # 위탁병원현황 테이블에서 데이터 조회 (공백 없음)
-                    cursor.execute('SELECT * FROM `위탁병원현황`')
-                    rows = cursor.fetchall()
-                    
-                    for i, row in enumerate(rows):
-                        # 실제 테이블의 컬럼명에 맞게 매핑
-                        hospital = Hospital(
-                            hospital_id=row.get('연번', i + 1),
-                            name=row.get('요양기관명', '알 수 없는 병원'),
-                            address=f"{row.get('주소', '')} {row.get('상세주소', '')}".strip(),
-                            latitude=self._safe_float(row.get('위도')),
-                            longitude=self._safe_float(row.get('경도')),
-                            medical_departments=[row.get('종별', '')],
-                            bed_count=row.get('병상수'),
-                            department_count=row.get('진료과수')
-                        )
-                        hospitals.append(hospital)
-                        
-        except Exception as e:
-            print(f"데이터베이스 조회 오류: {e}")
-            print("테이블 구조를 확인해주세요.")
-            
-        return hospitals
+        digest = hashlib.sha1()
+        with self._get_connection() as connection:
+            with connection.cursor() as cursor:
+                # 위탁병원현황 테이블에서 데이터 조회 (공백 없음)
+                cursor.execute('SELECT * FROM `위탁병원현황` ORDER BY `연번`')
+                rows = cursor.fetchall()
+                
+                for i, row in enumerate(rows):
+                    digest.update(repr(sorted(row.items())).encode('utf-8'))
+                    hospitals.append(self._row_to_hospital(row, i + 1))
+        
+        return hospitals, digest.hexdigest()
+    
+    def _row_to_hospital(self, row, default_id=None) -> Hospital:
+        """위탁병원현황 행을 Hospital 객체로 변환"""
+        # 실제 테이블의 컬럼명에 맞게 매핑
+        return Hospital(
+            hospital_id=row.get('연번', default_id),
+            name=row.get('요양기관명', '알 수 없는 병원'),
+            address=f"{row.get('주소', '')} {row.get('상세주소', '')}".strip(),
+            latitude=self._safe_float(row.get('위도')),
+            longitude=self._safe_float(row.get('경도')),
+            medical_departments=[row.get('종별', '')],
+            bed_count=row.get('병상수'),
+            department_count=row.get('진료과수'),
+            sigungu=row.get('시군구'),
+            phone=row.get('전화번호'),
+            street_address=row.get('주소'),
+            detail_address=row.get('상세주소')
+        )
     
     def _safe_float(self, value):
         """안전한 float 변환"""
@@ -162,12 +188,37 @@ class TestDBHospitalRepository:
 
     # 기본적인 CRUD 메서드들 (필요시 구현)
     def find_by_id(self, hospital_id: int) -> Optional[Hospital]:
-        """ID로 병원 검색 (구현 필요)"""
-        hospitals = self.find_all()
-        for hospital in hospitals:
-            if hospital.hospital_id == hospital_id:
-                return hospital
-        return None
+        """ID로 병원 조회 (스냅샷의 id 인덱스 사용, 캐시 미사용 시 PK 조회)"""
+        if self._cache is None:
+            found = self._select_by_ids([hospital_id])
+            return found[0] if found else None
+        return self._cache.get().by_id.get(hospital_id)
+    
+    def get_many(self, hospital_ids: Iterable[int]) -> List[Hospital]:
+        """여러 ID의 병원을 한 번에 조회 (요청 순서 유지, 없는 ID는 제외)"""
+        hospital_ids = list(dict.fromkeys(hospital_ids))
+        if not hospital_ids:
+            return []
+        if self._cache is None:
+            found = {h.hospital_id: h for h in self._select_by_ids(hospital_ids)}
+        else:
+            found = self._cache.get().by_id
+        return [found[hospital_id] for hospital_id in hospital_ids if hospital_id in found]
+    
+    def _select_by_ids(self, hospital_ids: List[int]) -> List[Hospital]:
+        """WHERE 연번 IN (...) 단일 쿼리로 병원 조회"""
+        try:
+            with self._get_connection() as connection:
+                with connection.cursor() as cursor:
+                    placeholders = ', '.join(['%s'] * len(hospital_ids))
+                    cursor.execute(
+                        f'SELECT * FROM `위탁병원현황` WHERE `연번` IN ({placeholders})',
+                        list(hospital_ids)
+                    )
+                    return [self._row_to_hospital(row) for row in cursor.fetchall()]
+        except Exception as e:
+            print(f"병원 ID 조회 오류: {e}")
+            return []
     
     def create(self, hospital: Hospital) -> int:
         """병원 정보 생성 (구현 필요)"""
@@ -268,6 +319,7 @@ class TestDBHospitalRepository:
                         data.get('위도')
                     ))
                     connection.commit()
+                    self.invalidate_cache()
                     return cursor.lastrowid
         except Exception as e:
             print(f"CRUD 생성 오류: {e}")
@@ -299,6 +351,7 @@ class TestDBHospitalRepository:
                         hospital_id
                     ))
                     connection.commit()
+                    self.invalidate_cache()
                     return cursor.rowcount > 0
         except Exception as e:
             print(f"CRUD 수정 오류: {e}")
@@ -312,6 +365,7 @@ class TestDBHospitalRepository:
                     query = 'DELETE FROM `위탁병원현황` WHERE `연번` = %s'
                     cursor.execute(query, (hospital_id,))
                     connection.commit()
+                    self.invalidate_cache()
                     return cursor.rowcount > 0
         except Exception as e:
             print(f"CRUD 삭제 오류: {e}")
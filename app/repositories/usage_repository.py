@@ -0,0 +1,121 @@
+"""
+Usage Repository
+testdb.지역별위탁병원이용인원2 테이블의 위탁병원 이용인원 집계와 위탁병원현황_연도별현황 조회
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .connection_pool import ConnectionPool, get_pool
+
+# (광역지자체, 시군구, 인원)
+UsageRow = Tuple[str, str, float]
+# (연도, 월, 광역지자체, 인원 합계, 원본 행 수)
+MonthlyRow = Tuple[int, int, str, float, int]
+
+
+class UsageRepository:
+    """
+    지역별 위탁병원 이용인원 리포지토리
+
+    - 필요한 단위의 합계만 DB에서 집계해 가져옴 (GROUP BY)
+    - 월별 통계라 자주 바뀌지 않으므로 조회 결과를 ttl초 동안 메모리에 보관
+    """
+
+    TABLE = '지역별위탁병원이용인원2'
+    FACILITY_TABLE = '위탁병원현황_연도별현황'
+
+    def __init__(self, pool: Optional[ConnectionPool] = None, ttl: float = 600.0):
+        self._pool = pool
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+
+    def _get_connection(self):
+        """공유 커넥션 풀에서 MySQL 연결 대여"""
+        return (self._pool or get_pool()).connection()
+
+    def _cached(self, key: str, loader: Callable[[], Any]) -> Any:
+        """ttl초 안에 같은 키로 조회한 결과가 있으면 재사용"""
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+        value = loader()
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def load_usage(self, period: Optional[str] = None) -> Tuple[str, List[UsageRow]]:
+        """
+        연월(YYYYMM)의 시군구별 이용인원 합계 (기본: 가장 최근 연월)
+
+        Returns:
+            (연월, [(광역지자체, 시군구, 인원)])
+        """
+        return self._cached(f'usage:{period or ""}', lambda: self._select_usage(period))
+
+    def load_monthly_totals(self, since: Optional[int] = None) -> List[MonthlyRow]:
+        """
+        연월/광역지자체별 이용인원 합계와 원본 행 수 (연도/월/광역지자체 순)
+
+        롤업 저장소(UsageRollupStore)가 갱신 시점을 정하므로 캐시하지 않음
+
+        Args:
+            since: 이 연월(YYYYMM)부터의 합계만 (기본: 전체)
+
+        Returns:
+            [(연도, 월, 광역지자체, 인원, 행 수)]
+        """
+        where, params = ('WHERE `연월` >= %s ', (str(since),)) if since else ('', ())
+        with self._get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'SELECT `연도`, `월`, `광역지자체`, SUM(`인원`) AS 인원, COUNT(*) AS 건수 '
+                    f'FROM `{self.TABLE}` {where}GROUP BY `연도`, `월`, `광역지자체` '
+                    f'ORDER BY `연도`, `월`, `광역지자체`',
+                    params
+                )
+                return [(int(row['연도']), int(row['월']), row['광역지자체'] or '',
+                         float(row['인원'] or 0), int(row['건수']))
+                        for row in cursor.fetchall()
+                        if row['연도'] is not None and row['월'] is not None]
+
+    def load_usage_rows(self) -> List[Dict[str, Any]]:
+        """
+        차트 생성용 원본 이용인원 행 (산점도 행렬/상관관계에 필요한 컬럼만)
+
+        차트 빌드에서 한 번만 읽으므로 캐시하지 않음
+        """
+        with self._get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'SELECT `연도`, `월`, `연월`, `광역지자체`, `광역지자체코드`, `인원` FROM `{self.TABLE}`'
+                )
+                return list(cursor.fetchall())
+
+    def load_facility_counts(self) -> List[Dict[str, Any]]:
+        """광역지자체별 연말 위탁병원 수 (위탁병원현황_연도별현황 전체 행)"""
+        return self._cached('facility', self._select_facility_counts)
+
+    def _select_usage(self, period: Optional[str]) -> Tuple[str, List[UsageRow]]:
+        with self._get_connection() as connection:
+            with connection.cursor() as cursor:
+                if not period:
+                    cursor.execute(f'SELECT MAX(`연월`) AS 연월 FROM `{self.TABLE}`')
+                    row = cursor.fetchone()
+                    period = str(row['연월']) if row and row['연월'] is not None else ''
+                cursor.execute(
+                    f'SELECT `광역지자체`, `시군구`, SUM(`인원`) AS 인원 FROM `{self.TABLE}` '
+                    f'WHERE `연월` = %s GROUP BY `광역지자체`, `시군구`',
+                    (period,)
+                )
+                rows = [(row['광역지자체'] or '', row['시군구'] or '', float(row['인원'] or 0))
+                        for row in cursor.fetchall()]
+        return period, rows
+
+    def _select_facility_counts(self) -> List[Dict[str, Any]]:
+        with self._get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT * FROM `{self.FACILITY_TABLE}`')
+                return list(cursor.fetchall())
@@ -0,0 +1,145 @@
+"""
+Usage Rollup Store
+위탁병원 이용인원 롤업을 프로세스 안에 보관하고 새 월 데이터만 증분 반영하는 저장소
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from ..models.usage_rollup import UsageRollup
+
+
+class UsageRollupStore:
+    """
+    이용인원 롤업 저장소
+
+    - 처음 한 번은 연월/광역지자체별 합계 전체를 읽어 롤업 생성
+    - ttl이 지나면 마지막 연월부터의 합계만 다시 읽어 그 연월들의 셀만 교체
+      (새 월이 추가되거나 마지막 월에 행이 더 들어온 경우)
+    - full_refresh_interval마다, 또는 invalidate() 후에는 전체를 다시 읽어 과거 연월 수정도 반영
+    - 내용(fingerprint)이 같으면 기존 롤업 객체와 버전을 그대로 유지
+    - 동시에 여러 요청이 만료를 보더라도 DB 조회는 한 번만 수행
+    """
+
+    def __init__(self, repository=None, ttl: float = 600.0, full_refresh_interval: float = 24 * 3600.0):
+        self._repository = repository
+        self.ttl = ttl
+        self.full_refresh_interval = full_refresh_interval
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._rollup: Optional[UsageRollup] = None
+        self._version = 0
+        self._expires_at = 0.0
+        self._full_due_at = 0.0
+        self._counters = {
+            'hits': 0,
+            'full_refreshes': 0,
+            'incremental_refreshes': 0,
+            'refresh_errors': 0,
+            'rows_loaded': 0,
+        }
+
+    @property
+    def data_version(self) -> int:
+        """롤업 내용이 바뀔 때마다 1씩 증가 (아직 읽지 않았으면 0)"""
+        return self._version
+
+    def get(self) -> UsageRollup:
+        """
+        현재 롤업 (만료되었으면 갱신)
+
+        갱신이 실패하면 이전 롤업을 그대로 반환 (처음 조회에서 실패하면 예외 전달)
+        """
+        with self._lock:
+            if self._rollup is not None and time.monotonic() < self._expires_at:
+                self._counters['hits'] += 1
+                return self._rollup
+
+        with self._refresh_lock:
+            with self._lock:
+                # 기다리는 동안 다른 요청이 갱신했으면 그 결과 사용
+                if self._rollup is not None and time.monotonic() < self._expires_at:
+                    self._counters['hits'] += 1
+                    return self._rollup
+                previous = self._rollup
+                full = previous is None or time.monotonic() >= self._full_due_at
+            try:
+                rollup, loaded = self._load(previous, full)
+            except Exception as e:
+                print(f"이용인원 롤업 갱신 오류: {e}")
+                with self._lock:
+                    self._counters['refresh_errors'] += 1
+                if previous is None:
+                    raise
+                return previous
+
+            with self._lock:
+                if previous is not None and rollup.fingerprint == previous.fingerprint:
+                    rollup = previous
+                else:
+                    self._version += 1
+                self._rollup = rollup
+                now = time.monotonic()
+                self._expires_at = now + self.ttl
+                if full:
+                    self._full_due_at = now + self.full_refresh_interval
+                self._counters['full_refreshes' if full else 'incremental_refreshes'] += 1
+                self._counters['rows_loaded'] += loaded
+                return rollup
+
+    def invalidate(self) -> None:
+        """다음 조회에서 전체를 다시 읽도록 표시 (원본 데이터를 고친 뒤 호출)"""
+        with self._lock:
+            self._expires_at = 0.0
+            self._full_due_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """롤업 상태와 누적 카운터"""
+        with self._lock:
+            rollup = self._rollup
+            result = dict(self._counters)
+            result.update({
+                'data_version': self._version,
+                'fingerprint': rollup.fingerprint if rollup else '',
+                'cells': len(rollup) if rollup else 0,
+                'latest_period': '%04d%02d' % rollup.latest if rollup and rollup.latest else None,
+                'stale': time.monotonic() >= self._expires_at,
+            })
+            return result
+
+    def _load(self, previous: Optional[UsageRollup], full: bool):
+        """(새 롤업, 읽은 합계 행 수)"""
+        repository = self._get_repository()
+        if full or previous.latest is None:
+            rows = repository.load_monthly_totals()
+            return UsageRollup(rows), len(rows)
+        year, month = previous.latest
+        rows = repository.load_monthly_totals(since=year * 100 + month)
+        periods = {previous.latest} | {(row[0], row[1]) for row in rows}
+        return previous.replaced(periods, rows), len(rows)
+
+    def _get_repository(self):
+        if self._repository is None:
+            from .usage_repository import UsageRepository
+            self._repository = UsageRepository()
+        return self._repository
+
+
+# 애플리케이션 공유 롤업
+usage_rollups = UsageRollupStore(
+    ttl=float(os.environ.get('USAGE_ROLLUP_TTL') or 600),
+    full_refresh_interval=float(os.environ.get('USAGE_ROLLUP_FULL_REFRESH') or 24 * 3600),
+)
+
+
+def configure_usage_rollups(config: Optional[Mapping[str, Any]] = None) -> None:
+    """앱 설정(app.config)으로 공유 롤업 설정"""
+    if not config:
+        return
+    if 'USAGE_ROLLUP_TTL' in config:
+        usage_rollups.ttl = float(config['USAGE_ROLLUP_TTL'])
+    if 'USAGE_ROLLUP_FULL_REFRESH' in config:
+        usage_rollups.full_refresh_interval = float(config['USAGE_ROLLUP_FULL_REFRESH'])
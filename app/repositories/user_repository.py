@@ -4,32 +4,21 @@ User Repository
 """
 
 import pymysql
-import os
 from werkzeug.security import generate_password_hash, check_password_hash
 from typing import Optional
 from ..models.user import User
+from .connection_pool import ConnectionPool, get_pool
 
 
 class UserRepository:
-    def __init__(self, host='121.157.160.22', port=3306, user='root',
-                 password=None, database='testdb'):
-        # 환경변수에서 MySQL 비밀번호 가져오기 (기본값: zzaaqq)
-        if password is None:
-            password = os.environ.get('MYSQL_PASSWORD', 'zzaaqq')
-        self.connection_config = {
-            'host': host,
-            'port': port,
-            'user': user,
-            'password': password,
-            'database': database,
-            'charset': 'utf8mb4',
-            'cursorclass': pymysql.cursors.DictCursor
-        }
+    def __init__(self, pool: Optional[ConnectionPool] = None):
+        # 지정하지 않으면 애플리케이션 공유 커넥션 풀 사용
+        self._pool = pool
         self._create_table_if_not_exists()
 
     def _get_connection(self):
-        """MySQL 연결 생성"""
-        return pymysql.connect(**self.connection_config)
+        """공유 커넥션 풀에서 MySQL 연결 대여"""
+        return (self._pool or get_pool()).connection()
 
     def _create_table_if_not_exists(self):
         """users 테이블이 없으면 생성"""
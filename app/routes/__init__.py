@@ -8,6 +8,11 @@ import os
 from ..controllers.main_controller import MainController
 from ..controllers.hospital_controller import HospitalController
 from ..controllers.auth_controller import AuthController
+from ..services.artifact_store import artifact_store
+from ..services import chart_build
+from ..services.plotly_runtime import (
+    RUNTIME_MAX_AGE, ensure_plotly_runtime, plotly_runtime_filename, plotly_runtime_url,
+)
 
 # 블루프린트 생성
 main_bp = Blueprint('main', __name__)
@@ -46,15 +51,30 @@ def map_view():
 def folium_map():
     return main_controller.folium_map()
 
-# 차트 대시보드 페이지 (차트 3,4,5,6,7)
+# 차트 대시보드 페이지 (차트 3,4,5,6,7 - 공유 plotly.js를 한 번 불러 Figure spec으로 그림)
 @main_bp.route('/c')
 def chart_dashboard():
-    return render_template('c.html')
+    return render_template('c.html', plotly_runtime_url=plotly_runtime_url())
 
 # 차트 대시보드 페이지 (햄버거 메뉴 버전)
 @main_bp.route('/c1')
 def chart_dashboard_v2():
-    return render_template('c_1.html')
+    return render_template('c_1.html', plotly_runtime_url=plotly_runtime_url())
+
+# 차트 Figure spec (build_charts.py --format spec|both 결과, ETag로 재검증)
+@main_bp.route('/chart-specs/<name>.json')
+def chart_spec(name):
+    return send_from_directory(str(chart_build.PUBLIC_DIR / chart_build.SPEC_DIRNAME), name + '.json', max_age=0)
+
+# 공유 plotly.js (파일명이 내용 해시라 오래 캐시)
+@main_bp.route('/vendor/<filename>')
+def plotly_runtime(filename):
+    if filename != plotly_runtime_filename():
+        return {'error': '파일을 찾을 수 없습니다'}, 404
+    path = ensure_plotly_runtime(chart_build.PUBLIC_DIR / chart_build.RUNTIME_DIRNAME)
+    response = send_from_directory(str(path.parent), filename, max_age=RUNTIME_MAX_AGE)
+    response.headers['Cache-Control'] = f'public, max-age={RUNTIME_MAX_AGE}, immutable'
+    return response
 
 # 차트 HTML 파일 라우트
 @main_bp.route('/chart3')
@@ -99,6 +119,31 @@ def api_hospitals_create():
     """CRUD용 병원 생성"""
     return hospital_controller.create_hospital_crud()
 
+@api_bp.route('/hospitals/bulk', methods=['POST'])
+def api_hospitals_bulk():
+    """CRUD용 병원 일괄 생성/수정/삭제 (한 트랜잭션)"""
+    return hospital_controller.bulk_hospitals_crud()
+
+@api_bp.route('/hospitals/import', methods=['POST'])
+def api_hospitals_import():
+    """병원 목록 파일(xlsx/csv) 업로드 가져오기 (dry_run, progress 지원)"""
+    return hospital_controller.import_hospitals()
+
+@api_bp.route('/hospitals/batch', methods=['GET'])
+def api_hospitals_batch():
+    """여러 병원 상세 정보 일괄 조회 (?ids=1,2,3, format=crud 지원)"""
+    return hospital_controller.batch()
+
+@api_bp.route('/hospitals/<int:hospital_id>', methods=['GET'])
+def api_hospitals_show(hospital_id):
+    """병원 상세 정보 조회"""
+    return hospital_controller.show(hospital_id)
+
+@api_bp.route('/hospitals/<int:hospital_id>/popup', methods=['GET'])
+def api_hospital_popup(hospital_id):
+    """지도 마커 팝업 HTML (생성된 지도에는 팝업을 넣지 않고 클릭할 때 조회)"""
+    return hospital_controller.hospital_popup(hospital_id)
+
 @api_bp.route('/hospitals/<int:hospital_id>', methods=['PUT'])
 def api_hospitals_update(hospital_id):
     """CRUD용 병원 수정"""
@@ -113,6 +158,16 @@ def api_hospitals_delete(hospital_id):
 def api_hospitals_search():
     return hospital_controller.search()
 
+@api_bp.route('/hospitals/nearest', methods=['GET'])
+def api_hospitals_nearest():
+    """가장 가까운 위탁병원 k개 (?lat=&lng=&k=&type=&min_beds=)"""
+    return hospital_controller.nearest()
+
+@api_bp.route('/hospitals/bbox', methods=['GET'])
+def api_hospitals_bbox():
+    """지도 영역 안의 위탁병원 (?min_lat=&min_lng=&max_lat=&max_lng=&limit=&type=, ETag 지원)"""
+    return hospital_controller.hospitals_in_bbox()
+
 @api_bp.route('/hospitals/table-structure', methods=['GET'])
 def api_hospitals_table_structure():
     return hospital_controller.check_table_structure()
@@ -125,10 +180,30 @@ def api_all_tables():
 def api_generate_folium_map():
     return hospital_controller.generate_folium_map()
 
+@api_bp.route('/map/hospitals.geojson', methods=['GET'])
+def api_hospitals_geojson():
+    """지도 레이어용 병원 GeoJSON (region, type으로 필터, ETag 지원)"""
+    return hospital_controller.hospitals_geojson()
+
+@api_bp.route('/map/clusters', methods=['GET'])
+def api_hospital_clusters():
+    """줌 레벨별 병원 클러스터 (z, bbox=west,south,east,north, ETag 지원)"""
+    return hospital_controller.hospital_clusters()
+
+@api_bp.route('/map/density', methods=['GET'])
+def api_density_grid():
+    """줌 레벨별 밀도 격자 (source=hospitals|usage, z, bbox, period=YYYYMM, ETag 지원)"""
+    return hospital_controller.density_grid()
+
 @api_bp.route('/export/excel', methods=['GET'])
 def api_export_excel():
     return hospital_controller.export_to_excel()
 
+@api_bp.route('/charts/<chart_id>', methods=['GET'])
+def api_chart_data(chart_id):
+    """차트 Figure JSON (chart1~chart7) 또는 차트 앱 데이터 (chartData), 데이터 버전 단위 캐시"""
+    return hospital_controller.chart_data(chart_id)
+
 @api_bp.route('/statistics/yearly', methods=['GET'])
 def api_yearly_statistics():
     return hospital_controller.get_yearly_statistics()
@@ -137,6 +212,26 @@ def api_yearly_statistics():
 def api_yearly_trend():
     return hospital_controller.get_yearly_total_trend()
 
+@api_bp.route('/status/db-pool', methods=['GET'])
+def api_db_pool_stats():
+    """공유 MySQL 커넥션 풀 카운터 (checkouts, waits, reconnects 등)"""
+    return hospital_controller.get_pool_stats()
+
+@api_bp.route('/status/hospital-cache', methods=['GET'])
+def api_hospital_cache_stats():
+    """병원 스냅샷 캐시 상태 (데이터 버전, 적중/갱신 횟수)"""
+    return hospital_controller.get_cache_stats()
+
+@api_bp.route('/status/usage-rollup', methods=['GET'])
+def api_usage_rollup_stats():
+    """이용인원 롤업 상태 (데이터 버전, 마지막 연월, 증분/전체 갱신 횟수)"""
+    return hospital_controller.get_usage_rollup_stats()
+
+@api_bp.route('/status/map-cache', methods=['GET'])
+def api_map_cache_stats():
+    """생성된 지도 캐시 상태 (적중/생성 횟수, 저장 폴더, 사전 생성 결과)"""
+    return hospital_controller.get_map_cache_stats()
+
 # ============================================
 # React 차트 앱 라우트 (하이브리드 배포)
 # ============================================
@@ -183,22 +278,43 @@ def serve_chart_assets(path):
 # 기존 생성된 HTML 파일 서빙
 # ============================================
 
+# 프로젝트 루트에 커밋되어 있는 기존 HTML 페이지 (요청마다 파일 시스템을 확인하지 않도록 시작 시 한 번만 목록화)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+LEGACY_ROOT_PAGES = frozenset(name for name in os.listdir(PROJECT_ROOT) if name.endswith('.html'))
+
+def send_artifact(filename, kind=None, **kwargs):
+    """생성 파일 저장소 색인에 있는 파일만 제공 (없거나 만료되면 404)"""
+    entry = artifact_store.get(filename)
+    if entry is None or (kind and entry['kind'] != kind):
+        return {'error': '페이지를 찾을 수 없습니다'}, 404
+    return send_from_directory(artifact_store.directory, filename, **kwargs)
+
+# 캐시된 지도 HTML 파일 서빙 (/api/map/folium 결과)
+@main_bp.route('/maps/<path:filename>')
+def serve_cached_map(filename):
+    """저장소의 지도 HTML 파일 제공 (파일명이 내용 해시라 오래 캐시해도 안전)"""
+    if not filename.endswith('.html'):
+        return {'error': '페이지를 찾을 수 없습니다'}, 404
+    return send_artifact(filename, kind='map', max_age=86400)
+
+# 내보낸 Excel 파일 다운로드 (/api/export/excel 결과)
+@main_bp.route('/downloads/<path:filename>')
+def serve_export_file(filename):
+    """저장소의 내보내기 파일을 첨부 파일로 제공"""
+    return send_artifact(filename, kind='export', as_attachment=True)
+
 # 생성된 지도 HTML 파일 서빙
 @main_bp.route('/<path:filename>')
 def serve_generated_file(filename):
-    """생성된 지도 HTML 파일 제공"""
+    """생성된 지도 HTML 파일 제공 (저장소 색인 또는 기존 루트 페이지 목록에 있는 파일만)"""
     # .html 파일만 허용
     if not filename.endswith('.html'):
         return {'error': '페이지를 찾을 수 없습니다'}, 404
     
-    # 프로젝트 루트 디렉토리에서 파일 찾기
-    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-    file_path = os.path.join(root_dir, filename)
-    
-    if os.path.exists(file_path):
-        return send_from_directory(root_dir, filename)
+    if filename in LEGACY_ROOT_PAGES:
+        return send_from_directory(PROJECT_ROOT, filename)
     
-    return {'error': '페이지를 찾을 수 없습니다'}, 404
+    return send_artifact(filename)
 
 # 인증 관련 라우트
 @main_bp.route('/login', methods=['GET', 'POST'])
@@ -0,0 +1,361 @@
+"""
+Artifact Store
+생성 파일(지도 HTML, Excel 등)을 한 폴더에 모아 색인, 보존 기간(TTL), 전체 용량 상한으로 관리
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+# 프로젝트 루트의 generated_maps 폴더 (ARTIFACT_DIR 설정으로 변경)
+DEFAULT_ARTIFACT_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..', 'generated_maps')
+)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512MB
+DEFAULT_TTL = 7 * 24 * 3600  # 마지막 접근 후 7일
+
+INDEX_FILENAME = 'index.json'
+# 색인에 종류가 기록되지 않은 파일(다른 프로세스가 쓴 직후, 색인 없이 남은 파일)의 확장자별 종류
+# (/maps는 'map', /downloads는 'export'만 제공하므로 어느 프로세스가 읽어도 같은 종류가 되어야 함)
+KIND_BY_EXTENSION = {'html': 'map', 'xlsx': 'export'}
+TEMP_SUFFIX = '.tmp'
+# 접근 시각만 바뀐 색인은 이 간격(초)마다 한 번만 디스크에 기록
+INDEX_SAVE_INTERVAL = 60
+# 다른 프로세스가 쓰는 중일 수 있으므로 이보다 오래된 임시 파일만 정리
+STALE_TEMP_AGE = 3600
+
+
+class ArtifactStore:
+    """
+    생성 파일 저장소
+
+    - 폴더의 index.json에 파일별 크기/생성 시각/마지막 접근 시각/종류를 기록
+    - 조회(get, contains)는 메모리 색인을 확인하고, 색인에 없을 때만 파일을 한 번 stat해
+      다른 서버 프로세스가 쓴 파일을 등록 (요청마다 폴더를 뒤지지 않음)
+    - 여러 프로세스가 같은 폴더를 쓰므로 색인을 저장하기 전에 index.json이 바뀌었으면(수정 시각)
+      다시 읽어 합침 (다른 프로세스가 등록한 파일을 덮어쓰지 않음)
+    - 쓰기(write)는 임시 파일에 쓴 뒤 os.replace로 교체 (반쯤 쓰인 파일을 내보내지 않음)
+    - 마지막 접근 후 ttl초가 지난 파일을 먼저 지우고, 그래도 max_bytes를 넘으면
+      가장 오래 쓰지 않은 파일부터 삭제 (LRU)
+    - 색인은 처음 사용할 때 읽고 폴더 내용과 맞춤 (없는 파일은 제거, 색인에 없는 파일은 등록)
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl: float = DEFAULT_TTL):
+        self.directory = directory or DEFAULT_ARTIFACT_DIR
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+        self._saved_at = 0.0
+        self._index_mtime: Optional[int] = None  # 마지막으로 읽거나 쓴 index.json의 수정 시각(ns)
+        self._counters = {'writes': 0, 'hits': 0, 'misses': 0, 'evictions': 0, 'evicted_bytes': 0}
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    def configure(self, directory: Optional[str] = None, max_bytes: Optional[int] = None,
+                  ttl: Optional[float] = None) -> None:
+        """폴더/상한 변경 (폴더가 바뀌면 색인을 다시 읽음)"""
+        with self._lock:
+            if directory and os.path.abspath(directory) != os.path.abspath(self.directory):
+                self.directory = directory
+                self._entries = None
+            if max_bytes is not None:
+                self.max_bytes = int(max_bytes)
+            if ttl is not None:
+                self.ttl = float(ttl)
+
+    def path(self, name: str) -> str:
+        """저장소 안의 파일 경로"""
+        return os.path.join(self.directory, self._check_name(name))
+
+    def contains(self, name: str) -> bool:
+        """색인에 등록된 (만료되지 않은) 파일인지 확인 (접근 시각은 갱신하지 않음)"""
+        with self._lock:
+            entry = self._lookup(name)
+            return entry is not None and not self._expired(entry, time.time())
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        파일 조회 (LRU 순서를 위해 접근 시각 갱신)
+
+        Returns:
+            {'name', 'path', 'size', 'kind', 'created', 'last_access'}, 없거나 만료되면 None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._lookup(name)
+            if entry is None or self._expired(entry, now):
+                self._counters['misses'] += 1
+                return None
+            entry['last_access'] = now
+            self._counters['hits'] += 1
+            self._dirty = True
+            if now - self._saved_at >= INDEX_SAVE_INTERVAL:
+                self._save()
+            return dict(entry, name=name, path=os.path.join(self.directory, name))
+
+    def write(self, name: str, writer: Callable[[str], Any], kind: str = '') -> str:
+        """
+        writer(임시 경로)로 파일을 만든 뒤 원자적으로 교체하고 색인에 등록
+
+        Returns:
+            최종 파일 경로
+        """
+        filepath = self.path(name)
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f'{filepath}.{os.getpid()}.{threading.get_ident()}{TEMP_SUFFIX}'
+        try:
+            writer(temp_path)
+            os.replace(temp_path, filepath)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self.add(name, kind)
+        return filepath
+
+    def add(self, name: str, kind: str = '') -> Dict[str, Any]:
+        """
+        이미 저장소 폴더에 만들어진 파일을 색인에 등록 (작업 프로세스가 쓴 파일 등)
+
+        등록 후 TTL/용량 상한을 적용하며, 방금 등록한 파일은 지우지 않는다.
+        """
+        stat = os.stat(self.path(name))
+        now = time.time()
+        with self._lock:
+            entries = self._load()
+            entries[name] = {
+                'size': stat.st_size,
+                'kind': kind or self._kind(name),
+                'created': now,
+                'last_access': now,
+            }
+            self._counters['writes'] += 1
+            self._evict(now, keep=name)
+            self._save()
+            return dict(entries[name], name=name, path=os.path.join(self.directory, name))
+
+    def remove(self, name: str) -> bool:
+        """파일 삭제 및 색인에서 제거"""
+        with self._lock:
+            entry = self._load().pop(name, None)
+            if entry is None:
+                return False
+            self._delete_file(name)
+            self._save()
+            return True
+
+    def evict(self) -> List[str]:
+        """TTL/용량 상한 적용 (삭제한 파일 이름 목록)"""
+        with self._lock:
+            self._load()
+            evicted = self._evict(time.time())
+            if evicted:
+                self._save()
+            return evicted
+
+    def entries(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """색인 목록 (최근 접근 순)"""
+        with self._lock:
+            items = [dict(entry, name=name) for name, entry in self._load().items()
+                     if kind is None or entry['kind'] == kind]
+        return sorted(items, key=lambda entry: entry['last_access'], reverse=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """파일 수, 전체 크기, 상한, 카운터"""
+        with self._lock:
+            entries = self._load()
+            result = dict(self._counters)
+            result.update({
+                'directory': self.directory,
+                'files': len(entries),
+                'total_bytes': sum(entry['size'] for entry in entries.values()),
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+            })
+            return result
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _check_name(name: str) -> str:
+        # 저장소는 평평한 폴더 하나만 사용 (경로 조작 방지)
+        if not name or name != os.path.basename(name) or name.startswith('.') \
+                or name == INDEX_FILENAME or name.endswith(TEMP_SUFFIX):
+            raise ValueError(f'잘못된 파일 이름입니다: {name}')
+        return name
+
+    @staticmethod
+    def _kind(name: str) -> str:
+        extension = os.path.splitext(name)[1].lstrip('.').lower()
+        return KIND_BY_EXTENSION.get(extension, extension)
+
+    def _expired(self, entry: Mapping[str, Any], now: float) -> bool:
+        return bool(self.ttl) and now - entry['last_access'] > self.ttl
+
+    def _lookup(self, name: str) -> Optional[Dict[str, Any]]:
+        """색인 항목 조회 - 없으면 파일을 한 번 stat해 다른 프로세스가 쓴 파일을 등록"""
+        entries = self._load()
+        entry = entries.get(name)
+        if entry is not None:
+            return entry
+        try:
+            stat = os.stat(self.path(name))
+        except (ValueError, OSError):
+            return None
+        # 다른 프로세스가 쓴 파일이면 그 프로세스가 기록한 색인 항목(종류 포함)을 먼저 합침
+        self._merge_index()
+        entry = entries.get(name)
+        if entry is not None:
+            return entry
+        entry = entries[name] = {'size': stat.st_size, 'kind': self._kind(name),
+                                 'created': stat.st_mtime, 'last_access': stat.st_mtime}
+        self._dirty = True
+        return entry
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """index.json의 항목 (없거나 읽을 수 없으면 빈 색인)"""
+        index_path = os.path.join(self.directory, INDEX_FILENAME)
+        try:
+            self._index_mtime = os.stat(index_path).st_mtime_ns
+            with open(index_path, encoding='utf-8') as f:
+                return json.load(f).get('entries', {})
+        except FileNotFoundError:
+            self._index_mtime = None
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"생성 파일 색인 읽기 오류: {e}")
+        return {}
+
+    def _merge_index(self) -> None:
+        """
+        다른 프로세스가 index.json을 바꿨으면 메모리 색인에 합침
+
+        - 한쪽 색인에만 있는 항목은 파일이 남아 있을 때만 유지 (다른 프로세스가 쓰거나 지운 파일 반영)
+        - 양쪽에 있으면 더 나중에 만든 항목을 쓰고 접근 시각은 더 최근 값으로
+        """
+        try:
+            mtime = os.stat(os.path.join(self.directory, INDEX_FILENAME)).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._index_mtime:
+            return
+        disk = self._read_index()
+        entries = self._entries
+        for name in set(disk) ^ set(entries):
+            if not os.path.exists(os.path.join(self.directory, name)):
+                entries.pop(name, None)
+            elif name in disk:
+                entries[name] = disk[name]
+        for name in set(disk) & set(entries):
+            ours, theirs = entries[name], disk[name]
+            if theirs['created'] > ours['created']:
+                entries[name] = dict(theirs, last_access=max(ours['last_access'], theirs['last_access']))
+            else:
+                ours['last_access'] = max(ours['last_access'], theirs['last_access'])
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """색인 읽기 + 폴더 내용과 맞춤 (처음 한 번만)"""
+        if self._entries is not None:
+            return self._entries
+
+        entries = self._read_index()
+
+        files = {}
+        now = time.time()
+        if os.path.isdir(self.directory):
+            for item in os.scandir(self.directory):
+                if not item.is_file() or item.name == INDEX_FILENAME:
+                    continue
+                stat = item.stat()
+                if item.name.endswith(TEMP_SUFFIX):
+                    if now - stat.st_mtime > STALE_TEMP_AGE:
+                        self._delete_file(item.name)
+                    continue
+                files[item.name] = stat
+
+        reconciled = {}
+        for name, stat in files.items():
+            entry = entries.get(name)
+            if entry is None:
+                # 색인 없이 남은 파일 (이전 버전이 만든 파일 등)은 수정 시각으로 등록
+                entry = {'kind': self._kind(name), 'created': stat.st_mtime, 'last_access': stat.st_mtime}
+            entry['size'] = stat.st_size
+            reconciled[name] = entry
+
+        self._entries = reconciled
+        self._dirty = reconciled != entries
+        self._evict(now)
+        if self._dirty:
+            self._save()
+        return self._entries
+
+    def _evict(self, now: float, keep: Optional[str] = None) -> List[str]:
+        entries = self._entries
+        evicted = [name for name, entry in entries.items()
+                   if name != keep and self._expired(entry, now)]
+        total = sum(entry['size'] for name, entry in entries.items() if name not in evicted)
+        if self.max_bytes and total > self.max_bytes:
+            for name, entry in sorted(entries.items(), key=lambda item: item[1]['last_access']):
+                if total <= self.max_bytes:
+                    break
+                if name == keep or name in evicted:
+                    continue
+                evicted.append(name)
+                total -= entry['size']
+
+        for name in evicted:
+            entry = entries.pop(name)
+            self._delete_file(name)
+            self._counters['evictions'] += 1
+            self._counters['evicted_bytes'] += entry['size']
+        if evicted:
+            self._dirty = True
+        return evicted
+
+    def _delete_file(self, name: str) -> None:
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"생성 파일 삭제 오류: {e}")
+
+    def _save(self) -> None:
+        """색인을 임시 파일에 쓴 뒤 교체 (다른 프로세스가 바꾼 색인은 먼저 합침)"""
+        if not os.path.isdir(self.directory):
+            if not self._entries:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+        self._merge_index()
+        index_path = os.path.join(self.directory, INDEX_FILENAME)
+        temp_path = f'{index_path}.{os.getpid()}.{threading.get_ident()}{TEMP_SUFFIX}'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'entries': self._entries}, f, ensure_ascii=False)
+            os.replace(temp_path, index_path)
+            self._index_mtime = os.stat(index_path).st_mtime_ns
+            self._dirty = False
+            self._saved_at = time.time()
+        except OSError as e:
+            print(f"생성 파일 색인 저장 오류: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+# 애플리케이션 공유 저장소
+artifact_store = ArtifactStore(os.environ.get('ARTIFACT_DIR') or os.environ.get('MAP_CACHE_DIR') or None)
+
+
+def configure_artifact_store(config: Optional[Mapping[str, Any]] = None) -> None:
+    """앱 설정(app.config)으로 공유 저장소 설정"""
+    config = config or {}
+    artifact_store.configure(
+        directory=config.get('ARTIFACT_DIR') or config.get('MAP_CACHE_DIR'),
+        max_bytes=config.get('ARTIFACT_MAX_BYTES'),
+        ttl=config.get('ARTIFACT_TTL'),
+    )
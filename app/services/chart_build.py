@@ -0,0 +1,432 @@
+"""
+Chart Build Service
+차트 원천 테이블을 한 번씩만 읽고 입력이 바뀐 Plotly HTML, 정적 이미지, 차트 앱 데이터만 작업 프로세스에서 병렬 생성
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from ..models.usage_rollup import UsageRollup
+from .plotly_runtime import ensure_plotly_runtime
+from .chart_figures import (
+    aggregate_usage, build_chart_data, build_sync_info, correlation_heatmap_chart,
+    facility_bar_chart, facility_trend_chart, pivot_bar_chart, regional_bar_chart,
+    regional_trend_chart, scatter_matrix_chart, yearly_area_chart, yearly_pie_chart,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+# 차트 앱 폴더 (Chart/public/*.html, Chart/data/...)
+CHART_DIR = PROJECT_ROOT / 'Chart'
+# /chart3~/chart7 라우트가 내보내는 폴더 (Plotly HTML을 같이 저장)
+PUBLIC_DIR = PROJECT_ROOT / 'public'
+
+# 대상별 입력 fingerprint 기록 (Chart 폴더 기준)
+MANIFEST_FILENAME = 'chart_build_manifest.json'
+
+# Plotly HTML 저장 옵션
+HTML_WRITE_OPTIONS = {'include_plotlyjs': 'cdn', 'config': {'responsive': True}}
+
+# Plotly 차트 출력 형식
+# 'html' 단독 HTML (차트마다 plotly.js 로드), 'spec' Figure spec JSON만 (공유 페이지가 plotly.js 한 번 로드), 'both' 둘 다
+FIGURE_FORMATS = ('html', 'spec', 'both')
+# public 폴더 안의 Figure spec / 공유 plotly.js 폴더
+SPEC_DIRNAME = 'specs'
+RUNTIME_DIRNAME = 'vendor'
+
+# 기본 작업 프로세스 수 상한 (대상이 13개라 그 이상은 이득이 적음)
+MAX_DEFAULT_WORKERS = 4
+
+# 대상 이름 -> (원천, 형식, 생성 함수, 출력 경로 (Chart 폴더 기준))
+# 원천: 'facility' 연도별 위탁병원 현황 DataFrame, 'usage' 이용인원 롤업, 'raw' 원본 이용인원 DataFrame
+# 형식: 'html' Plotly Figure, 'image' matplotlib Figure, 'json' dict
+CHART_TARGETS: Dict[str, Tuple[str, str, Callable[[Any], Any], str]] = {
+    'chart1_regional_yearly': ('facility', 'html', facility_bar_chart, 'public/chart1_regional_yearly.html'),
+    'chart2_yearly_trend': ('facility', 'html', facility_trend_chart, 'public/chart2_yearly_trend.html'),
+    'chart3_scatter_matrix': ('raw', 'html', scatter_matrix_chart, 'public/chart3_scatter_matrix.html'),
+    'chart3_correlation_heatmap': ('raw', 'html', correlation_heatmap_chart,
+                                   'public/chart3_correlation_heatmap.html'),
+    'chart3_regional_trend': ('usage', 'html', regional_trend_chart, 'public/chart3_regional_trend.html'),
+    'chart4_yearly_area': ('usage', 'html', yearly_area_chart, 'public/chart4_yearly_area.html'),
+    'chart5_regional_bar': ('usage', 'html', regional_bar_chart, 'public/chart5_regional_bar.html'),
+    'chart6_pivot_bar': ('usage', 'html', pivot_bar_chart, 'public/chart6_pivot_bar.html'),
+    'chart7_pie_subplots': ('usage', 'html', yearly_pie_chart, 'public/chart7_pie_subplots.html'),
+    'image1': ('facility', 'image', 'facility_bar_image', 'data/images/1.JPG'),
+    'image2': ('facility', 'image', 'facility_pie_image', 'data/images/2.JPG'),
+    'chartData': ('usage', 'json', build_chart_data, 'data/chartData.json'),
+    'chart_sync_info': ('facility', 'json', build_sync_info, 'data/chart_sync_info.json'),
+}
+
+
+def select_targets(names: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    생성할 대상 이름 (CHART_TARGETS 순서)
+
+    Args:
+        names: 대상 이름 또는 접두어 ('chart3'이면 chart3_* 전체, 기본: 전체)
+    """
+    if not names:
+        return list(CHART_TARGETS)
+    names = list(names)
+    unknown = [name for name in names
+               if not any(target == name or target.startswith(name + '_') for target in CHART_TARGETS)]
+    if unknown:
+        raise ValueError(f"알 수 없는 차트: {', '.join(unknown)}")
+    return [target for target in CHART_TARGETS
+            if any(target == name or target.startswith(name + '_') for name in names)]
+
+
+@lru_cache(maxsize=None)
+def code_version(kind: str) -> str:
+    """
+    형식별 생성 코드 버전 (Figure 생성 모듈 소스 + 라이브러리 버전 + 저장 옵션 해시)
+
+    chart_figures.py/chart_images.py를 고치거나 plotly/matplotlib을 올리면 값이 바뀜
+    """
+    services = Path(__file__).resolve().parent
+    modules = ['chart_figures.py'] + (['chart_images.py'] if kind == 'image' else [])
+    digest = hashlib.sha1(kind.encode('utf-8'))
+    for module in modules:
+        digest.update((services / module).read_bytes())
+    library = {'html': 'plotly', 'image': 'matplotlib'}.get(kind)
+    if library:
+        digest.update(f'{library}=={metadata.version(library)}'.encode('utf-8'))
+    if kind == 'html':
+        digest.update(json.dumps(HTML_WRITE_OPTIONS, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """DataFrame 내용 해시 (컬럼 이름과 모든 값)"""
+    digest = hashlib.sha1(json.dumps([str(column) for column in df.columns], ensure_ascii=False).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _resolve_builder(builder):
+    # matplotlib은 이미지 대상이 있을 때만 (작업 프로세스 안에서) 불러옴
+    if isinstance(builder, str):
+        from . import chart_images
+        return getattr(chart_images, builder)
+    return builder
+
+
+def _write_output(output_format: str, result: Any, temp_path: str) -> None:
+    if output_format == 'html':
+        result.write_html(temp_path, **HTML_WRITE_OPTIONS)
+    elif output_format == 'spec':
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(result.to_json())
+    elif output_format == 'image':
+        from matplotlib import pyplot as plt
+        from .chart_images import SAVE_OPTIONS
+        try:
+            result.savefig(temp_path, **SAVE_OPTIONS)
+        finally:
+            plt.close(result)
+    else:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+def build_chart_file(builder, source: Any, outputs: List[Tuple[str, List[str]]]) -> Dict[str, Any]:
+    """
+    차트 하나를 만들어 형식별로 저장 (작업 프로세스에서 실행)
+
+    형식마다 첫 경로에 쓰고 나머지 경로로 복사하며, 임시 파일에 쓴 뒤 os.replace로 교체하므로
+    서비스 중인 파일이 반쯤 쓰인 상태로 보이지 않음
+
+    Args:
+        outputs: [(형식 'html'|'spec'|'image'|'json', [저장 경로])]
+
+    Returns:
+        {'seconds': 생성+저장 시간, 'bytes': 형식별 첫 파일 크기 합}
+    """
+    started = time.perf_counter()
+    result = _resolve_builder(builder)(source)
+
+    size = 0
+    for output_format, paths in outputs:
+        path = Path(paths[0])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = str(path) + '.tmp'
+        _write_output(output_format, result, temp_path)
+        os.replace(temp_path, path)
+        size += path.stat().st_size
+
+        for mirror in paths[1:]:
+            Path(mirror).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, mirror + '.tmp')
+            os.replace(mirror + '.tmp', mirror)
+    return {'seconds': round(time.perf_counter() - started, 3), 'bytes': size}
+
+
+class ChartBuilder:
+    """
+    차트 일괄 생성기
+
+    - 선택한 대상에 필요한 원천만, 원천마다 한 번씩 읽음
+      (원본 이용인원 행을 읽으면 롤업은 그 행에서 집계, 롤업만 필요하면 DB의 월별 합계만 조회)
+    - 대상마다 Figure 생성과 파일 저장을 작업 프로세스에 나눠 맡겨 전체 시간이
+      차트 시간의 합이 아닌 가장 느린 차트 시간에 가깝도록 함
+    - Plotly 차트는 figure_format에 따라 단독 HTML과/또는 Figure spec JSON으로 Chart/public과 public/ 양쪽에 저장
+      (spec을 만들면 공유 페이지용 plotly.js도 public/vendor에 저장)
+    - 대상마다 입력 fingerprint (원천 내용 해시 + 생성 코드 버전)를 매니페스트에 기록하고
+      다음 실행에서는 fingerprint가 바뀌었거나 파일이 없는 대상만 다시 생성
+      (이용인원은 DB 월별 합계 롤업의 fingerprint를 테이블 체크섬으로 사용하므로
+       원본 행은 그 행을 쓰는 차트를 다시 만들 때만 읽음)
+    """
+
+    def __init__(self, repository=None, csv_path: Optional[str] = None,
+                 chart_dir: Optional[str] = None, public_dir: Optional[str] = None,
+                 workers: Optional[int] = None, figure_format: str = 'both'):
+        if figure_format not in FIGURE_FORMATS:
+            raise ValueError(f"알 수 없는 차트 형식: {figure_format}")
+        self._repository = repository
+        # 원본 이용인원 CSV (지정하면 이용인원은 DB 대신 CSV에서 읽음)
+        self.csv_path = csv_path
+        self.chart_dir = Path(chart_dir) if chart_dir else CHART_DIR
+        # 빈 문자열이면 public/ 복사 생략
+        self.public_dir = PUBLIC_DIR if public_dir is None else (Path(public_dir) if public_dir else None)
+        # 0이면 작업 프로세스 없이 현재 프로세스에서 차례로 생성
+        self.workers = min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS) if workers is None else workers
+        self.figure_format = figure_format
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.chart_dir / MANIFEST_FILENAME
+
+    def read_manifest(self) -> Dict[str, Any]:
+        """대상 이름 -> {'fingerprint', 'inputs', 'built_at', 'seconds', 'bytes'}"""
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"차트 매니페스트 읽기 오류: {e}")
+            return {}
+
+    def outputs(self, name: str) -> List[Tuple[str, List[str]]]:
+        """대상의 [(형식, [저장 경로])] (형식마다 첫 번째가 원본, 나머지는 public/ 복사본)"""
+        kind, relative = CHART_TARGETS[name][1], Path(CHART_TARGETS[name][3])
+        if kind != 'html':
+            return [(kind, [str(self.chart_dir / relative)])]
+
+        outputs = []
+        for output_format in (('html', 'spec') if self.figure_format == 'both' else (self.figure_format,)):
+            filename = relative.name if output_format == 'html' else str(Path(SPEC_DIRNAME, relative.stem + '.json'))
+            paths = [str(self.chart_dir / relative.parent / filename)]
+            if self.public_dir is not None:
+                paths.append(str(self.public_dir / filename))
+            outputs.append((output_format, paths))
+        return outputs
+
+    def output_paths(self, name: str) -> List[str]:
+        """대상의 모든 저장 경로"""
+        return [path for _, paths in self.outputs(name) for path in paths]
+
+    def load_sources(self, needed: Iterable[str], timings: Optional[Dict[str, float]] = None,
+                     errors: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        필요한 원천을 한 번씩 로드
+
+        Args:
+            needed: 원천 이름 ('facility', 'usage', 'raw')
+            timings: 원천별 로드 시간을 기록할 dict
+            errors: 로드에 실패한 원천의 오류를 기록할 dict (None이면 예외 전달)
+        """
+        needed = set(needed)
+        if 'usage' in needed and self.csv_path:
+            # CSV에는 월별 합계가 없으므로 원본 행을 읽어 집계
+            needed.add('raw')
+        timings = {} if timings is None else timings
+        sources: Dict[str, Any] = {}
+        loaders = [
+            ('facility', self._load_facility),
+            ('raw', self._load_raw),
+            ('usage', lambda: aggregate_usage(sources['raw']) if 'raw' in sources
+             else UsageRollup(self._get_repository().load_monthly_totals())),
+        ]
+        for name, loader in loaders:
+            if name not in needed:
+                continue
+            started = time.perf_counter()
+            try:
+                sources[name] = loader()
+            except Exception as e:
+                if errors is None:
+                    raise
+                print(f"차트 원천 로드 오류 ({name}): {e}")
+                errors[name] = str(e)
+                continue
+            timings[name] = round(time.perf_counter() - started, 3)
+        return sources
+
+    def run(self, names: Optional[Iterable[str]] = None,
+            sources: Optional[Mapping[str, Any]] = None, force: bool = False) -> Dict[str, Any]:
+        """
+        입력이 바뀐 차트만 생성
+
+        Args:
+            names: 생성할 대상 이름/접두어 (기본: 전체)
+            sources: 미리 읽어 둔 원천 (없는 원천만 로드)
+            force: fingerprint와 관계없이 모두 다시 생성
+
+        Returns:
+            {'built': [{'name', 'path', 'seconds', 'bytes'}], 'skipped': [이름],
+             'failed': [{'name', 'error'}], 'load': {원천: 초}, 'workers', 'elapsed'}
+        """
+        started = time.monotonic()
+        targets = select_targets(names)
+        sources = dict(sources or {})
+        load_timings: Dict[str, float] = {}
+        errors: Dict[str, str] = {}
+        summary: Dict[str, Any] = {'built': [], 'skipped': [], 'failed': [], 'load': load_timings}
+
+        # 1) 변경 여부 판단용 원천 로드 (원본 행은 롤업으로 대신 판단)
+        needed = {CHART_TARGETS[name][0] for name in targets}
+        markers = {'usage' if name == 'raw' and 'raw' not in sources else name for name in needed}
+        sources.update(self.load_sources(markers - set(sources), load_timings, errors))
+        source_fingerprints = {name: self._source_fingerprint(name, sources) for name in needed}
+
+        # 2) fingerprint가 같고 파일이 모두 있는 대상은 건너뜀
+        manifest = self.read_manifest()
+        stale = []
+        for name in targets:
+            source_name, kind = CHART_TARGETS[name][:2]
+            if source_fingerprints[source_name] is None:
+                error = errors.get(source_name) or errors.get('usage', '')
+                summary['failed'].append({'name': name, 'error': f"원천 로드 실패: {error}"})
+                continue
+            inputs = {source_name: source_fingerprints[source_name], 'code': code_version(kind)}
+            if kind == 'html':
+                inputs['format'] = self.figure_format
+            fingerprint = hashlib.sha1(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+            entry = manifest.get(name) or {}
+            if (not force and entry.get('fingerprint') == fingerprint
+                    and all(os.path.exists(path) for path in self.output_paths(name))):
+                summary['skipped'].append(name)
+                continue
+            stale.append((name, fingerprint, inputs))
+
+        # 3) 다시 만들 대상에만 필요한 원천 (원본 행) 로드 후 생성
+        missing = {CHART_TARGETS[name][0] for name, _, _ in stale} - set(sources)
+        sources.update(self.load_sources(missing, load_timings, errors))
+        jobs = []
+        for name, _, _ in stale:
+            source_name, kind, builder, _ = CHART_TARGETS[name]
+            if source_name not in sources:
+                summary['failed'].append({'name': name, 'error': f"원천 로드 실패: {errors.get(source_name, '')}"})
+                continue
+            jobs.append((name, (builder, sources[source_name], self.outputs(name))))
+
+        workers = min(self.workers, len(jobs))
+        if workers <= 0 or len(jobs) == 1:
+            workers = 0
+            self._build_here(jobs, summary)
+        else:
+            self._build_in_workers(jobs, workers, summary)
+
+        order = {name: i for i, name in enumerate(targets)}
+        summary['built'].sort(key=lambda item: order[item['name']])
+        if self.public_dir is not None and self.figure_format != 'html' and any(
+                CHART_TARGETS[name][1] == 'html' for name in targets):
+            try:
+                ensure_plotly_runtime(self.public_dir / RUNTIME_DIRNAME)
+            except Exception as e:
+                print(f"plotly.js 저장 오류: {e}")
+        if summary['built']:
+            self._update_manifest(manifest, summary['built'], {name: (fp, inputs) for name, fp, inputs in stale})
+        summary['workers'] = workers
+        summary['elapsed'] = round(time.monotonic() - started, 3)
+        return summary
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _get_repository(self):
+        if self._repository is None:
+            from ..repositories.usage_repository import UsageRepository
+            self._repository = UsageRepository()
+        return self._repository
+
+    @staticmethod
+    def _source_fingerprint(name: str, sources: Mapping[str, Any]) -> Optional[str]:
+        """원천 내용 해시 (원본 행을 아직 읽지 않았으면 DB 월별 합계 롤업 해시, 로드 실패면 None)"""
+        if name in sources:
+            source = sources[name]
+            return source.fingerprint if isinstance(source, UsageRollup) else frame_fingerprint(source)
+        if name == 'raw' and 'usage' in sources:
+            return 'usage:' + sources['usage'].fingerprint
+        return None
+
+    def _update_manifest(self, manifest: Dict[str, Any], built: List[Dict[str, Any]],
+                         fingerprints: Mapping[str, Tuple[str, Dict[str, str]]]) -> None:
+        """생성한 대상의 fingerprint 기록 (임시 파일에 쓴 뒤 교체)"""
+        built_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        for item in built:
+            fingerprint, inputs = fingerprints[item['name']]
+            manifest[item['name']] = {
+                'fingerprint': fingerprint,
+                'inputs': inputs,
+                'built_at': built_at,
+                'seconds': item['seconds'],
+                'bytes': item['bytes'],
+            }
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = str(self.manifest_path) + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(temp_path, self.manifest_path)
+        except Exception as e:
+            print(f"차트 매니페스트 저장 오류: {e}")
+
+    def _load_facility(self) -> pd.DataFrame:
+        return pd.DataFrame(self._get_repository().load_facility_counts())
+
+    def _load_raw(self) -> pd.DataFrame:
+        if self.csv_path:
+            return pd.read_csv(self.csv_path, usecols=['연도', '월', '연월', '광역지자체', '광역지자체코드', '인원'])
+        return pd.DataFrame(self._get_repository().load_usage_rows())
+
+    @staticmethod
+    def _record(summary: Dict[str, Any], name: str, outputs, result: Dict[str, Any]) -> None:
+        # 대표 경로: 첫 형식의 원본 파일
+        summary['built'].append({'name': name, 'path': outputs[0][1][0], **result})
+
+    def _build_here(self, jobs: List[Tuple[str, tuple]], summary: Dict[str, Any]) -> None:
+        for name, args in jobs:
+            try:
+                result = build_chart_file(*args)
+            except Exception as e:
+                summary['failed'].append({'name': name, 'error': str(e)})
+                continue
+            self._record(summary, name, args[2], result)
+
+    def _build_in_workers(self, jobs: List[Tuple[str, tuple]], workers: int, summary: Dict[str, Any]) -> None:
+        # 웹 서버 스레드가 있는 프로세스를 fork하지 않도록 spawn으로 작업 프로세스 시작
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = {executor.submit(build_chart_file, *args): (name, args) for name, args in jobs}
+            for future in as_completed(futures):
+                name, args = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    summary['failed'].append({'name': name, 'error': str(e)})
+                    continue
+                self._record(summary, name, args[2], result)
@@ -0,0 +1,457 @@
+"""
+Chart Figures
+위탁병원 이용인원 롤업과 연도별 위탁병원 현황으로 Plotly Figure / 차트 앱 데이터(chartData.json) 생성
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from ..models.usage_rollup import UsageRollup
+
+# 이용인원 집계 단위 (연도, 월, 광역지자체별 인원 합계와 원본 행 수)
+USAGE_COLUMNS = ['연도', '월', '광역지자체', '인원', '건수']
+# 산점도 행렬/상관관계 차트에 쓰는 원본 이용인원 숫자 컬럼
+RAW_USAGE_COLUMNS = ['연도', '월', '연월', '광역지자체코드', '인원']
+
+
+def aggregate_usage(raw: pd.DataFrame) -> UsageRollup:
+    """원본 이용인원 행(CSV, SELECT *)을 연도/월/광역지자체별 합계로 집계한 롤업"""
+    df = raw[['연도', '월', '광역지자체', '인원']].copy()
+    df['인원'] = pd.to_numeric(df['인원'], errors='coerce').fillna(0)
+    df['연도'] = pd.to_numeric(df['연도'], errors='coerce')
+    df['월'] = pd.to_numeric(df['월'], errors='coerce')
+    df = df.dropna(subset=['연도', '월'])
+    grouped = df.groupby(['연도', '월', '광역지자체'], as_index=False).agg(
+        인원=('인원', 'sum'), 건수=('인원', 'size'))
+    grouped['연도'] = grouped['연도'].astype(int)
+    grouped['월'] = grouped['월'].astype(int)
+    return UsageRollup(grouped[USAGE_COLUMNS].itertuples(index=False))
+
+
+def facility_year_columns(facility: pd.DataFrame) -> List[str]:
+    """연도별 현황 테이블의 연말 기준 컬럼 ('2022년12월', ...)"""
+    return sorted(str(column) for column in facility.columns if str(column).endswith('년12월'))
+
+
+def usage_period_label(usage: UsageRollup) -> str:
+    """이용 기간 표시 ('2023년3월 ~ 2025년4월')"""
+    periods = usage.periods
+    if not periods:
+        return '-'
+    (first_year, first_month), (last_year, last_month) = periods[0], periods[-1]
+    return f'{first_year}년{first_month}월 ~ {last_year}년{last_month}월'
+
+
+def _year_regions(usage: UsageRollup) -> pd.DataFrame:
+    return pd.DataFrame(usage.year_regions(), columns=['연도', '광역지자체', '인원', '건수'])
+
+
+def _region_totals(usage: UsageRollup) -> pd.Series:
+    """광역지자체별 전체 기간 인원 (이름 순)"""
+    return pd.DataFrame(usage.regions(), columns=['광역지자체', '인원', '건수']).set_index('광역지자체')['인원']
+
+
+# ----------------------------------------------------------------------
+# 연도별 위탁병원 현황 (Chart 1, 2)
+# ----------------------------------------------------------------------
+def facility_bar_chart(facility: pd.DataFrame) -> go.Figure:
+    """Chart 1: 광역지자체별 연도별 위탁병원 현황 막대 차트"""
+    columns = facility_year_columns(facility)
+    chart_df = facility.melt(id_vars=['광역지자체'], value_vars=columns, var_name='연도', value_name='인원')
+
+    fig = px.bar(
+        chart_df,
+        x='광역지자체',
+        y='인원',
+        color='연도',
+        title=f"광역지자체별 연도별 위탁병원 현황 ({columns[0][:4]}~{columns[-1][:4]}년 12월 기준)" if columns
+        else '광역지자체별 연도별 위탁병원 현황',
+        labels={'인원': '병원 수 (개)', '광역지자체': '광역지자체'},
+        barmode='group',
+        color_discrete_sequence=['#1f77b4', '#ff7f0e', '#2ca02c']
+    )
+    fig.update_layout(
+        xaxis_title="광역지자체",
+        yaxis_title="병원 수 (개)",
+        xaxis=dict(tickangle=-45),
+        yaxis=dict(tickformat=','),
+        height=600,
+        width=1100,
+        title_x=0.5,
+        legend_title="연도"
+    )
+    return fig
+
+
+def facility_trend_chart(facility: pd.DataFrame) -> go.Figure:
+    """Chart 2: 연도별 전국 위탁병원 합계 추세 라인 차트"""
+    columns = facility_year_columns(facility)
+    trend_data = pd.DataFrame({
+        '연도': columns,
+        '전체병원수': [pd.to_numeric(facility[column], errors='coerce').fillna(0).sum() for column in columns],
+    })
+
+    fig = px.line(
+        trend_data,
+        x='연도',
+        y='전체병원수',
+        title=f"연도별 전국 위탁병원 전체 현황 추이 ({columns[0][:4]}~{columns[-1][:4]}년 12월 기준)" if columns
+        else '연도별 전국 위탁병원 전체 현황 추이',
+        labels={'전체병원수': '전체 병원 수 (개)', '연도': '연도'},
+        markers=True
+    )
+    fig.update_traces(
+        line=dict(width=4, color='#1f77b4'),
+        marker=dict(size=12, color='#ff7f0e', line=dict(width=2, color='white'))
+    )
+    fig.update_layout(
+        xaxis_title="연도",
+        yaxis_title="전체 병원 수 (개)",
+        yaxis=dict(tickformat=','),
+        height=600,
+        width=1100,
+        hovermode='x unified',
+        title_x=0.5
+    )
+    return fig
+
+
+# ----------------------------------------------------------------------
+# 지역별 위탁병원 이용인원 (Chart 3~7) - 롤업의 미리 합산된 행만 사용
+# ----------------------------------------------------------------------
+def regional_trend_chart(usage: UsageRollup) -> go.Figure:
+    """Chart 3: 상위 10개 지역 월별 이용인원 추이"""
+    top_regions = _region_totals(usage).nlargest(10).index
+    trend = pd.DataFrame(usage.rows(), columns=USAGE_COLUMNS)
+    trend = trend[trend['광역지자체'].isin(top_regions)].reset_index(drop=True)
+    trend['날짜'] = pd.to_datetime(dict(year=trend['연도'], month=trend['월'], day=1))
+
+    fig = px.line(
+        trend[['날짜', '광역지자체', '인원']],
+        x='날짜',
+        y='인원',
+        color='광역지자체',
+        title='상위 10개 지역 위탁병원 이용인원 추이',
+        labels={'인원': '이용인원 (명)', '날짜': '연월'},
+        height=600
+    )
+    fig.update_layout(
+        title_x=0.5,
+        hovermode='x unified',
+        legend=dict(orientation="v", yanchor="top", y=1, xanchor="left", x=1.02)
+    )
+    return fig
+
+
+def yearly_area_chart(usage: UsageRollup) -> go.Figure:
+    """Chart 4: 연도별 월별 이용인원 Area 차트"""
+    yearly_monthly = pd.DataFrame(usage.monthly(), columns=['연도', '월', '인원', '건수'])
+    first_year = yearly_monthly['연도'].min()
+
+    fig = go.Figure()
+    for year in sorted(yearly_monthly['연도'].unique()):
+        year_data = yearly_monthly[yearly_monthly['연도'] == year].sort_values('월')
+        fig.add_trace(go.Scatter(
+            x=year_data['월'],
+            y=year_data['인원'],
+            name=f'{int(year)}년',
+            mode='lines+markers',
+            fill='tonexty' if year != first_year else 'tozeroy',
+            line=dict(width=3),
+            marker=dict(size=8),
+            hovertemplate='%{fullData.name}<br>월: %{x}월<br>인원: %{y:,.0f}명<extra></extra>'
+        ))
+
+    fig.update_layout(
+        title=dict(text='전국 위탁병원 연도별 월별 이용인원 추이', x=0.5, font=dict(size=20)),
+        xaxis=dict(title='월', tickmode='linear', tick0=1, dtick=1, range=[0.5, 12.5],
+                   gridcolor='rgba(128, 128, 128, 0.2)'),
+        yaxis=dict(title='이용인원 (명)', tickformat=',', gridcolor='rgba(128, 128, 128, 0.2)'),
+        hovermode='x unified',
+        width=1600,
+        height=700,
+        plot_bgcolor='white',
+        legend=dict(
+            orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5,
+            bgcolor='rgba(255, 255, 255, 0.95)', bordercolor='rgba(0, 0, 0, 0.3)', borderwidth=2,
+            font=dict(size=12)
+        ),
+        margin=dict(t=100, r=50, l=80, b=120)
+    )
+    return fig
+
+
+def regional_bar_chart(usage: UsageRollup) -> go.Figure:
+    """Chart 5: 광역지자체별 연도별 이용인원 막대 차트"""
+    grouped = _year_regions(usage)
+
+    fig = px.bar(
+        grouped,
+        x="광역지자체",
+        y="인원",
+        color="연도",
+        title=f"광역지자체별 연도별 위탁병원 이용 인원(이용 기간 : {usage_period_label(usage)})",
+        labels={'인원': '이용 인원'},
+        barmode='group',
+        category_orders={"연도": sorted(grouped['연도'].unique())}
+    )
+    fig.update_layout(
+        xaxis_title="광역지자체",
+        yaxis_title="이용 인원",
+        hoverlabel=dict(namelength=-1),
+        hovermode="closest",
+        xaxis=dict(tickangle=-45),
+        height=600,
+        width=1000
+    )
+    return fig
+
+
+def pivot_bar_chart(usage: UsageRollup) -> go.Figure:
+    """Chart 6: 광역지자체별 연도별 Pivot 막대 차트"""
+    grouped = _year_regions(usage)
+    pivot_df = grouped.pivot(index='광역지자체', columns='연도', values='인원').fillna(0)
+
+    fig = go.Figure()
+    for year in sorted(pivot_df.columns):
+        fig.add_trace(go.Bar(
+            name=str(int(year)),
+            x=pivot_df.index,
+            y=pivot_df[year],
+            text=pivot_df[year].apply(lambda x: f'{int(x):,}' if x > 0 else ''),
+            textposition='auto',
+            hovertemplate='%{x}<br>%{fullData.name}년<br>인원: %{y:,.0f}명<extra></extra>'
+        ))
+
+    fig.update_layout(
+        title=f'광역지자체별 이용 인원(이용 기간 : {usage_period_label(usage)})',
+        title_font_size=16,
+        xaxis_title="광역지자체",
+        xaxis_title_font_size=12,
+        yaxis_title="이용 인원 수",
+        yaxis_title_font_size=12,
+        barmode='group',
+        xaxis=dict(tickangle=45, tickmode='linear'),
+        yaxis=dict(tickformat=','),
+        legend=dict(title="연도", orientation="v", yanchor="top", y=1, xanchor="right", x=1),
+        height=600,
+        width=1200,
+        hovermode='closest'
+    )
+    return fig
+
+
+def yearly_pie_chart(usage: UsageRollup) -> go.Figure:
+    """Chart 7: 연도별 광역지자체별 이용인원 비율 파이차트 서브플롯"""
+    grouped = _year_regions(usage)
+    years = sorted(grouped['연도'].unique())
+    rows = int(len(years) ** 0.5) + 1
+    cols = max(1, (len(years) + rows - 1) // rows)
+
+    fig = make_subplots(
+        specs=[[{'type': 'pie'} for _ in range(cols)] for _ in range(rows)],
+        rows=rows,
+        cols=cols,
+        subplot_titles=[f"연도 {int(year)}" for year in years]
+    )
+    for i, year in enumerate(years):
+        year_data = grouped[grouped['연도'] == year].sort_values('인원', ascending=False)
+        fig.add_trace(
+            go.Pie(
+                labels=year_data['광역지자체'],
+                values=year_data['인원'],
+                name=f"연도 {int(year)}",
+                hole=0.4,
+                marker=dict(colors=px.colors.qualitative.Plotly[:len(year_data)]),
+                hoverinfo='label+value',
+                textinfo='label+percent',
+                textposition='inside'
+            ),
+            row=(i // cols) + 1,
+            col=i % cols + 1
+        )
+
+    fig.update_layout(
+        title=f'연도별 광역지자체코드별 위탁병원 이용 인원 비율 파이차트(이용 기간 : {usage_period_label(usage)})',
+        height=1000,
+        width=1200
+    )
+    return fig
+
+
+# ----------------------------------------------------------------------
+# 원본 이용인원 행 (Chart 3 산점도 행렬, 상관관계) - 집계하지 않은 행이 필요한 차트
+# ----------------------------------------------------------------------
+def _numeric_usage(raw: pd.DataFrame) -> pd.DataFrame:
+    num_df = raw[RAW_USAGE_COLUMNS].copy()
+    for column in RAW_USAGE_COLUMNS:
+        num_df[column] = pd.to_numeric(num_df[column], errors='coerce')
+    return num_df.dropna()
+
+
+def scatter_matrix_chart(raw: pd.DataFrame) -> go.Figure:
+    """Chart 3: 연도, 월, 연월, 광역지자체코드, 인원 산점도 행렬"""
+    fig = px.scatter_matrix(
+        _numeric_usage(raw),
+        dimensions=RAW_USAGE_COLUMNS,
+        title='전국 위탁병원 연도, 월, 연월, 인원 상관관계 분석',
+        color='인원',
+        height=800,
+        width=800
+    )
+    fig.update_traces(diagonal_visible=False)
+    fig.update_layout(title_x=0.5)
+    return fig
+
+
+def correlation_heatmap_chart(raw: pd.DataFrame) -> go.Figure:
+    """Chart 3: 변수 간 상관계수 히트맵"""
+    correlation_matrix = _numeric_usage(raw).corr()
+
+    fig = go.Figure(data=go.Heatmap(
+        z=correlation_matrix.values,
+        x=correlation_matrix.columns,
+        y=correlation_matrix.columns,
+        colorscale='RdBu',
+        zmid=0,
+        text=correlation_matrix.values.round(2),
+        texttemplate='%{text}',
+        textfont={"size": 12},
+        colorbar=dict(title="상관계수")
+    ))
+    fig.update_layout(
+        title='전국 위탁병원 변수 간 상관관계 히트맵',
+        title_x=0.5,
+        width=800,
+        height=800,
+        xaxis=dict(title=''),
+        yaxis=dict(title='')
+    )
+    return fig
+
+
+# 차트 ID -> (원천 'usage'(UsageRollup)|'facility'(DataFrame), Figure 생성 함수)
+CHART_FIGURES: Dict[str, Tuple[str, Callable[[Any], go.Figure]]] = {
+    'chart1': ('facility', facility_bar_chart),
+    'chart2': ('facility', facility_trend_chart),
+    'chart3': ('usage', regional_trend_chart),
+    'chart4': ('usage', yearly_area_chart),
+    'chart5': ('usage', regional_bar_chart),
+    'chart6': ('usage', pivot_bar_chart),
+    'chart7': ('usage', yearly_pie_chart),
+}
+
+
+# ----------------------------------------------------------------------
+# React 차트 앱 데이터 (Chart/data/chartData.json)
+# ----------------------------------------------------------------------
+def build_chart_data(usage: UsageRollup) -> Dict[str, Any]:
+    """chartData.json 구조 (Chart 1, 2는 이미지, Chart 3~7은 이용인원 집계)"""
+    chart_data: Dict[str, Any] = {
+        'chart1': {
+            'title': '보훈병원 사용 인원현황1',
+            'type': 'image',
+            'image_path': '/data/images/1.JPG',
+            'description': '보훈병원 사용 인원현황 분석 차트'
+        },
+        'chart2': {
+            'title': '보훈병원 사용인원현황2',
+            'type': 'image',
+            'image_path': '/data/images/2.JPG',
+            'description': '보훈병원 사용인원 상세 현황 차트'
+        },
+    }
+
+    region_totals = _region_totals(usage)
+    top5 = region_totals.nlargest(5)
+
+    # 3. 상위 5개 지역 이용인원 비율
+    chart3_data = region_totals[region_totals.index.isin(top5.index)]
+    total = chart3_data.sum()
+    chart_data['chart3'] = {
+        'title': '전국위탁병원 월별 평균이용 인원추이',
+        'type': 'pie',
+        'image_path': '/data/images/3.JPG',
+        'data': [
+            {
+                'name': region,
+                'value': int(count),
+                'percentage': round((count / total) * 100, 1),
+                'fill': f"hsl({i * 72}, 70%, 50%)"
+            }
+            for i, (region, count) in enumerate(chart3_data.items())
+        ]
+    }
+
+    # 4. 연도별 총인원과 원본 행 수
+    yearly = pd.DataFrame(usage.years(), columns=['연도', 'total', 'count']).set_index('연도')
+    chart_data['chart4'] = {
+        'title': '전국위탁병원 년도,년월상관관계분석',
+        'type': 'area',
+        'image_path': '/data/images/4.JPG',
+        'data': [
+            {'year': f"{int(year)}년", 'total': int(row['total']), 'count': int(row['count'])}
+            for year, row in yearly.iterrows()
+        ]
+    }
+
+    # 5. 상위 5개 지역 전체 기간 합계
+    colors = ['#8884d8', '#82ca9d', '#ffc658', '#ff7c7c', '#8dd1e1']
+    chart_data['chart5'] = {
+        'title': '광역지자체별 연도별 위탁병원 이용인원 프로그램 결과',
+        'type': 'radialBar',
+        'image_path': '/data/images/5.JPG',
+        'data': [
+            {'name': region, 'value': int(count), 'fill': colors[i % len(colors)]}
+            for i, (region, count) in enumerate(top5.items())
+        ]
+    }
+
+    # 6. 월별 합계 (앞 24개월)
+    monthly = pd.DataFrame(usage.monthly(), columns=['연도', '월', '인원', '건수'])
+    chart_data['chart6'] = {
+        'title': '연도별 광역지자체 코드별 위탁병원이용 비율 파이차트 프로그램결과',
+        'type': 'line',
+        'image_path': '/data/images/6.JPG',
+        'data': [
+            {
+                'date': f"{int(row['연도'])}-{int(row['월']):02d}",
+                'users': int(row['인원']),
+                'year': int(row['연도']),
+                'month': int(row['월'])
+            }
+            for _, row in monthly.head(24).iterrows()
+        ]
+    }
+
+    # 7. 통계 요약
+    chart_data['chart7'] = {
+        'title': '공백',
+        'type': 'summary',
+        'data': {
+            'total_users': int(yearly['total'].sum()),
+            'total_regions': len(region_totals),
+            'avg_monthly': int(monthly['인원'].mean()) if len(monthly) else 0,
+            'data_period': f"{yearly.index.min()}-{yearly.index.max()}"
+        }
+    }
+    return chart_data
+
+
+def build_sync_info(facility: pd.DataFrame) -> Dict[str, Any]:
+    """chart_sync_info.json 구조 (Chart 1, 2 이미지의 기준 데이터 요약)"""
+    columns = facility_year_columns(facility)
+    return {
+        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'total_regions': len(facility),
+        'data_years': columns,
+        'yearly_totals': {
+            column[:4]: int(pd.to_numeric(facility[column], errors='coerce').fillna(0).sum())
+            for column in columns
+        }
+    }
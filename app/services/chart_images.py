@@ -0,0 +1,112 @@
+"""
+Chart Images
+연도별 위탁병원 현황으로 차트 앱의 정적 이미지 (Chart 1, 2 - 1.JPG, 2.JPG) matplotlib Figure 생성
+"""
+
+import matplotlib
+
+# 화면 없는 서버/작업 프로세스에서 그리도록 비대화형 백엔드 사용
+matplotlib.use('Agg')
+
+import numpy as np
+import pandas as pd
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+
+from .chart_figures import facility_year_columns
+
+# 한글 폰트 (Windows 맑은 고딕, 없으면 다음 후보)
+plt.rcParams['font.family'] = ['Malgun Gothic', 'NanumGothic', 'AppleGothic', 'DejaVu Sans']
+plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
+
+# 이미지 저장 옵션
+SAVE_OPTIONS = {'format': 'jpg', 'dpi': 150, 'bbox_inches': 'tight', 'facecolor': 'white'}
+
+
+def _yearly_totals(facility: pd.DataFrame):
+    """[(연도 '2022', 전국 합계)]"""
+    return [(column[:4], int(pd.to_numeric(facility[column], errors='coerce').fillna(0).sum()))
+            for column in facility_year_columns(facility)]
+
+
+def _year_range(columns) -> str:
+    return f'{columns[0][:4]}~{columns[-1][:4]}' if columns else ''
+
+
+def facility_bar_image(facility: pd.DataFrame) -> Figure:
+    """Chart 1: 광역지자체별 연도별 위탁병원 현황 (grouped bar chart)"""
+    columns = facility_year_columns(facility)
+    df_pivot = facility.set_index('광역지자체')[columns].apply(pd.to_numeric, errors='coerce').fillna(0)
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+    x = np.arange(len(df_pivot.index))
+    width = 0.75 / max(len(columns), 1)
+    colors = ['#4e79a7', '#f28e2c', '#e15759', '#76b7b2', '#59a14f']
+
+    for i, column in enumerate(columns):
+        offset = width * (i - (len(columns) - 1) / 2)
+        bars = ax.bar(x + offset, df_pivot[column], width,
+                      label=f'{column[:4]}년', color=colors[i % len(colors)], alpha=0.8)
+        # 데이터 레이블
+        for bar in bars:
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width() / 2., height, f'{int(height):,}',
+                    ha='center', va='bottom', fontsize=9, fontweight='bold')
+
+    ax.set_xlabel('광역지자체', fontsize=12, fontweight='bold')
+    ax.set_ylabel('위탁병원 수', fontsize=12, fontweight='bold')
+    ax.set_title(f'광역지자체별 연도별 위탁병원 현황 ({_year_range(columns)})',
+                 fontsize=16, fontweight='bold', pad=15)
+    ax.set_xticks(x)
+    ax.set_xticklabels(df_pivot.index, rotation=45, ha='right', fontsize=10)
+    ax.legend(fontsize=10, loc='upper right')
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    ax.tick_params(axis='y', labelsize=10)
+    fig.tight_layout()
+    return fig
+
+
+def facility_pie_image(facility: pd.DataFrame) -> Figure:
+    """Chart 2: 전국 위탁병원 연도별 비율 (pie chart)"""
+    columns = facility_year_columns(facility)
+    totals = _yearly_totals(facility)
+    labels = [f'{year}년' for year, _ in totals]
+    sizes = [size for _, size in totals]
+    total = sum(sizes)
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+    colors = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#c2c2f0']
+    wedges, texts, autotexts = ax.pie(sizes, explode=[0.05] * len(sizes), labels=labels,
+                                      colors=colors[:len(sizes)], autopct='%1.1f%%',
+                                      shadow=True, startangle=90,
+                                      textprops={'fontsize': 11, 'fontweight': 'bold'})
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontsize(13)
+        autotext.set_fontweight('bold')
+    for text in texts:
+        text.set_fontsize(13)
+        text.set_fontweight('bold')
+
+    # 범례 (개수와 비율)
+    legend_labels = [f'{label}: {size:,}개 ({size / total * 100 if total else 0:.1f}%)'
+                     for label, size in zip(labels, sizes)]
+    ax.legend(legend_labels, loc='upper left', bbox_to_anchor=(1, 1),
+              fontsize=10, frameon=True, shadow=True)
+    ax.set_title(f'전국 위탁병원 연도별 비율 ({_year_range(columns)})',
+                 fontsize=16, fontweight='bold', pad=15)
+
+    fig.text(0.5, 0.02, f'총 위탁병원 수 ({len(sizes)}개년 합계): {total:,}개',
+             ha='center', fontsize=11, fontweight='bold',
+             bbox=dict(boxstyle='round,pad=0.5', facecolor='yellow', alpha=0.3))
+
+    # 전년 대비 증감
+    changes = [f'{prev_year}→{year}: {size - prev:+,}개 ({(size - prev) / prev * 100 if prev else 0:+.1f}%)'
+               for (prev_year, prev), (year, size) in zip(totals, totals[1:])]
+    if changes:
+        fig.text(0.5, 0.92, '📊 증감 추이:\n' + '\n'.join(changes), ha='center', fontsize=9,
+                 bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', alpha=0.5))
+
+    ax.axis('equal')
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,108 @@
+"""
+Chart Service
+위탁병원 이용인원/연도별 현황 집계로 차트 Figure와 차트 앱 데이터 생성 (데이터 버전 단위 캐시)
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional
+
+import pandas as pd
+from plotly.utils import PlotlyJSONEncoder
+
+from .chart_figures import CHART_FIGURES, build_chart_data
+
+# 차트 앱 데이터 (Chart/data/chartData.json과 같은 구조)
+CHART_DATA_ID = 'chartData'
+CHART_IDS = tuple(CHART_FIGURES) + (CHART_DATA_ID,)
+
+
+class ChartService:
+    """
+    차트 데이터
+
+    - 원천은 이용인원 롤업(UsageRollupStore)과 연도별 위탁병원 현황 (원본 행을 다시 묶지 않음)
+    - 두 원천 내용의 해시가 데이터 버전, 버전이 같으면 차트마다 한 번 만든 응답 본문 재사용
+    - 원천이 바뀌면 다음 요청에서 새 버전으로 다시 생성 (별도 생성 스크립트 실행 불필요)
+    """
+
+    def __init__(self, usage_repository=None, rollups=None):
+        self._usage_repository = usage_repository
+        self._rollups = rollups
+        self._lock = threading.Lock()
+        self._sources: Optional[tuple] = None
+        self._version = ''
+        self._inputs: Dict[str, Any] = {}
+        self._charts: Dict[str, Dict[str, Any]] = {}
+
+    def get_chart(self, chart_id: str) -> Dict[str, Any]:
+        """
+        차트 조회
+
+        Returns:
+            {'chart_id', 'body': bytes (Plotly Figure JSON 또는 chartData 구조), 'etag', 'data_version'}
+
+        Raises:
+            ValueError: 지원하지 않는 차트 ID
+        """
+        if chart_id not in CHART_IDS:
+            raise ValueError(f"chart_id는 {', '.join(CHART_IDS)} 중 하나여야 합니다.")
+        rollup = self._get_rollups().get()
+        facility = self._get_usage_repository().load_facility_counts()
+
+        with self._lock:
+            self._sync(rollup, facility)
+            cached = self._charts.get(chart_id)
+            if cached is not None:
+                return cached
+            version = self._version
+            inputs = self._inputs
+
+        if chart_id == CHART_DATA_ID:
+            content = build_chart_data(inputs['usage'])
+        else:
+            source, builder = CHART_FIGURES[chart_id]
+            content = builder(inputs[source])
+        body = json.dumps(content, cls=PlotlyJSONEncoder, ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8')
+        chart = {
+            'chart_id': chart_id,
+            'body': body,
+            'etag': hashlib.sha1(body).hexdigest()[:20],
+            'data_version': version,
+        }
+        with self._lock:
+            if self._version == version:
+                self._charts[chart_id] = chart
+        return chart
+
+    def _sync(self, rollup, facility) -> None:
+        """
+        원천 조회 결과가 바뀌었으면 데이터 버전을 다시 계산 (lock 안에서 호출)
+
+        롤업/리포지토리가 갱신 전까지 같은 객체를 돌려주므로 그 사이에는 해시도 다시 계산하지 않고,
+        다시 읽었어도 내용이 같으면 만들어 둔 차트를 그대로 유지
+        """
+        if self._sources is not None and self._sources[0] is rollup and self._sources[1] is facility:
+            return
+        self._sources = (rollup, facility)
+        digest = hashlib.sha1(json.dumps([rollup.fingerprint, facility], ensure_ascii=False, default=str)
+                              .encode('utf-8')).hexdigest()[:12]
+        if digest == self._version:
+            return
+        self._version = digest
+        self._inputs = {'usage': rollup, 'facility': pd.DataFrame(list(facility))}
+        self._charts = {}
+
+    def _get_rollups(self):
+        if self._rollups is None:
+            from ..repositories.usage_rollup_store import usage_rollups
+            self._rollups = usage_rollups
+        return self._rollups
+
+    def _get_usage_repository(self):
+        if self._usage_repository is None:
+            from ..repositories.usage_repository import UsageRepository
+            self._usage_repository = UsageRepository()
+        return self._usage_repository
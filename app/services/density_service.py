@@ -0,0 +1,128 @@
+"""
+Density Service
+병원 위치와 시군구별 위탁병원 이용인원의 줌 레벨별 밀도 격자 (스냅샷/연월 단위 캐시)
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.density_grid import bin_density, clamp_zoom
+from ..models.hospital_region_index import SIDO_ALIASES
+from ..repositories.hospital_cache import HospitalSnapshot
+from .folium_map_service import REGION_CENTERS
+from .hospital_geojson_service import BBox
+
+# 밀도 원천: 병원 위치(병원 수), 지역별 이용인원(인원)
+DENSITY_SOURCES = ('hospitals', 'usage')
+
+
+def hospital_density(snapshot: HospitalSnapshot, zoom: int) -> Dict[str, Any]:
+    """좌표가 있는 병원 수의 밀도 격자"""
+    points = [(hospital.latitude, hospital.longitude) for hospital in snapshot.hospitals
+              if hospital.latitude is not None and hospital.longitude is not None]
+    return bin_density([lat for lat, _ in points], [lng for _, lng in points], zoom=zoom)
+
+
+def locate_sigungu(snapshot: HospitalSnapshot, sido: str, sigungu: str) -> Optional[Tuple[float, float]]:
+    """
+    시군구의 대표 좌표 (그 시군구 병원들의 평균 좌표, 병원이 없으면 시도 중심)
+
+    시도/시군구 색인으로 찾으며 결과는 스냅샷마다 한 번만 계산
+    """
+    sido = SIDO_ALIASES.get((sido or '').strip(), '')
+    if not sido:
+        return None
+    locations = snapshot.derived('sigungu_locations', lambda s: {})
+    key = (sido, (sigungu or '').strip())
+    if key not in locations:
+        by_id = snapshot.by_id
+        points = [(by_id[hospital_id].latitude, by_id[hospital_id].longitude)
+                  for hospital_id in snapshot.region_index.ids(f'{sido} {key[1]}'.strip())
+                  if by_id[hospital_id].latitude is not None and by_id[hospital_id].longitude is not None]
+        if points:
+            locations[key] = (sum(lat for lat, _ in points) / len(points),
+                              sum(lng for _, lng in points) / len(points))
+        else:
+            locations[key] = REGION_CENTERS[sido][:2] if sido in REGION_CENTERS else None
+    return locations[key]
+
+
+def usage_density(snapshot: HospitalSnapshot, rows, zoom: int) -> Dict[str, Any]:
+    """시군구별 이용인원을 시군구 대표 좌표에 놓은 밀도 격자 (좌표를 정할 수 없는 행은 unplaced로 집계)"""
+    lats: List[float] = []
+    lngs: List[float] = []
+    weights: List[float] = []
+    unplaced = 0.0
+    for sido, sigungu, count in rows:
+        location = locate_sigungu(snapshot, sido, sigungu)
+        if location is None:
+            unplaced += count
+            continue
+        lats.append(location[0])
+        lngs.append(location[1])
+        weights.append(count)
+    grid = bin_density(lats, lngs, weights, zoom=zoom)
+    grid['unplaced'] = unplaced
+    return grid
+
+
+class DensityService:
+    """
+    밀도 격자
+
+    - 병원 밀도: 스냅샷마다 줌별로 한 번만 계산 (snapshot.derived)
+    - 이용인원 밀도: 연월 데이터 해시까지 키에 넣어 스냅샷에 보관 (데이터가 같으면 재사용)
+    - bbox는 캐시된 전국 격자에서 영역 안의 셀만 골라 반환
+    """
+
+    def __init__(self, repository=None, usage_repository=None):
+        self._repository = repository
+        self._usage_repository = usage_repository
+
+    def get_grid(self, source: str = 'hospitals', zoom: int = 7, bbox: Optional[BBox] = None,
+                 period: Optional[str] = None) -> Dict[str, Any]:
+        """
+        밀도 격자 조회
+
+        Returns:
+            {'source', 'zoom', 'cell_size', 'bounds', 'cells', 'max', 'total', 'data_version',
+             'period'(이용인원), 'unplaced'(이용인원)}
+
+        Raises:
+            ValueError: 지원하지 않는 원천/연월
+        """
+        if source not in DENSITY_SOURCES:
+            raise ValueError(f"source는 {', '.join(DENSITY_SOURCES)} 중 하나여야 합니다.")
+        if period and not (len(period) == 6 and period.isdigit()):
+            raise ValueError('period는 YYYYMM 형식이어야 합니다.')
+        zoom = clamp_zoom(zoom)
+        snapshot = self._get_repository().snapshot()
+
+        if source == 'hospitals':
+            grid = snapshot.derived(f'density:hospitals:{zoom}', lambda s: hospital_density(s, zoom))
+        else:
+            period, rows = self._get_usage_repository().load_usage(period)
+            digest = hashlib.sha1(json.dumps(rows, ensure_ascii=False).encode('utf-8')).hexdigest()[:12]
+            grid = snapshot.derived(f'density:usage:{period}:{digest}:{zoom}',
+                                    lambda s: usage_density(s, rows, zoom))
+            grid = dict(grid, period=period)
+
+        result = dict(grid, source=source, data_version=snapshot.version)
+        if bbox is not None:
+            west, south, east, north = bbox
+            result['cells'] = [cell for cell in grid['cells']
+                               if south <= cell[0] <= north and west <= cell[1] <= east]
+        return result
+
+    def _get_repository(self):
+        if self._repository is None:
+            from ..repositories.testdb_hospital_repository import TestDBHospitalRepository
+            self._repository = TestDBHospitalRepository()
+        return self._repository
+
+    def _get_usage_repository(self):
+        if self._usage_repository is None:
+            from ..repositories.usage_repository import UsageRepository
+            self._usage_repository = UsageRepository()
+        return self._usage_repository
@@ -6,8 +6,170 @@ Folium을 사용한 지도 생성 서비스
 import folium
 import os
 from datetime import datetime
-from typing import List, Dict, Any
+from html import escape
+from typing import List, Dict, Any, Optional, Tuple
+from folium.elements import JSCSSMixin
+from folium.map import Layer
+from folium.plugins import FastMarkerCluster, HeatMap, MarkerCluster
+from jinja2 import Template
+from ..models.density_grid import DENSITY_CELL_PIXELS, bin_density
+from ..models.hospital import Hospital
 from ..repositories.testdb_hospital_repository import TestDBHospitalRepository
+from .artifact_store import artifact_store
+
+# 지역별 중심 좌표 및 줌 레벨 (create_region_map, 지도 사전 생성 대상)
+REGION_CENTERS = {
+    '서울': (37.5665, 126.9780, 11),
+    '부산': (35.1796, 129.0756, 11),
+    '대구': (35.8714, 128.6014, 11),
+    '인천': (37.4563, 126.7052, 11),
+    '광주': (35.1595, 126.8526, 11),
+    '대전': (36.3504, 127.3845, 11),
+    '울산': (35.5384, 129.3114, 11),
+    '세종': (36.4800, 127.2890, 11),
+    '경기': (37.4138, 127.5183, 9),
+    '강원': (37.8228, 128.1555, 9),
+    '충북': (36.8000, 127.7000, 9),
+    '충남': (36.5184, 126.8000, 9),
+    '전북': (35.7175, 127.1530, 9),
+    '전남': (34.8679, 126.9910, 9),
+    '경북': (36.4919, 128.8889, 9),
+    '경남': (35.4606, 128.2132, 9),
+    '제주': (33.4890, 126.4983, 10)
+}
+
+# 종별 레이어 (체크박스로 ON/OFF, 그 외 종별은 '기타'로 기본 지도에 표시)
+HOSPITAL_TYPES = ('종합병원', '병원', '의원', '요양병원')
+
+# 마커 표시 방식
+# (모든 방식이 좌표/ID 배열만 내장하고 팝업은 클릭할 때 조회)
+# - markers: 종별 아이콘 마커 (점이 적을 때)
+# - cluster: 아이콘 마커를 MarkerCluster로 묶음
+# - fast_cluster: folium FastMarkerCluster - [위도, 경도, ID] 배열을 JS 콜백으로 가벼운 점 마커(divIcon)로 만들어 묶음
+# - canvas: canvas에 그리는 원 마커 (클러스터 없이 모든 점 표시)
+# - heatmap: 점 대신 지도 줌의 밀도 격자를 HeatMap으로 표시 (자동 선택하지 않음)
+RENDER_MODES = ('markers', 'cluster', 'fast_cluster', 'canvas', 'heatmap')
+
+# 자동 선택 기준 (병원 수 이하이면 해당 방식 - 아이콘 마커는 점마다 DOM 요소가 생겨 많으면 canvas, 더 많으면 클러스터)
+MARKER_MODE_MAX_POINTS = 200
+CANVAS_MODE_MAX_POINTS = 500
+
+# 지도에 넣는 좌표 소수점 자릿수 (5자리 ≈ 1.1m)
+COORDINATE_PRECISION = 5
+
+# fast_cluster 마커 콜백 (종별 색 점 아이콘은 레이어마다 하나를 만들어 모든 마커가 공유)
+FAST_CLUSTER_CALLBACK = """(function () {
+    var icon = L.divIcon({
+        className: 'hospital-dot',
+        html: '<div style="width:10px;height:10px;border-radius:50%%;background:%s;border:1px solid #fff"></div>',
+        iconSize: [12, 12]
+    });
+    return function (row) {
+        var marker = L.marker(new L.LatLng(row[0], row[1]), {hospitalId: row[2], icon: icon});
+        marker.bindPopup('불러오는 중...', {maxWidth: 300});
+        marker.once('popupopen', loadHospitalPopup);
+        return marker;
+    };
+})()"""
+
+# 팝업 내용을 가져올 주소 ({id}는 병원 ID) - 지도 HTML에는 팝업을 넣지 않고 클릭할 때 조회
+POPUP_URL_TEMPLATE = '/api/hospitals/{id}/popup'
+
+# 지도마다 한 번 넣는 팝업 로더 (한 번 불러온 팝업은 마커에 그대로 남음)
+POPUP_LOADER_JS = """
+<script>
+function loadHospitalPopup(event) {
+    var marker = event.target;
+    fetch('%s'.replace('{id}', marker.options.hospitalId))
+        .then(function (response) {
+            if (!response.ok) { throw new Error('HTTP ' + response.status); }
+            return response.text();
+        })
+        .then(function (html) { marker.setPopupContent(html); })
+        .catch(function (error) {
+            marker.setPopupContent('병원 정보를 불러오지 못했습니다 (' + error.message + ')');
+            marker.once('popupopen', loadHospitalPopup);
+        });
+}
+</script>
+""" % POPUP_URL_TEMPLATE
+
+
+def create_popup_html(hospital) -> str:
+    """병원 정보 팝업 HTML 생성 (/api/hospitals/<id>/popup 응답)"""
+    # 병상수와 진료과수 포맷팅
+    bed_info = f"{hospital.bed_count}병상" if hospital.bed_count else "-"
+    dept_info = f"{hospital.department_count}과" if hospital.department_count else "-"
+    
+    popup_html = f"""
+    <div style="width: 280px;">
+        <h4 style="color: #2E86AB; margin-bottom: 10px;">🏥 {escape(hospital.name or '')}</h4>
+        <p><strong>📍 주소:</strong><br>{escape(hospital.address or '')}</p>
+        <p><strong>🏥 규모:</strong><br>
+           병상수: {bed_info} | 진료과수: {dept_info}
+        </p>
+        <p><strong>🌍 좌표:</strong><br>
+           위도: {hospital.latitude:.6f}<br>
+           경도: {hospital.longitude:.6f}
+        </p>
+    </div>
+    """
+    return popup_html
+
+
+class HospitalPointLayer(JSCSSMixin, Layer):
+    """
+    종별 하나의 병원 점 레이어
+
+    좌표와 병원 ID 배열([위도, 경도, ID])만 지도 HTML에 넣고
+    마커는 브라우저에서 만들며, 팝업은 처음 열 때 POPUP_URL_TEMPLATE에서 가져온다.
+    """
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = (function () {
+                var layer = {% if this.cluster %}L.markerClusterGroup({chunkedLoading: true}){% else %}L.featureGroup(){% endif %};
+                var rows = {{ this.rows|tojson }};
+                var style = {{ this.style|tojson }};
+                for (var i = 0; i < rows.length; i++) {
+                    var row = rows[i];
+                    var marker;
+                    {%- if this.icon %}
+                    marker = L.marker([row[0], row[1]], {hospitalId: row[2], icon: L.AwesomeMarkers.icon(style)});
+                    {%- else %}
+                    style.hospitalId = row[2];
+                    marker = L.circleMarker([row[0], row[1]], style);
+                    {%- endif %}
+                    marker.bindPopup('불러오는 중...', {maxWidth: 300});
+                    marker.once('popupopen', loadHospitalPopup);
+                    marker.addTo(layer);
+                }
+                layer.addTo({{ this._parent.get_name() }});
+                return layer;
+            })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, rows: List[List[float]], style: Dict[str, Any], icon: bool, cluster: bool,
+                 name: Optional[str] = None, control: bool = True, show: bool = True):
+        super().__init__(name=name, overlay=True, control=control, show=show)
+        self._name = 'HospitalPointLayer'
+        self.rows = rows
+        self.style = style
+        self.icon = icon
+        self.cluster = cluster
+        # 클러스터를 쓸 때만 markercluster 스크립트/스타일 포함
+        self.default_js = MarkerCluster.default_js if cluster else []
+        self.default_css = MarkerCluster.default_css if cluster else []
+
+
+def choose_render_mode(point_count: int) -> str:
+    """병원 수에 맞는 마커 표시 방식"""
+    if point_count <= MARKER_MODE_MAX_POINTS:
+        return 'markers'
+    if point_count <= CANVAS_MODE_MAX_POINTS:
+        return 'canvas'
+    return 'fast_cluster'
 
 
 class FoliumMapService:
@@ -17,7 +179,10 @@ class FoliumMapService:
     def create_hospital_map(self, 
                           center_lat: float = 36.5, 
                           center_lng: float = 127.5, 
-                          zoom_start: int = 7) -> str:
+                          zoom_start: int = 7,
+                          hospitals: Optional[List[Hospital]] = None,
+                          filepath: Optional[str] = None,
+                          render_mode: Optional[str] = None) -> str:
         """
         병원 위치를 표시한 Folium 지도 생성
         
@@ -25,13 +190,17 @@ class FoliumMapService:
             center_lat: 지도 중심 위도 (기본: 한국 중심)
             center_lng: 지도 중심 경도 (기본: 한국 중심)
             zoom_start: 초기 줌 레벨
+            hospitals: 지도에 표시할 병원 목록 (기본: 리포지토리 전체)
+            filepath: 저장할 경로 (기본: 현재 디렉토리의 타임스탬프 파일명)
+            render_mode: 마커 표시 방식 (RENDER_MODES, 기본: 병원 수에 따라 자동 선택)
             
         Returns:
             생성된 HTML 파일의 경로
         """
         
         # 병원 데이터 가져오기
-        hospitals = self.repository.find_all()
+        if hospitals is None:
+            hospitals = self.repository.find_all()
         
         # Folium 지도 생성 - OpenStreetMap을 기본 타일로 설정
         m = folium.Map(
@@ -91,67 +260,10 @@ class FoliumMapService:
             show=False
         ).add_to(m)
         
-        # 종별 FeatureGroup 생성 (체크박스로 ON/OFF 가능)
-        feature_groups = {
-            '종합병원': folium.FeatureGroup(name='종합병원', show=True),
-            '병원': folium.FeatureGroup(name='병원', show=True),
-            '의원': folium.FeatureGroup(name='의원', show=True),
-            '요양병원': folium.FeatureGroup(name='요양병원', show=True)
-        }
-        
-        # 병원 마커 추가
-        hospital_count = 0
-        type_stats = {
-            '종합병원': 0,
-            '병원': 0,
-            '의원': 0,
-            '요양병원': 0,
-            '기타': 0
-        }
-        
-        for hospital in hospitals:
-            if hospital.latitude and hospital.longitude:
-                # 팝업 내용 생성
-                popup_html = self._create_popup_html(hospital)
-                
-                # testdb.위탁병원현황의 종별 컬럼 사용
-                hospital_type = hospital.hospital_type if hasattr(hospital, 'hospital_type') else '기타'
-                
-                # 종별 통계 업데이트
-                if hospital_type in type_stats:
-                    type_stats[hospital_type] += 1
-                else:
-                    type_stats['기타'] += 1
-                
-                # 종별에 따른 마커 색상 결정
-                marker_color = self._get_type_marker_color(hospital_type)
-                marker_icon = self._get_type_marker_icon(hospital_type)
-                icon_color = 'white'
-                
-                # 마커 생성
-                marker = folium.Marker(
-                    location=[hospital.latitude, hospital.longitude],
-                    popup=folium.Popup(popup_html, max_width=300),
-                    tooltip=f"{hospital.name} ({hospital_type})",
-                    icon=folium.Icon(
-                        color=marker_color,
-                        icon=marker_icon,
-                        prefix='fa',
-                        icon_color=icon_color
-                    )
-                )
-                
-                # 해당 종별의 FeatureGroup에 마커 추가
-                if hospital_type in feature_groups:
-                    marker.add_to(feature_groups[hospital_type])
-                else:
-                    marker.add_to(m)  # 기타는 기본 지도에 추가
-                
-                hospital_count += 1
-        
-        # 모든 FeatureGroup을 지도에 추가
-        for group in feature_groups.values():
-            group.add_to(m)
+        # 종별 레이어에 병원 표시 (표시 방식은 병원 수에 따라 자동 선택)
+        if render_mode is None:
+            render_mode = choose_render_mode(len(hospitals))
+        hospital_count, type_stats = self._add_hospital_layers(m, hospitals, render_mode, zoom_start)
         
         # 레이어 컨트롤 추가 (종별 체크박스 포함) - 오른쪽 상단
         folium.LayerControl(position='topright', collapsed=False).add_to(m)
@@ -188,81 +300,125 @@ class FoliumMapService:
         """
         m.get_root().html.add_child(folium.Element(info_html))
         
-        # HTML 파일로 저장
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f'hospital_map_folium_{timestamp}.html'
-        filepath = os.path.join(os.getcwd(), filename)
+        # HTML 파일로 저장 (경로를 지정하지 않으면 생성 파일 저장소에 저장)
+        if filepath is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f'hospital_map_folium_{timestamp}.html'
+            return artifact_store.write(filename, m.save, kind='map')
         
         m.save(filepath)
         
         return filepath
     
-    def _create_popup_html(self, hospital) -> str:
-        """병원 정보 팝업 HTML 생성"""
-        # 병상수와 진료과수 포맷팅
-        bed_info = f"{hospital.bed_count}병상" if hospital.bed_count else "-"
-        dept_info = f"{hospital.department_count}과" if hospital.department_count else "-"
-        
-        popup_html = f"""
-        <div style="width: 280px;">
-            <h4 style="color: #2E86AB; margin-bottom: 10px;">🏥 {hospital.name}</h4>
-            <p><strong>📍 주소:</strong><br>{hospital.address}</p>
-            <p><strong>🏥 규모:</strong><br>
-               병상수: {bed_info} | 진료과수: {dept_info}
-            </p>
-            <p><strong>🌍 좌표:</strong><br>
-               위도: {hospital.latitude:.6f}<br>
-               경도: {hospital.longitude:.6f}
-            </p>
-        </div>
+    def _add_hospital_layers(self, m: folium.Map, hospitals: List[Hospital],
+                             render_mode: str, zoom: int = 7) -> Tuple[int, Dict[str, int]]:
         """
-        return popup_html
+        종별 레이어(체크박스로 ON/OFF)에 병원 표시 (heatmap이면 zoom 기준 밀도 레이어 하나)
+        
+        Returns:
+            (표시한 병원 수, 종별 통계)
+        """
+        type_stats = {
+            '종합병원': 0,
+            '병원': 0,
+            '의원': 0,
+            '요양병원': 0,
+            '기타': 0
+        }
+        
+        # 종별로 묶기 (좌표가 없는 병원은 제외)
+        groups: Dict[str, List[Hospital]] = {hospital_type: [] for hospital_type in HOSPITAL_TYPES}
+        others: List[Hospital] = []
+        for hospital in hospitals:
+            if hospital.latitude and hospital.longitude:
+                # testdb.위탁병원현황의 종별 컬럼 사용
+                hospital_type = hospital.hospital_type if hasattr(hospital, 'hospital_type') else '기타'
+                if hospital_type in groups:
+                    type_stats[hospital_type] += 1
+                    groups[hospital_type].append(hospital)
+                else:
+                    type_stats['기타'] += 1
+                    others.append(hospital)
+        
+        hospital_count = sum(type_stats.values())
+        if render_mode == 'heatmap':
+            self._create_heatmap_layer([h for members in groups.values() for h in members] + others, zoom).add_to(m)
+            return hospital_count, type_stats
+        
+        # 마커를 클릭하면 팝업 내용을 API에서 가져오는 함수
+        m.get_root().header.add_child(folium.Element(POPUP_LOADER_JS), name='hospital_popup_loader')
+        
+        for hospital_type, members in groups.items():
+            layer = self._create_type_layer(hospital_type, members, render_mode, name=hospital_type)
+            layer.add_to(m)
+        if others:
+            # 기타는 체크박스 없이 기본 지도에 표시
+            layer = self._create_type_layer('기타', others, render_mode, name=None, control=False)
+            layer.add_to(m)
+        
+        return hospital_count, type_stats
+    
+    def _create_heatmap_layer(self, hospitals: List[Hospital], zoom: int) -> HeatMap:
+        """병원 수 밀도 HeatMap (점마다 넣지 않고 지도 줌의 격자 셀 중심과 셀별 병원 수만 내장)"""
+        grid = bin_density([h.latitude for h in hospitals], [h.longitude for h in hospitals], zoom=zoom)
+        peak = grid['max'] or 1
+        data = [[lat, lng, round(value / peak, 3)] for lat, lng, value in grid['cells']]
+        return HeatMap(data, name=f"병원 밀도 ({len(grid['cells'])}개 격자)",
+                       radius=DENSITY_CELL_PIXELS, blur=DENSITY_CELL_PIXELS // 2, min_opacity=0.3)
+    
+    def _create_type_layer(self, hospital_type: str, hospitals: List[Hospital], render_mode: str,
+                           name: Optional[str], control: bool = True) -> Layer:
+        """종별 하나의 레이어 생성 (render_mode에 따라 마커 모양과 클러스터 여부 결정)"""
+        rows = [[round(hospital.latitude, COORDINATE_PRECISION), round(hospital.longitude, COORDINATE_PRECISION),
+                 hospital.hospital_id] for hospital in hospitals]
+        if render_mode == 'fast_cluster':
+            callback = FAST_CLUSTER_CALLBACK % self._get_type_hex_color(hospital_type)
+            return FastMarkerCluster(rows, callback=callback, name=name, control=control, show=True,
+                                     chunkedLoading=True)
+        if render_mode in ('markers', 'cluster'):
+            # 종별 아이콘 마커
+            style = {
+                'markerColor': self._get_type_marker_color(hospital_type),
+                'icon': self._get_type_marker_icon(hospital_type),
+                'prefix': 'fa',
+                'iconColor': 'white'
+            }
+            icon = True
+        else:
+            # canvas에 그리는 원 마커 (아이콘/DOM 요소 없음)
+            color = self._get_type_hex_color(hospital_type)
+            style = {'radius': 6, 'weight': 1, 'color': color, 'fillColor': color, 'fillOpacity': 0.8}
+            icon = False
+        return HospitalPointLayer(rows, style, icon=icon, cluster=render_mode == 'cluster',
+                                  name=name, control=control, show=True)
     
-    def create_region_map(self, region: str = None) -> str:
+    def create_region_map(self, region: str = None,
+                          hospitals: Optional[List[Hospital]] = None,
+                          filepath: Optional[str] = None,
+                          render_mode: Optional[str] = None) -> str:
         """
         특정 지역의 병원 지도 생성
         
         Args:
-            region: 지역명 (예: '서울', '부산' 등)
+            region: 지역명 (예: '서울', '부산', '서울 강남구' 등)
+            hospitals: 이미 지역으로 거른 대상 병원 목록 (기본: 스냅샷의 지역 색인으로 조회)
+            filepath: 저장할 경로 (기본: 현재 디렉토리의 타임스탬프 파일명)
+            render_mode: 마커 표시 방식 (RENDER_MODES, 기본: 병원 수에 따라 자동 선택)
             
         Returns:
             생성된 HTML 파일의 경로
         """
-        hospitals = self.repository.find_all()
-        
-        # 지역별 필터링
-        if region:
-            filtered_hospitals = [h for h in hospitals if region in h.address]
-        else:
-            filtered_hospitals = hospitals
+        if hospitals is None:
+            # 지역별 필터링 (주소를 매번 검사하지 않고 시도/시군구 색인 조회)
+            hospitals = self.repository.snapshot().in_region(region or '')
+        filtered_hospitals = list(hospitals)
         
         if not filtered_hospitals:
             return None
         
-        # 지역별 중심 좌표 및 줌 레벨 설정
-        region_centers = {
-            '서울': (37.5665, 126.9780, 11),
-            '부산': (35.1796, 129.0756, 11),
-            '대구': (35.8714, 128.6014, 11),
-            '인천': (37.4563, 126.7052, 11),
-            '광주': (35.1595, 126.8526, 11),
-            '대전': (36.3504, 127.3845, 11),
-            '울산': (35.5384, 129.3114, 11),
-            '세종': (36.4800, 127.2890, 11),
-            '경기': (37.4138, 127.5183, 9),
-            '강원': (37.8228, 128.1555, 9),
-            '충북': (36.8000, 127.7000, 9),
-            '충남': (36.5184, 126.8000, 9),
-            '전북': (35.7175, 127.1530, 9),
-            '전남': (34.8679, 126.9910, 9),
-            '경북': (36.4919, 128.8889, 9),
-            '경남': (35.4606, 128.2132, 9),
-            '제주': (33.4890, 126.4983, 10)
-        }
-        
         # 지역에 맞는 중심 좌표와 줌 레벨 가져오기
-        if region and region in region_centers:
-            center_lat, center_lng, zoom_level = region_centers[region]
+        if region and region in REGION_CENTERS:
+            center_lat, center_lng, zoom_level = REGION_CENTERS[region]
         else:
             # 필터링된 병원들의 평균 위치 계산
             valid_hospitals = [h for h in filtered_hospitals 
@@ -293,64 +449,10 @@ class FoliumMapService:
             show=False
         ).add_to(m)
         
-        # 종별 FeatureGroup 생성
-        feature_groups = {
-            '종합병원': folium.FeatureGroup(name='종합병원', show=True),
-            '병원': folium.FeatureGroup(name='병원', show=True),
-            '의원': folium.FeatureGroup(name='의원', show=True),
-            '요양병원': folium.FeatureGroup(name='요양병원', show=True)
-        }
-        
-        # 병원 마커 추가 및 통계
-        hospital_count = 0
-        type_stats = {
-            '종합병원': 0,
-            '병원': 0,
-            '의원': 0,
-            '요양병원': 0,
-            '기타': 0
-        }
-        
-        for hospital in filtered_hospitals:
-            if hospital.latitude and hospital.longitude:
-                popup_html = self._create_popup_html(hospital)
-                
-                # 종별 확인
-                hospital_type = hospital.hospital_type if hasattr(hospital, 'hospital_type') else '기타'
-                
-                # 통계 업데이트
-                if hospital_type in type_stats:
-                    type_stats[hospital_type] += 1
-                else:
-                    type_stats['기타'] += 1
-                
-                # 마커 색상 및 아이콘
-                marker_color = self._get_type_marker_color(hospital_type)
-                marker_icon = self._get_type_marker_icon(hospital_type)
-                
-                marker = folium.Marker(
-                    location=[hospital.latitude, hospital.longitude],
-                    popup=folium.Popup(popup_html, max_width=300),
-                    tooltip=f"{hospital.name} ({hospital_type})",
-                    icon=folium.Icon(
-                        color=marker_color,
-                        icon=marker_icon,
-                        prefix='fa',
-                        icon_color='white'
-                    )
-                )
-                
-                # FeatureGroup에 추가
-                if hospital_type in feature_groups:
-                    marker.add_to(feature_groups[hospital_type])
-                else:
-                    marker.add_to(m)
-                
-                hospital_count += 1
-        
-        # FeatureGroup을 지도에 추가
-        for group in feature_groups.values():
-            group.add_to(m)
+        # 종별 레이어에 병원 표시 (표시 방식은 병원 수에 따라 자동 선택)
+        if render_mode is None:
+            render_mode = choose_render_mode(len(filtered_hospitals))
+        hospital_count, type_stats = self._add_hospital_layers(m, filtered_hospitals, render_mode, zoom_level)
         
         # 레이어 컨트롤 추가
         folium.LayerControl(position='topright', collapsed=False).add_to(m)
@@ -386,11 +488,12 @@ class FoliumMapService:
         """
         m.get_root().html.add_child(folium.Element(info_html))
         
-        # 파일 저장
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        region_name = region.replace(' ', '_') if region else 'all'
-        filename = f'hospital_map_{region_name}_{timestamp}.html'
-        filepath = os.path.join(os.getcwd(), filename)
+        # 파일 저장 (경로를 지정하지 않으면 생성 파일 저장소에 저장)
+        if filepath is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            region_name = region.replace(' ', '_') if region else 'all'
+            filename = f'hospital_map_{region_name}_{timestamp}.html'
+            return artifact_store.write(filename, m.save, kind='map')
         
         m.save(filepath)
         
@@ -467,10 +570,8 @@ class FoliumMapService:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f'hospital_data_{timestamp}.xlsx'
         
-        filepath = os.path.join(os.getcwd(), filename)
-        wb.save(filepath)
-        
-        return filepath
+        # 생성 파일 저장소에 원자적으로 저장 (보존 기간/용량 상한으로 정리됨)
+        return artifact_store.write(filename, wb.save, kind='export')
     
     def _get_hospital_type(self, medical_departments) -> str:
         """병원 유형 결정"""
@@ -539,6 +640,16 @@ class FoliumMapService:
         }
         return color_map.get(hospital_type, 'gray')
     
+    def _get_type_hex_color(self, hospital_type: str) -> str:
+        """종별 원 마커 색상 (정보 패널의 ● 색상과 동일)"""
+        color_map = {
+            '종합병원': '#d63333',
+            '병원': '#3498db',
+            '의원': '#38a169',
+            '요양병원': '#ff8c00'
+        }
+        return color_map.get(hospital_type, '#808080')
+    
     def _get_type_marker_icon(self, hospital_type: str) -> str:
         """종별에 따른 마커 아이콘 결정 (testdb.위탁병원현황 종별 기준)"""
         icon_map = {
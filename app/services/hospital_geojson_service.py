@@ -0,0 +1,255 @@
+"""
+Hospital GeoJSON Service
+지도 레이어용 병원 GeoJSON 생성 (좌표 양자화, 지도에 필요한 속성만) 및 스냅샷 단위 캐시
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from ..models.hospital_cluster_index import MAX_ZOOM
+from ..repositories.hospital_cache import HospitalSnapshot
+from .folium_map_service import HOSPITAL_TYPES, REGION_CENTERS
+
+# 좌표 소수점 자릿수 (5자리 ≈ 1.1m, 3자리 ≈ 110m)
+GEOJSON_PRECISION = 5
+MIN_PRECISION = 3
+MAX_PRECISION = 6
+
+# 종별 필터 값 (HOSPITAL_TYPES 외의 종별은 '기타')
+OTHER_TYPE = '기타'
+
+# 클러스터 API가 받는 지도 줌 범위 (Leaflet 타일 최대 줌 18)
+MAX_MAP_ZOOM = 18
+
+# 영역(bbox) 조회 한 번에 반환하는 최대 병원 수
+MAX_BOX_HOSPITALS = 2000
+
+BBox = Tuple[float, float, float, float]
+
+
+def parse_bbox(text: Optional[str]) -> Optional[BBox]:
+    """
+    'west,south,east,north' 경위도 영역 파싱 (빈 값이면 None)
+
+    Raises:
+        ValueError: 형식이나 범위가 잘못된 경우
+    """
+    if not text:
+        return None
+    try:
+        west, south, east, north = (float(value) for value in text.split(','))
+    except ValueError:
+        raise ValueError('bbox는 west,south,east,north 형식의 숫자 4개여야 합니다.')
+    if not (-180 <= west <= east <= 180 and -90 <= south <= north <= 90):
+        raise ValueError('bbox 범위가 올바르지 않습니다. (west <= east, south <= north)')
+    return west, south, east, north
+
+
+def build_hospital_geojson(snapshot: HospitalSnapshot, region: str = '', hospital_type: str = '',
+                           precision: int = GEOJSON_PRECISION) -> Dict[str, Any]:
+    """
+    병원 GeoJSON FeatureCollection 생성
+
+    - 지역은 스냅샷의 시도/시군구 색인으로 조회, 좌표가 없는 병원은 제외
+    - 좌표는 precision 자리로 반올림
+    - properties는 지도 마커에 필요한 id, name(툴팁), type(색상/레이어)만 포함
+      (상세 정보는 마커를 클릭할 때 /api/hospitals/<id>/popup으로 조회)
+    """
+    features = []
+    for hospital in snapshot.in_region(region):
+        if hospital.latitude is None or hospital.longitude is None:
+            continue
+        kind = hospital.hospital_type if hospital.hospital_type in HOSPITAL_TYPES else OTHER_TYPE
+        if hospital_type and kind != hospital_type:
+            continue
+        features.append({
+            'type': 'Feature',
+            'geometry': {
+                'type': 'Point',
+                'coordinates': [round(hospital.longitude, precision), round(hospital.latitude, precision)],
+            },
+            'properties': {'id': hospital.hospital_id, 'name': hospital.name, 'type': kind},
+        })
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+class HospitalGeoJsonService:
+    """
+    병원 GeoJSON 레이어
+
+    - (지역, 종별, 자릿수)별 응답 본문과 ETag를 스냅샷에 한 번만 만들어 재사용
+    - 데이터 버전이 바뀌면 새 스냅샷에서 다시 생성되므로 별도 무효화가 필요 없음
+    - 지역/종별은 정해진 값만 받아 캐시 항목 수가 늘어나지 않음
+    """
+
+    def __init__(self, repository=None):
+        self._repository = repository
+
+    def get_layer(self, region: str = '', hospital_type: str = '',
+                  precision: int = GEOJSON_PRECISION) -> Dict[str, Any]:
+        """
+        GeoJSON 레이어 조회
+
+        Returns:
+            {'body': bytes, 'etag', 'count', 'data_version'}
+
+        Raises:
+            ValueError: 지원하지 않는 지역/종별/자릿수
+        """
+        region = (region or '').strip()
+        hospital_type = (hospital_type or '').strip()
+        if region and region not in REGION_CENTERS:
+            raise ValueError(f"region은 {', '.join(REGION_CENTERS)} 중 하나여야 합니다.")
+        if hospital_type and hospital_type not in HOSPITAL_TYPES + (OTHER_TYPE,):
+            raise ValueError(f"type은 {', '.join(HOSPITAL_TYPES + (OTHER_TYPE,))} 중 하나여야 합니다.")
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(f'precision은 {MIN_PRECISION}~{MAX_PRECISION} 사이여야 합니다.')
+
+        snapshot = self._get_repository().snapshot()
+        return snapshot.derived(
+            f'geojson:{region}:{hospital_type}:{precision}',
+            lambda s: self._build_layer(s, region, hospital_type, precision),
+        )
+
+    def get_clusters(self, zoom: int, bbox: Optional[BBox] = None,
+                     precision: int = GEOJSON_PRECISION) -> Dict[str, Any]:
+        """
+        줌 레벨별 병원 클러스터 GeoJSON (스냅샷의 클러스터 색인 조회)
+
+        - 클러스터: properties.cluster=true, point_count, types(종별 수), expansion_zoom
+        - 병원이 하나인 셀: GeoJSON 레이어와 같은 id, name, type
+
+        Returns:
+            {'body': bytes, 'etag', 'count'(feature 수), 'total'(좌표가 있는 병원 수), 'data_version'}
+
+        Raises:
+            ValueError: 지원하지 않는 줌/자릿수
+        """
+        if not 0 <= zoom <= MAX_MAP_ZOOM:
+            raise ValueError(f'z는 0~{MAX_MAP_ZOOM} 사이여야 합니다.')
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(f'precision은 {MIN_PRECISION}~{MAX_PRECISION} 사이여야 합니다.')
+
+        snapshot = self._get_repository().snapshot()
+        index = snapshot.cluster_index
+        features = []
+        for cluster in index.clusters(min(zoom, MAX_ZOOM), bbox):
+            coordinates = [round(cluster['lng'], precision), round(cluster['lat'], precision)]
+            if 'hospital_id' in cluster:
+                hospital = snapshot.by_id[cluster['hospital_id']]
+                kind = hospital.hospital_type if hospital.hospital_type in HOSPITAL_TYPES else OTHER_TYPE
+                properties = {'id': hospital.hospital_id, 'name': hospital.name, 'type': kind}
+            else:
+                types: Dict[str, int] = {}
+                for name, count in cluster['types'].items():
+                    kind = name if name in HOSPITAL_TYPES else OTHER_TYPE
+                    types[kind] = types.get(kind, 0) + count
+                properties = {
+                    'cluster': True,
+                    'cluster_id': cluster['cell'],
+                    'point_count': cluster['count'],
+                    'types': types,
+                    'expansion_zoom': cluster['expansion_zoom'],
+                }
+            features.append({
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': coordinates},
+                'properties': properties,
+            })
+
+        body = json.dumps({'type': 'FeatureCollection', 'features': features},
+                          ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return {
+            'body': body,
+            'etag': hashlib.sha1(body).hexdigest()[:20],
+            'count': len(features),
+            'total': len(index),
+            'data_version': snapshot.version,
+        }
+
+    def get_in_box(self, min_lat: float, min_lng: float, max_lat: float, max_lng: float,
+                   limit: int = 500, hospital_type: str = '',
+                   precision: int = GEOJSON_PRECISION) -> Dict[str, Any]:
+        """
+        위경도 사각형 안의 병원 GeoJSON (스냅샷의 공간 색인 조회)
+
+        - properties는 GeoJSON 레이어와 같은 id, name, type
+        - 영역 안의 병원이 limit보다 많으면 영역 중심에 가까운 병원부터 limit개
+          (FeatureCollection의 total, truncated로 표시 - 지도는 확대하거나 클러스터 사용)
+
+        Returns:
+            {'body': bytes, 'etag', 'count'(feature 수), 'total'(영역 안의 병원 수), 'data_version'}
+
+        Raises:
+            ValueError: 잘못된 영역/limit/종별/자릿수
+        """
+        if not (-90 <= min_lat <= max_lat <= 90 and -180 <= min_lng <= max_lng <= 180):
+            raise ValueError('영역 범위가 올바르지 않습니다. (min_lat <= max_lat, min_lng <= max_lng)')
+        if not 1 <= limit <= MAX_BOX_HOSPITALS:
+            raise ValueError(f'limit은 1에서 {MAX_BOX_HOSPITALS} 사이여야 합니다.')
+        hospital_type = (hospital_type or '').strip()
+        if hospital_type and hospital_type not in HOSPITAL_TYPES + (OTHER_TYPE,):
+            raise ValueError(f"type은 {', '.join(HOSPITAL_TYPES + (OTHER_TYPE,))} 중 하나여야 합니다.")
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(f'precision은 {MIN_PRECISION}~{MAX_PRECISION} 사이여야 합니다.')
+
+        snapshot = self._get_repository().snapshot()
+        by_id = snapshot.by_id
+        matches = []
+        for hospital_id in snapshot.spatial_index.in_box(min_lat, min_lng, max_lat, max_lng):
+            hospital = by_id[hospital_id]
+            kind = hospital.hospital_type if hospital.hospital_type in HOSPITAL_TYPES else OTHER_TYPE
+            if not hospital_type or kind == hospital_type:
+                matches.append((hospital, kind))
+
+        if len(matches) > limit:
+            center_lat, center_lng = (min_lat + max_lat) / 2, (min_lng + max_lng) / 2
+            matches.sort(key=lambda match: ((match[0].latitude - center_lat) ** 2
+                                            + (match[0].longitude - center_lng) ** 2,
+                                            match[0].hospital_id))
+            selected = sorted(matches[:limit], key=lambda match: match[0].hospital_id)
+        else:
+            selected = matches
+
+        features = [{
+            'type': 'Feature',
+            'geometry': {
+                'type': 'Point',
+                'coordinates': [round(hospital.longitude, precision), round(hospital.latitude, precision)],
+            },
+            'properties': {'id': hospital.hospital_id, 'name': hospital.name, 'type': kind},
+        } for hospital, kind in selected]
+        collection = {
+            'type': 'FeatureCollection',
+            'features': features,
+            'total': len(matches),
+            'truncated': len(matches) > len(features),
+        }
+        body = json.dumps(collection, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return {
+            'body': body,
+            'etag': hashlib.sha1(body).hexdigest()[:20],
+            'count': len(features),
+            'total': len(matches),
+            'data_version': snapshot.version,
+        }
+
+    def _get_repository(self):
+        if self._repository is None:
+            from ..repositories.testdb_hospital_repository import TestDBHospitalRepository
+            self._repository = TestDBHospitalRepository()
+        return self._repository
+
+    @staticmethod
+    def _build_layer(snapshot: HospitalSnapshot, region: str, hospital_type: str,
+                     precision: int) -> Dict[str, Any]:
+        collection = build_hospital_geojson(snapshot, region, hospital_type, precision)
+        body = json.dumps(collection, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return {
+            'body': body,
+            # 본문 해시 - 데이터가 바뀌어도 이 레이어 내용이 같으면 304 유지
+            'etag': hashlib.sha1(body).hexdigest()[:20],
+            'count': len(collection['features']),
+            'data_version': snapshot.version,
+        }
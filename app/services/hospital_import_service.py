@@ -0,0 +1,259 @@
+"""
+Hospital Import Service
+병원 목록 엑셀(xlsx)/CSV 파일을 위탁병원현황 테이블로 가져오는 스트리밍 가져오기 서비스
+"""
+
+import os
+import re
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from ..repositories.hospital_crud_repository import HospitalCrudRepository
+
+# 파일 헤더 -> 위탁병원현황 컬럼 (export_to_excel로 내보낸 파일의 헤더 포함)
+COLUMN_ALIASES = {
+    'ID': '연번',
+    'id': '연번',
+    '병원명': '요양기관명',
+    '기관명': '요양기관명',
+    '진료과목': '종별',
+    '종류': '종별',
+    '연락처': '전화번호',
+}
+
+# 문자열 컬럼 최대 길이 (ddl1.sql의 varchar 크기)
+MAX_LENGTHS = {
+    '시군구': 8,
+    '요양기관명': 32,
+    '종별': 4,
+    '전화번호': 16,
+    '주소': 64,
+    '상세주소': 64,
+}
+INT_COLUMNS = ('병상수', '진료과수')
+FLOAT_COLUMNS = ('경도', '위도')
+
+# 대한민국 좌표 범위 (범위를 벗어나면 위경도가 뒤바뀌었거나 잘못된 값)
+LAT_RANGE = (32.0, 39.5)
+LNG_RANGE = (124.0, 132.0)
+
+# 주소에서 시군구 추출 (예: '... 강원특별자치도 강릉시 ...' -> '강릉시')
+_SIGUNGU_RE = re.compile(r'(?:특별시|광역시|특별자치시|도)\s+(\S+?[시군구])(?:\s|$)')
+
+SUPPORTED_EXTENSIONS = ('.xlsx', '.csv')
+
+
+class HospitalImportError(Exception):
+    """가져올 수 없는 파일 (형식, 헤더 오류)"""
+
+
+def _read_csv_chunks(path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """CSV를 chunk_size 행씩 읽기 (UTF-8 BOM, 안 되면 CP949)"""
+    for encoding in ('utf-8-sig', 'cp949'):
+        try:
+            reader = pd.read_csv(path, dtype=str, chunksize=chunk_size,
+                                 encoding=encoding, keep_default_na=False)
+            first = next(reader, None)
+        except UnicodeDecodeError:
+            continue
+        if first is None:
+            return
+        yield first
+        yield from reader
+        return
+    raise HospitalImportError('CSV 인코딩을 확인할 수 없습니다 (UTF-8 또는 CP949만 지원)')
+
+
+def _read_xlsx_chunks(path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """xlsx 첫 시트를 read-only 모드로 chunk_size 행씩 읽기"""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if not header or all(value is None for value in header):
+            return
+        columns = [str(value).strip() if value is not None else '' for value in header]
+        buffer: List[tuple] = []
+        for row in rows:
+            buffer.append(row)
+            if len(buffer) >= chunk_size:
+                yield pd.DataFrame(buffer, columns=columns, dtype=object)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=columns, dtype=object)
+    finally:
+        workbook.close()
+
+
+def read_chunks(path: str, chunk_size: int = 500) -> Iterator[pd.DataFrame]:
+    """파일 형식에 맞게 DataFrame 묶음을 차례로 반환 (전체를 메모리에 올리지 않음)"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return _read_csv_chunks(path, chunk_size)
+    if extension == '.xlsx':
+        return _read_xlsx_chunks(path, chunk_size)
+    raise HospitalImportError(f"지원하지 않는 파일 형식입니다: {extension} ({', '.join(SUPPORTED_EXTENSIONS)}만 지원)")
+
+
+def normalize_chunk(frame: pd.DataFrame, first_row: int = 2):
+    """
+    DataFrame 묶음을 위탁병원현황 행으로 정규화/검증 (열 단위 벡터 연산)
+
+    Args:
+        first_row: frame 첫 행의 파일상 행 번호 (헤더가 1행)
+
+    Returns:
+        (저장할 행 딕셔너리 목록, [{'row': 행 번호, 'error': 사유}] 목록)
+    """
+    frame = frame.rename(columns=lambda name: COLUMN_ALIASES.get(str(name).strip(), str(name).strip()))
+    frame = frame.loc[:, ~frame.columns.duplicated()]
+    if '요양기관명' not in frame.columns:
+        raise HospitalImportError('요양기관명(또는 병원명) 컬럼이 없습니다')
+
+    data = pd.DataFrame(index=frame.index)
+    for column in MAX_LENGTHS:
+        values = frame[column] if column in frame.columns else pd.Series('', index=frame.index)
+        data[column] = values.fillna('').astype(str).str.strip()
+
+    # 주소만 있고 시군구가 없으면 주소에서 추출
+    missing_sigungu = data['시군구'] == ''
+    if missing_sigungu.any():
+        extracted = data.loc[missing_sigungu, '주소'].str.extract(_SIGUNGU_RE, expand=False)
+        data.loc[missing_sigungu, '시군구'] = extracted.fillna('')
+        # 세종특별자치시는 하위 시군구가 없음
+        sejong = (data['시군구'] == '') & data['주소'].str.contains('세종특별자치시', regex=False)
+        data.loc[sejong, '시군구'] = '세종시'
+
+    for column in INT_COLUMNS:
+        # 없는 컬럼/빈 칸은 0 (내보낸 엑셀에는 병상수, 진료과수가 없음)
+        values = frame[column] if column in frame.columns else pd.Series(0, index=frame.index)
+        values = values.where(values.notna() & (values != ''), 0)
+        data[column] = pd.to_numeric(values, errors='coerce')
+    for column in FLOAT_COLUMNS:
+        values = frame[column] if column in frame.columns else pd.Series(None, index=frame.index)
+        data[column] = pd.to_numeric(values, errors='coerce')
+    ids = frame['연번'] if '연번' in frame.columns else pd.Series(None, index=frame.index)
+    data['연번'] = pd.to_numeric(ids.where(ids != '', None), errors='coerce')
+
+    # 빈 행(모든 값이 비어 있음)은 조용히 건너뜀
+    blank = (data['요양기관명'] == '') & (data['주소'] == '') & data['위도'].isna()
+
+    reasons = pd.Series('', index=data.index, dtype=object)
+
+    def reject(mask, reason):
+        mask = mask & ~blank & (reasons == '')
+        reasons[mask] = reason
+
+    reject(data['요양기관명'] == '', '요양기관명이 비어 있습니다')
+    reject(data['주소'] == '', '주소가 비어 있습니다')
+    reject(data['종별'] == '', '종별이 비어 있습니다')
+    reject(data['시군구'] == '', '시군구가 비어 있고 주소에서도 찾을 수 없습니다')
+    for column in INT_COLUMNS:
+        reject(data[column].isna() | (data[column] < 0) | (data[column] % 1 != 0),
+               f'{column}는 0 이상의 정수여야 합니다')
+    reject(data['위도'].isna() | data['경도'].isna(), '위도/경도가 숫자가 아닙니다')
+    reject(~data['위도'].between(*LAT_RANGE) | ~data['경도'].between(*LNG_RANGE),
+           '위도/경도가 대한민국 범위를 벗어났습니다')
+    reject(data['연번'].notna() & ((data['연번'] < 1) | (data['연번'] % 1 != 0)),
+           '연번은 1 이상의 정수여야 합니다')
+    for column, limit in MAX_LENGTHS.items():
+        reject(data[column].str.len() > limit, f'{column}는 {limit}자 이하여야 합니다')
+
+    valid = ~blank & (reasons == '')
+    rows = []
+    for record in data[valid].to_dict('records'):
+        record['연번'] = None if pd.isna(record['연번']) else int(record['연번'])
+        for column in INT_COLUMNS:
+            record[column] = int(record[column])
+        rows.append(record)
+
+    errors = [{'row': first_row + offset, 'error': reason}
+              for offset, reason in enumerate(reasons.tolist()) if reason]
+    return rows, errors
+
+
+class HospitalImportService:
+    """
+    병원 목록 파일 가져오기
+
+    - xlsx는 openpyxl read-only 모드, CSV는 pandas chunksize로 묶음 단위 스트리밍
+    - 묶음마다 벡터 연산으로 정규화/검증 후 한 트랜잭션(executemany)으로 upsert
+    - 연번이 있는 행은 해당 연번을 추가/수정, 없는 행은 새로 추가
+    - 스냅샷 캐시는 모든 묶음을 저장한 뒤 한 번만 무효화
+    """
+
+    # 응답에 담을 최대 오류 행 수 (전체 개수는 별도로 집계)
+    MAX_REPORTED_ERRORS = 100
+
+    def __init__(self, repository: Optional[HospitalCrudRepository] = None, chunk_size: int = 500):
+        self.repository = repository or HospitalCrudRepository()
+        self.chunk_size = chunk_size
+
+    def import_file(self, path: str, dry_run: bool = False,
+                    progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        파일 가져오기
+
+        Args:
+            dry_run: True면 검증만 하고 저장하지 않음
+            progress: 묶음마다 진행 상황(dict)을 받는 콜백
+
+        Returns:
+            {'rows', 'valid', 'inserted', 'upserted', 'rejected', 'errors', 'chunks', 'elapsed'}
+        """
+        summary: Dict[str, Any] = {}
+        for summary in self.iter_import(path, dry_run=dry_run):
+            if progress and not summary.get('done'):
+                progress(summary)
+        return summary
+
+    def iter_import(self, path: str, dry_run: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        묶음을 하나 저장할 때마다 진행 상황을 내보내는 제너레이터
+
+        진행 중에는 집계만, 마지막(done=True)에는 오류 행 목록(errors)까지 담는다.
+        """
+        started = time.monotonic()
+        summary: Dict[str, Any] = {
+            'file': os.path.basename(path),
+            'dry_run': dry_run,
+            'rows': 0,
+            'valid': 0,
+            'inserted': 0,
+            'upserted': 0,
+            'rejected': 0,
+            'errors': [],
+            'chunks': 0,
+        }
+        next_row = 2  # 헤더 다음 행부터
+        try:
+            for frame in read_chunks(path, self.chunk_size):
+                rows, errors = normalize_chunk(frame, first_row=next_row)
+                next_row += len(frame)
+
+                if rows and not dry_run:
+                    saved = self.repository.upsert_chunk(rows, invalidate=False)
+                    summary['inserted'] += saved['inserted']
+                    summary['upserted'] += saved['upserted']
+
+                summary['rows'] += len(frame)
+                summary['valid'] += len(rows)
+                summary['rejected'] += len(errors)
+                room = self.MAX_REPORTED_ERRORS - len(summary['errors'])
+                if room > 0:
+                    summary['errors'].extend(errors[:room])
+                summary['chunks'] += 1
+                summary['elapsed'] = round(time.monotonic() - started, 3)
+                yield {key: value for key, value in summary.items() if key != 'errors'}
+        finally:
+            if not dry_run and (summary['inserted'] or summary['upserted']):
+                # 중간에 실패해도 이미 커밋된 묶음이 보이도록 무효화
+                self.repository.invalidate_cache()
+
+        summary['elapsed'] = round(time.monotonic() - started, 3)
+        summary['done'] = True
+        yield summary
@@ -3,9 +3,13 @@ Hospital Service
 병원 관련 비즈니스 로직을 처리하는 서비스
 """
 
+import hashlib
+import json
 from typing import List, Optional, Dict, Any
 from ..models.hospital import Hospital
+from ..models.hospital_region_index import parse_region
 from ..repositories.hospital_repository import HospitalRepository
+from .folium_map_service import create_popup_html
 
 class HospitalService:
     def __init__(self, repository: HospitalRepository = None):
@@ -21,11 +25,70 @@ class HospitalService:
         hospital = self.repository.find_by_id(hospital_id)
         return hospital.to_dict() if hospital else None
         
+    def get_hospital_popup(self, hospital_id: int) -> Optional[Dict[str, Any]]:
+        """
+        지도 마커 팝업 HTML 조회 (스냅샷마다 처음 요청한 병원만 만들어 재사용)
+        
+        Returns:
+            {'html', 'etag', 'data_version'}, 병원이 없거나 좌표가 없으면 None
+        """
+        snapshot = self.repository.snapshot()
+        popups = snapshot.derived('popup_html', lambda s: {})
+        popup = popups.get(hospital_id)
+        if popup is None:
+            hospital = snapshot.by_id.get(hospital_id)
+            if hospital is None or hospital.latitude is None or hospital.longitude is None:
+                return None
+            html = create_popup_html(hospital)
+            popup = popups[hospital_id] = {
+                'html': html,
+                'etag': hashlib.sha1(html.encode('utf-8')).hexdigest()[:16],
+                'data_version': snapshot.version,
+            }
+        return popup
+        
+    def get_hospitals_by_ids(self, hospital_ids: List[int], crud_format: bool = False) -> List[Dict[str, Any]]:
+        """여러 병원 정보를 한 번에 조회 (요청한 ID 순서 유지)"""
+        hospitals = self.repository.get_many(hospital_ids)
+        if crud_format:
+            return [hospital.to_crud_dict() for hospital in hospitals]
+        return [hospital.to_dict() for hospital in hospitals]
+        
     def get_all_hospitals(self) -> List[Dict[str, Any]]:
         """모든 병원 목록 조회"""
         hospitals = self.repository.find_all()
         return [hospital.to_dict() for hospital in hospitals]
         
+    def get_overview_stats(self) -> Dict[str, int]:
+        """
+        메인 페이지 통계 (병원 수, 시도 수, 진료과목 수)
+        
+        스냅샷이 있으면 시도/시군구 색인으로 세고 스냅샷마다 한 번만 계산
+        """
+        if hasattr(self.repository, 'snapshot'):
+            return self.repository.snapshot().derived('overview_stats', lambda snapshot: {
+                'total_hospitals': len(snapshot),
+                'total_provinces': len(snapshot.region_index.sido_counts()),
+                'total_departments': len({department for hospital in snapshot.hospitals
+                                          for department in hospital.medical_departments or () if department}),
+            })
+        
+        hospitals = self.repository.find_all()
+        provinces = {parse_region(hospital.address)[0] for hospital in hospitals} - {''}
+        departments = {department for hospital in hospitals
+                       for department in hospital.medical_departments or () if department}
+        return {
+            'total_hospitals': len(hospitals),
+            'total_provinces': len(provinces),
+            'total_departments': len(departments),
+        }
+        
+    def get_all_hospitals_json(self) -> str:
+        """모든 병원 목록을 JSON 문자열로 반환 (스냅샷의 미리 직렬화된 행 재사용)"""
+        if hasattr(self.repository, 'snapshot'):
+            return self.repository.snapshot().store.to_json()
+        return json.dumps(self.get_all_hospitals(), ensure_ascii=False)
+        
     def update_hospital(self, hospital_id: int, hospital_data: Dict[str, Any]) -> bool:
         """병원 정보 수정"""
         hospital_data['hospital_id'] = hospital_id
@@ -37,12 +100,33 @@ class HospitalService:
         return self.repository.delete(hospital_id)
         
     def search_hospitals_by_name(self, name: str) -> List[Dict[str, Any]]:
-        """병원명으로 검색"""
+        """병원 검색 (검색 색인이 있으면 병원명/주소/전화번호를 관련도 순으로)"""
+        if hasattr(self.repository, 'snapshot'):
+            snapshot = self.repository.snapshot()
+            hospitals = snapshot.hospitals
+            results = []
+            for position, score in snapshot.search_index.search(name):
+                hospital = hospitals[position].to_dict()
+                hospital['score'] = score
+                results.append(hospital)
+            return results
+        
         all_hospitals = self.get_all_hospitals()
         return [h for h in all_hospitals if name.lower() in h['name'].lower()]
         
     def get_hospitals_by_location(self, lat: float, lng: float, radius: float = 1.0) -> List[Dict[str, Any]]:
         """위치 기준으로 병원 검색 (반경 내)"""
+        if hasattr(self.repository, 'snapshot'):
+            # 스냅샷의 격자 공간 색인으로 반경을 덮는 셀의 병원만 거리 계산
+            snapshot = self.repository.snapshot()
+            by_id = snapshot.by_id
+            nearby_hospitals = []
+            for hospital_id, distance in snapshot.spatial_index.within(lat, lng, radius):
+                hospital = by_id[hospital_id].to_dict()
+                hospital['distance'] = round(distance, 2)
+                nearby_hospitals.append(hospital)
+            return nearby_hospitals
+        
         import math
         
         def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
@@ -79,6 +163,30 @@ class HospitalService:
         nearby_hospitals.sort(key=lambda x: x.get('distance', float('inf')))
         return nearby_hospitals
     
+    def get_nearest_hospitals(self, lat: float, lng: float, k: int = 5,
+                              hospital_type: Optional[str] = None,
+                              min_beds: Optional[int] = None) -> List[Dict[str, Any]]:
+        """가장 가까운 k개 병원 (종별, 최소 병상수 필터)"""
+        snapshot = self.repository.snapshot()
+        by_id = snapshot.by_id
+        
+        accept = None
+        if hospital_type or min_beds:
+            # 조건은 스냅샷 store의 열 배열로 한 번에 계산하고 후보 확인은 행 위치로 조회
+            store = snapshot.store
+            matching = store.matches(hospital_type, min_beds)
+            def accept(hospital_id):
+                return bool(matching[store.position(hospital_id)])
+        
+        results = []
+        for hospital_id, distance in snapshot.spatial_index.nearest(lat, lng, k, accept):
+            hospital = by_id[hospital_id]
+            data = hospital.to_dict()
+            data['bed_count'] = hospital.bed_count
+            data['distance'] = round(distance, 3)
+            results.append(data)
+        return results
+    
     def get_hospitals_for_crud(self, search: str = '', filter_type: str = '') -> List[Dict[str, Any]]:
         """CRUD용 병원 목록 조회 (검색 및 필터링)"""
         return self.repository.find_all_for_crud(search, filter_type)
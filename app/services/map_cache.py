@@ -0,0 +1,301 @@
+"""
+Folium Map Cache
+(지역, 렌더링 옵션, 데이터 fingerprint)를 키로 생성된 Folium 지도 HTML을 재사용하는 캐시
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Mapping, Optional
+
+from ..repositories.hospital_cache import HospitalSnapshot
+from .artifact_store import ArtifactStore, artifact_store
+from .folium_map_service import FoliumMapService, choose_render_mode
+
+
+class FoliumMapCache:
+    """
+    생성된 지도 HTML 캐시
+
+    - 캐시 키: 지역, 렌더링 옵션, 스냅샷 fingerprint(데이터 내용 해시), 렌더러 버전의 해시
+    - 같은 키의 파일이 저장소 색인에 있으면 다시 그리지 않고 경로만 반환
+    - 데이터가 실제로 바뀌어 fingerprint가 달라질 때만 새 파일 생성
+    - 같은 키를 동시에 요청하면 한 번만 생성 (키별 잠금)
+    - 파일은 ArtifactStore에 원자적으로 쓰고, 오래된 지도는 저장소의 TTL/용량 상한으로 정리
+    - allow_stale: 새 데이터의 지도를 사전 생성하는 동안 이전 지도를 바로 반환
+    - background: 준비된 지도가 없으면 요청 스레드에서 그리지 않고 백그라운드에서 생성 (pending 반환)
+    """
+
+    # 지도 HTML 구성(마커, 팝업, 정보 패널)을 바꾸면 올려서 기존 파일을 무효화
+    RENDERER_VERSION = 4
+
+    def __init__(self, directory: Optional[str] = None, map_service=None, repository=None,
+                 store: Optional[ArtifactStore] = None):
+        # directory만 지정하면 그 폴더의 별도 저장소 사용 (테스트, 스크립트)
+        self.store = store or (ArtifactStore(directory) if directory else artifact_store)
+        self._map_service = map_service
+        self._repository = repository
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._latest: Dict[str, Dict[str, Any]] = {}  # 지역/옵션 -> 마지막으로 준비된 지도
+        self._pending: Dict[str, threading.Thread] = {}  # 캐시 키 -> 백그라운드 생성 스레드
+        self._counters = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'pending': 0,
+                          'renders': 0, 'render_errors': 0}
+
+    @property
+    def directory(self) -> str:
+        """지도 파일 폴더 (저장소 폴더)"""
+        return self.store.directory
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    def cache_key(self, region: str, options: Mapping[str, Any], fingerprint: str) -> str:
+        """지도 파일의 내용 주소 (입력이 같으면 항상 같은 키)"""
+        payload = json.dumps({
+            'region': region or '',
+            'options': dict(sorted(options.items())),
+            'data': fingerprint,
+            'renderer': self.RENDERER_VERSION,
+        }, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def plan(self, region: str = '', snapshot: Optional[HospitalSnapshot] = None,
+             **options) -> Optional[Dict[str, Any]]:
+        """
+        지도 한 장의 캐시 키/경로/대상 병원 계산 (렌더링하지 않음)
+
+        Returns:
+            {'region', 'options', 'key', 'filename', 'filepath', 'hospitals', 'data_version'}
+            지역에 병원이 없으면 None
+        """
+        region = (region or '').strip()
+        if region:
+            # 지역 지도는 중심/줌을 지역별로 정하므로 표시 방식만 결과에 영향을 줌
+            options = {'render_mode': options.get('render_mode')}
+        if snapshot is None:
+            snapshot = self.snapshot()
+        hospitals = snapshot.in_region(region)
+        if not hospitals:
+            return None
+        # 표시 방식을 지정하지 않으면 병원 수로 결정 (자동 선택과 같은 방식을 지정해도 같은 키)
+        options = dict(options, render_mode=options.get('render_mode') or choose_render_mode(len(hospitals)))
+
+        key = self.cache_key(region, options, snapshot.fingerprint)
+        filename = self._filename(region, key)
+        return {
+            'region': region,
+            'options': options,
+            'key': key,
+            'filename': filename,
+            'filepath': self.store.path(filename),
+            'hospitals': hospitals,
+            'data_version': snapshot.version,
+        }
+
+    def get_or_render(self, region: str = '', allow_stale: bool = False, background: bool = False,
+                      **options) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 지도 반환 (없으면 생성)
+
+        Args:
+            region: 지역명 (빈 문자열이면 전국)
+            allow_stale: True면 현재 데이터의 지도가 아직 없을 때 같은 지역/옵션의
+                이전 지도를 바로 반환 (사전 생성이 새 지도를 만드는 중일 때)
+            background: True면 내보낼 지도가 없을 때 백그라운드 생성을 시작하고
+                pending=True 결과를 바로 반환 (False면 요청 스레드에서 생성)
+            options: 렌더링 옵션 (render_mode, 전국 지도는 center_lat, center_lng, zoom_start도 사용)
+
+        Returns:
+            {'filepath', 'filename', 'hospital_count', 'cache_hit', 'data_version', 'render_mode',
+            'stale', 'pending'}, 지역에 병원이 없으면 None
+        """
+        job = self.plan(region, **options)
+        if job is None:
+            return None
+
+        cache_hit = self.store.get(job['filename']) is not None
+        if not cache_hit and allow_stale:
+            previous = self._latest_ready(job)
+            if previous is not None:
+                with self._lock:
+                    self._counters['stale_hits'] += 1
+                return previous
+
+        if not cache_hit and background:
+            if self.is_ready(job):
+                cache_hit = True
+            else:
+                self._render_in_background(job)
+                with self._lock:
+                    self._counters['pending'] += 1
+                return dict(self._result(job, cache_hit=False), pending=True)
+
+        if not cache_hit:
+            with self._key_lock(job['key']):
+                # 기다리는 동안 다른 요청이 만들었을 수 있음
+                cache_hit = self.is_ready(job)
+                if not cache_hit:
+                    self.render(job)
+            with self._lock:
+                self._key_locks.pop(job['key'], None)
+
+        with self._lock:
+            self._counters['hits' if cache_hit else 'misses'] += 1
+        return self.register(job, cache_hit)
+
+    def register(self, job: Mapping[str, Any], cache_hit: bool = True) -> Dict[str, Any]:
+        """생성이 끝난 지도를 해당 지역/옵션의 최신 지도로 기록"""
+        result = self._result(job, cache_hit)
+        slot = self._slot(job)
+        with self._lock:
+            latest = self._latest.get(slot)
+            if latest is None or latest['data_version'] <= result['data_version']:
+                self._latest[slot] = result
+        return result
+
+    def is_ready(self, job: Mapping[str, Any]) -> bool:
+        """
+        plan()으로 계산한 지도가 이미 저장소에 있는지 확인
+
+        색인에 없으면 다른 프로세스(사전 생성 스크립트 등)가 만든 파일인지 한 번 확인해 등록한다.
+        (색인에 없을 때는 어차피 지도를 새로 그려야 하므로 이 확인 비용은 무시할 수 있음)
+        """
+        if self.store.contains(job['filename']):
+            return True
+        if os.path.isfile(job['filepath']):
+            self.store.add(job['filename'], kind='map')
+            return True
+        return False
+
+    def render(self, job: Mapping[str, Any]) -> None:
+        """plan()으로 계산한 지도를 현재 프로세스에서 생성해 저장소에 등록"""
+        map_service = self._get_map_service()
+        try:
+            self.store.write(job['filename'], lambda path: draw_map(
+                job['region'], job['options'], job['hospitals'], path, map_service), kind='map')
+        except Exception:
+            with self._lock:
+                self._counters['render_errors'] += 1
+            raise
+        with self._lock:
+            self._counters['renders'] += 1
+
+    def snapshot(self) -> HospitalSnapshot:
+        """지도를 그릴 현재 병원 스냅샷"""
+        return self._get_repository().snapshot()
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/생성 카운터"""
+        with self._lock:
+            result = dict(self._counters)
+        result['directory'] = self.directory
+        result['store'] = self.store.stats()
+        return result
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _result(job: Mapping[str, Any], cache_hit: bool) -> Dict[str, Any]:
+        return {
+            'filepath': job['filepath'],
+            'filename': job['filename'],
+            'hospital_count': len(job['hospitals']),
+            'cache_hit': cache_hit,
+            'data_version': job['data_version'],
+            'render_mode': job['options']['render_mode'],
+            'stale': False,
+            'pending': False,
+        }
+
+    def _render_in_background(self, job: Mapping[str, Any]) -> None:
+        """지도 한 장을 데몬 스레드에서 생성 (같은 키는 한 번만)"""
+        def work():
+            try:
+                with self._key_lock(job['key']):
+                    if not self.is_ready(job):
+                        self.render(job)
+                self.register(job, cache_hit=False)
+            except Exception as e:
+                print(f"지도 생성 오류: {e}")
+            finally:
+                with self._lock:
+                    self._pending.pop(job['key'], None)
+                    self._key_locks.pop(job['key'], None)
+
+        with self._lock:
+            if job['key'] in self._pending:
+                return
+            thread = self._pending[job['key']] = threading.Thread(
+                target=work, name=f"map-render-{job['key'][:8]}", daemon=True)
+        thread.start()
+
+    def _get_repository(self):
+        if self._repository is None:
+            from ..repositories.testdb_hospital_repository import TestDBHospitalRepository
+            self._repository = TestDBHospitalRepository()
+        return self._repository
+
+    def _get_map_service(self):
+        if self._map_service is None:
+            self._map_service = FoliumMapService()
+        return self._map_service
+
+    @staticmethod
+    def _filename(region: str, key: str) -> str:
+        region_name = region.replace(' ', '_') if region else 'all'
+        return f'hospital_map_{region_name}_{key[:16]}.html'
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    @staticmethod
+    def _slot(job: Mapping[str, Any]) -> str:
+        return json.dumps([job['region'], dict(sorted(job['options'].items()))], ensure_ascii=False)
+
+    def _latest_ready(self, job: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            latest = self._latest.get(self._slot(job))
+        if latest is None or self.store.get(latest['filename']) is None:
+            return None
+        return dict(latest, cache_hit=True, stale=True)
+
+
+def draw_map(region: str, options: Mapping[str, Any], hospitals, filepath: str,
+             map_service=None) -> str:
+    """지도 HTML 한 장을 filepath에 그대로 생성"""
+    if map_service is None:
+        map_service = FoliumMapService()
+    if region:
+        return map_service.create_region_map(region, hospitals=hospitals, filepath=filepath,
+                                             render_mode=options.get('render_mode'))
+    return map_service.create_hospital_map(hospitals=hospitals, filepath=filepath, **options)
+
+
+def render_map_file(region: str, options: Mapping[str, Any], hospitals, filepath: str,
+                    map_service=None) -> str:
+    """
+    지도 HTML 한 장 생성 (사전 생성 작업 프로세스용)
+
+    임시 파일에 쓴 뒤 os.replace로 교체하므로 반쯤 쓰인 파일을 내보내지 않는다.
+    색인 등록은 결과를 받은 메인 프로세스가 ArtifactStore.add로 한다.
+    """
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    temp_path = f'{filepath}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        draw_map(region, options, hospitals, temp_path, map_service)
+        os.replace(temp_path, filepath)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return filepath
+
+
+# 애플리케이션 공유 지도 캐시 (공유 ArtifactStore 사용)
+folium_map_cache = FoliumMapCache()
@@ -0,0 +1,203 @@
+"""
+Map Prerender Service
+병원 데이터 버전이 바뀔 때마다 전국/시도별 Folium 지도를 백그라운드에서 미리 생성
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from .folium_map_service import REGION_CENTERS
+from .map_cache import FoliumMapCache, folium_map_cache, render_map_file
+
+# 기본 작업 프로세스 수 상한 (지도 18장이라 그 이상은 이득이 적음)
+MAX_DEFAULT_WORKERS = 4
+
+
+def prerender_targets() -> List[str]:
+    """사전 생성 대상 지역 (빈 문자열은 전국 지도)"""
+    return [''] + list(REGION_CENTERS)
+
+
+class MapPrerenderer:
+    """
+    지도 사전 생성기
+
+    - 전국 지도와 REGION_CENTERS의 17개 시도 지도를 작업 프로세스에서 병렬 생성
+    - 파일명이 데이터 fingerprint 기반이라 이미 있는 지도는 건너뜀
+    - 스케줄러(start)는 데몬 스레드에서 interval초마다 스냅샷 버전을 확인하고
+      버전이 바뀌었을 때만 다시 생성
+    - 스케줄러가 도는 동안 API는 준비된 지도(allow_stale로 이전 데이터의 지도 포함)만 내보내고
+      아직 없는 지도는 백그라운드에서 생성하며 202를 반환
+    - 작업 프로세스는 spawn이라 실행 스크립트(__main__)를 다시 import하므로
+      실행 스크립트는 서버 시작을 if __name__ == '__main__': 안에서 해야 함 (run_prod.py)
+    """
+
+    def __init__(self, cache: Optional[FoliumMapCache] = None,
+                 workers: Optional[int] = None, interval: float = 30.0):
+        self.cache = cache or folium_map_cache
+        # 0이면 작업 프로세스 없이 현재 프로세스에서 차례로 생성
+        self.workers = min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS) if workers is None else workers
+        self.interval = interval
+
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._built_version = 0
+        self._last_summary: Optional[Dict[str, Any]] = None
+        self._counters = {'runs': 0, 'rendered': 0, 'failed': 0}
+
+    @property
+    def running(self) -> bool:
+        """스케줄러 스레드 동작 여부"""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def run(self, snapshot=None, regions: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        지도 사전 생성 한 번 실행
+
+        Args:
+            snapshot: 기준 병원 스냅샷 (기본: 현재 스냅샷)
+            regions: 생성할 지역 목록 (기본: 전국 + 17개 시도)
+
+        Returns:
+            {'data_version', 'rendered', 'skipped', 'empty', 'failed', 'elapsed'}
+        """
+        with self._run_lock:
+            started = time.monotonic()
+            if snapshot is None:
+                snapshot = self.cache.snapshot()
+            summary: Dict[str, Any] = {
+                'data_version': snapshot.version,
+                'rendered': [],
+                'skipped': [],
+                'empty': [],
+                'failed': [],
+            }
+
+            jobs = []
+            for region in (prerender_targets() if regions is None else regions):
+                job = self.cache.plan(region, snapshot)
+                if job is None:
+                    summary['empty'].append(region or '전국')
+                elif self.cache.is_ready(job):
+                    self.cache.register(job)
+                    summary['skipped'].append(job['filename'])
+                else:
+                    jobs.append(job)
+
+            if jobs:
+                if self.workers <= 0 or len(jobs) == 1:
+                    self._render_here(jobs, summary)
+                else:
+                    self._render_in_workers(jobs, summary)
+
+            summary['elapsed'] = round(time.monotonic() - started, 3)
+            with self._lock:
+                self._counters['runs'] += 1
+                self._counters['rendered'] += len(summary['rendered'])
+                self._counters['failed'] += len(summary['failed'])
+                self._last_summary = summary
+            return summary
+
+    def poll(self) -> Optional[Dict[str, Any]]:
+        """데이터 버전이 마지막 생성 이후 바뀌었으면 사전 생성 (바뀌지 않았으면 None)"""
+        snapshot = self.cache.snapshot()
+        if not snapshot.version or snapshot.version == self._built_version:
+            return None
+        summary = self.run(snapshot)
+        if not summary['failed']:
+            self._built_version = snapshot.version
+        return summary
+
+    def start(self) -> None:
+        """백그라운드 스케줄러 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name='map-prerender', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """스케줄러 중지 (진행 중인 생성은 끝까지 수행)"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """누적 카운터와 마지막 실행 결과"""
+        with self._lock:
+            result = dict(self._counters)
+            result.update({
+                'running': self.running,
+                'workers': self.workers,
+                'interval': self.interval,
+                'built_version': self._built_version,
+                'last_run': self._last_summary,
+            })
+            return result
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"지도 사전 생성 오류: {e}")
+            self._stop.wait(self.interval)
+
+    def _render_here(self, jobs: List[Mapping[str, Any]], summary: Dict[str, Any]) -> None:
+        for job in jobs:
+            try:
+                self.cache.render(job)
+            except Exception as e:
+                summary['failed'].append({'region': job['region'] or '전국', 'error': str(e)})
+                continue
+            self.cache.register(job, cache_hit=False)
+            summary['rendered'].append(job['filename'])
+
+    def _render_in_workers(self, jobs: List[Mapping[str, Any]], summary: Dict[str, Any]) -> None:
+        # 웹 서버 스레드가 있는 프로세스를 fork하지 않도록 spawn으로 작업 프로세스 시작
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs)), mp_context=context) as executor:
+            futures = {
+                executor.submit(render_map_file, job['region'], job['options'],
+                                list(job['hospitals']), job['filepath']): job
+                for job in jobs
+            }
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    summary['failed'].append({'region': job['region'] or '전국', 'error': str(e)})
+                    continue
+                # 작업 프로세스가 저장소 폴더에 쓴 파일을 색인에 등록
+                self.cache.store.add(job['filename'], kind='map')
+                self.cache.register(job, cache_hit=False)
+                summary['rendered'].append(job['filename'])
+
+
+# 애플리케이션 공유 사전 생성기 (MAP_PRERENDER 설정 시 create_app에서 시작)
+map_prerenderer = MapPrerenderer()
+
+
+def configure_map_prerender(config: Optional[Mapping[str, Any]] = None) -> None:
+    """앱 설정(app.config)으로 사전 생성기 설정, MAP_PRERENDER가 켜져 있으면 스케줄러 시작"""
+    config = config or {}
+    if config.get('MAP_PRERENDER_WORKERS') is not None:
+        map_prerenderer.workers = int(config['MAP_PRERENDER_WORKERS'])
+    if config.get('MAP_PRERENDER_INTERVAL'):
+        map_prerenderer.interval = float(config['MAP_PRERENDER_INTERVAL'])
+    # 작업 프로세스가 실행 스크립트를 다시 import하며 앱을 만들어도 스케줄러는 메인 프로세스에서만 시작
+    if config.get('MAP_PRERENDER') and multiprocessing.parent_process() is None:
+        map_prerenderer.start()
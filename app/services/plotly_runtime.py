@@ -0,0 +1,50 @@
+"""
+Plotly Runtime
+설치된 plotly 패키지의 plotly.js를 내용 해시 파일명으로 한 번만 저장해 모든 차트 페이지가 공유
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
+# 공유 런타임 URL 경로 (/vendor/<파일명>)
+RUNTIME_URL_PREFIX = '/vendor/'
+# 파일명이 내용 해시라 내용이 바뀌면 URL도 바뀌므로 1년 동안 재검증 없이 캐시
+RUNTIME_MAX_AGE = 365 * 24 * 3600
+
+
+@lru_cache(maxsize=1)
+def _plotlyjs() -> bytes:
+    from plotly.offline import get_plotlyjs
+    return get_plotlyjs().encode('utf-8')
+
+
+@lru_cache(maxsize=1)
+def plotly_runtime_filename() -> str:
+    """plotly.js 파일명 ('plotly-<내용 해시>.min.js', Figure spec을 만든 plotly와 같은 버전)"""
+    return f"plotly-{hashlib.sha1(_plotlyjs()).hexdigest()[:12]}.min.js"
+
+
+def plotly_runtime_url() -> str:
+    """페이지에서 불러올 plotly.js URL"""
+    return RUNTIME_URL_PREFIX + plotly_runtime_filename()
+
+
+def ensure_plotly_runtime(directory: Union[str, Path]) -> Path:
+    """
+    directory에 plotly.js가 없으면 저장 (임시 파일에 쓴 뒤 교체)
+
+    Returns:
+        저장된 파일 경로
+    """
+    path = Path(directory) / plotly_runtime_filename()
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(_plotlyjs())
+        os.replace(temp_path, path)
+    return path
+
@@ -0,0 +1,52 @@
+/*
+ * Plotly Charts
+ * 페이지에 한 번 불러온 plotly.js로 Figure spec(JSON)을 받아 차트를 그림
+ *
+ * <div class="plotly-chart" data-spec="/chart-specs/chart4_yearly_area.json"
+ *      data-fallback="/chart4" data-height="750"></div>
+ *
+ * spec이 아직 생성되지 않았으면 (build_charts.py --format spec|both 전) 기존 단독 HTML을 iframe으로 표시
+ */
+(function () {
+  function showFallback(element) {
+    var fallback = element.getAttribute('data-fallback');
+    if (!fallback) {
+      element.textContent = '차트를 불러올 수 없습니다.';
+      return;
+    }
+    var iframe = document.createElement('iframe');
+    iframe.src = fallback;
+    iframe.height = (element.getAttribute('data-height') || 750) + 'px';
+    iframe.style.width = '100%';
+    iframe.style.border = 'none';
+    element.replaceChildren(iframe);
+  }
+
+  function renderChart(element) {
+    if (element.getAttribute('data-state')) {
+      return Promise.resolve();
+    }
+    element.setAttribute('data-state', 'loading');
+    return fetch(element.getAttribute('data-spec'))
+      .then(function (response) {
+        if (!response.ok) {
+          throw new Error(response.status);
+        }
+        return response.json();
+      })
+      .then(function (figure) {
+        element.setAttribute('data-state', 'ready');
+        return Plotly.newPlot(element, figure.data, figure.layout, { responsive: true });
+      })
+      .catch(function () {
+        element.setAttribute('data-state', 'fallback');
+        showFallback(element);
+      });
+  }
+
+  // root 안의 아직 그리지 않은 차트를 모두 그림 (숨겨진 섹션은 보일 때 다시 호출)
+  window.renderPlotlyCharts = function (root) {
+    var elements = (root || document).querySelectorAll('.plotly-chart[data-spec]');
+    return Promise.all(Array.prototype.map.call(elements, renderChart));
+  };
+})();
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hospital Store Benchmark
+기존 Hospital(__dict__) 모델과 __slots__ 모델의 메모리 사용량, HospitalStore(직렬화 캐시)가
+Hospital 객체 위에 추가로 쓰는 메모리, 전체/필터 결과 JSON 직렬화와 종별/병상수 필터 시간 비교
+
+사용법: python benchmarks/bench_hospital_store.py [행 수 ...]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+
+from synthetic_data import BASE_ROW_COUNT, make_hospitals
+from app.models.hospital import Hospital
+from app.models.hospital_store import HospitalStore
+
+
+class LegacyHospital:
+    """변경 전 Hospital 모델 (인스턴스 __dict__ 사용)"""
+    def __init__(self, hospital):
+        self.hospital_id = hospital.hospital_id
+        self.name = hospital.name
+        self.address = hospital.address
+        self.latitude = hospital.latitude
+        self.longitude = hospital.longitude
+        self.medical_departments = list(hospital.medical_departments)
+        self.bed_count = hospital.bed_count
+        self.department_count = hospital.department_count
+
+    @property
+    def hospital_type(self):
+        return self.medical_departments[0] if self.medical_departments else '기타'
+
+    def to_dict(self):
+        return {
+            'hospital_id': self.hospital_id,
+            'name': self.name,
+            'address': self.address,
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+            'medical_departments': self.medical_departments,
+            'hospital_type': self.hospital_type
+        }
+
+
+def copy_hospital(hospital):
+    """__slots__ Hospital 복사 (문자열은 공유)"""
+    return Hospital(
+        hospital_id=hospital.hospital_id,
+        name=hospital.name,
+        address=hospital.address,
+        latitude=hospital.latitude,
+        longitude=hospital.longitude,
+        medical_departments=list(hospital.medical_departments),
+        bed_count=hospital.bed_count,
+        department_count=hospital.department_count
+    )
+
+
+def measure_memory(build):
+    """build()가 만든 객체가 차지하는 메모리 (bytes)"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return result, size
+
+
+def measure_time(func, repeat=20):
+    """func() 평균 실행 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(count):
+    source = make_hospitals(count)
+    hospital_type, min_beds = '병원', 300
+
+    # 문자열은 원본과 공유하므로 객체 자체의 오버헤드만 비교됨
+    legacy, legacy_bytes = measure_memory(lambda: [LegacyHospital(h) for h in source])
+    slots, slots_bytes = measure_memory(lambda: [copy_hospital(h) for h in source])
+    # HospitalStore는 Hospital 객체를 대신하지 않고 스냅샷의 객체 위에 추가로 만드는 직렬화 캐시
+    store, store_bytes = measure_memory(lambda: HospitalStore(slots))
+    json_bytes = sum(sys.getsizeof(fragment) for fragment in store._row_json)
+
+    def loop_filter():
+        return [h for h in legacy if h.hospital_type == hospital_type and (h.bed_count or 0) >= min_beds]
+
+    legacy_ms = measure_time(lambda: json.dumps([h.to_dict() for h in legacy], ensure_ascii=False))
+    cached_ms = measure_time(lambda: store.to_json())
+    loop_filter_ms = measure_time(loop_filter)
+    store_filter_ms = measure_time(lambda: store.filter(hospital_type, min_beds))
+    loop_subset_ms = measure_time(lambda: json.dumps([h.to_dict() for h in loop_filter()], ensure_ascii=False))
+    store_subset_ms = measure_time(lambda: store.to_json(store.filter(hospital_type, min_beds)))
+
+    print(f"\n📊 {count:,}개 병원 (필터: 종별={hospital_type}, 병상수>={min_beds}, "
+          f"{len(store.filter(hospital_type, min_beds)):,}개)")
+    print(f"  메모리  기존 모델(__dict__)       : {legacy_bytes / 1024:10.1f} KB")
+    print(f"  메모리  __slots__ 모델            : {slots_bytes / 1024:10.1f} KB")
+    print(f"  메모리  Store 추가분 필터 열      : {(store_bytes - json_bytes) / 1024:10.1f} KB")
+    print(f"  메모리  Store 추가분 JSON 조각    : {json_bytes / 1024:10.1f} KB")
+    print(f"  전체    to_dict + json.dumps      : {legacy_ms:8.2f} ms")
+    print(f"  전체    Store JSON (캐시)         : {cached_ms:8.4f} ms")
+    print(f"  필터    객체 순회                 : {loop_filter_ms:8.3f} ms")
+    print(f"  필터    Store 열 배열             : {store_filter_ms:8.3f} ms")
+    print(f"  필터+JSON 객체 순회 + json.dumps  : {loop_subset_ms:8.3f} ms")
+    print(f"  필터+JSON Store 조각 이어 붙이기  : {store_subset_ms:8.3f} ms")
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [BASE_ROW_COUNT, BASE_ROW_COUNT * 10]
+    print("=" * 60)
+    print("🏥 병원 데이터 표현 방식 벤치마크")
+    print("=" * 60)
+    for count in counts:
+        run(count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Map Render Mode Benchmark
+FoliumMapService 마커 표시 방식(RENDER_MODES)별 HTML 파일 크기와 생성 시간 비교
+
+사용법: python benchmarks/bench_map_render_modes.py [행 수 ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from synthetic_data import BASE_ROW_COUNT, make_hospitals
+from app.services.folium_map_service import RENDER_MODES, FoliumMapService, choose_render_mode
+
+
+def run(count, directory):
+    hospitals = make_hospitals(count)
+    service = FoliumMapService()
+
+    print(f"\n📊 {count:,}개 병원 (자동 선택: {choose_render_mode(count)})")
+    baseline = None
+    for mode in RENDER_MODES:
+        filepath = os.path.join(directory, f'map_{count}_{mode}.html')
+        start = time.perf_counter()
+        service.create_hospital_map(hospitals=hospitals, filepath=filepath, render_mode=mode)
+        build_ms = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(filepath) / 1024
+        baseline = baseline or size_kb
+        print(f"  {mode:<13}: {size_kb:9,.0f} KB ({size_kb / baseline * 100:5.1f}%)  생성 {build_ms:8.0f} ms")
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [BASE_ROW_COUNT // 4, BASE_ROW_COUNT, BASE_ROW_COUNT * 10]
+    print("=" * 60)
+    print("🗺️  지도 마커 표시 방식 벤치마크")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as directory:
+        for count in counts:
+            run(count, directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Spatial Index Benchmark
+반경 검색: 기존 전체 행 haversine 스캔과 격자 공간 색인 비교,
+k-최근접 검색(/api/hospitals/nearest) 시간,
+CRUD 변경 후 전체 재생성과 증분 갱신(updated) 비교
+
+사용법: python benchmarks/bench_spatial_index.py [행 수 ...]
+"""
+
+import math
+import random
+import sys
+import time
+
+from synthetic_data import BASE_ROW_COUNT, make_hospitals
+from app.models.hospital import Hospital
+from app.models.hospital_spatial_index import HospitalSpatialIndex
+
+# 검색 반경 (km) - /api/hospitals/search 기본값 1km와 지도 화면에서 자주 쓰는 10km
+RADII = (1.0, 10.0)
+QUERY_COUNT = 200
+
+
+def linear_scan(hospitals, lat, lng, radius):
+    """변경 전 HospitalService.get_hospitals_by_location 방식 (행마다 haversine)"""
+    R = 6371
+    results = []
+    for hospital in hospitals:
+        dlat = math.radians(hospital.latitude - lat)
+        dlng = math.radians(hospital.longitude - lng)
+        a = (math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat))
+             * math.cos(math.radians(hospital.latitude)) * math.sin(dlng / 2) ** 2)
+        distance = R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        if distance <= radius:
+            results.append((hospital.hospital_id, distance))
+    results.sort(key=lambda item: item[1])
+    return results
+
+
+def measure(func, repeat=1):
+    """func() 평균 실행 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def moved_copy(hospitals, changes, rng):
+    """changes개 병원의 좌표만 바꾼 새 목록 (CRUD 수정 후 재조회 상황)"""
+    result = list(hospitals)
+    for i in rng.sample(range(len(result)), changes):
+        h = result[i]
+        result[i] = Hospital(hospital_id=h.hospital_id, name=h.name,
+                             latitude=h.latitude + 0.01, longitude=h.longitude - 0.01,
+                             medical_departments=h.medical_departments)
+    return result
+
+
+def run(count):
+    rng = random.Random(7)
+    hospitals = make_hospitals(count)
+    queries = [(rng.uniform(33.5, 38.3), rng.uniform(126.5, 129.3)) for _ in range(QUERY_COUNT)]
+
+    build_ms = measure(lambda: HospitalSpatialIndex(hospitals))
+    index = HospitalSpatialIndex(hospitals)
+
+    print(f"\n📊 {count:,}개 병원")
+    print(f"  색인 생성                     : {build_ms:8.2f} ms")
+    for radius in RADII:
+        scan_ms = measure(lambda: [linear_scan(hospitals, lat, lng, radius) for lat, lng in queries]) / QUERY_COUNT
+        index_ms = measure(lambda: [index.within(lat, lng, radius) for lat, lng in queries]) / QUERY_COUNT
+        print(f"  반경 {radius:4.0f}km  전체 스캔       : {scan_ms:8.3f} ms/건")
+        print(f"  반경 {radius:4.0f}km  격자 색인       : {index_ms:8.3f} ms/건  ({scan_ms / index_ms:5.1f}배)")
+
+    types = {h.hospital_id: h.hospital_type for h in hospitals}
+    nearest_ms = measure(lambda: [index.nearest(lat, lng, 10) for lat, lng in queries]) / QUERY_COUNT
+    filtered_ms = measure(lambda: [index.nearest(lat, lng, 10, lambda i: types[i] == '종합병원')
+                                   for lat, lng in queries]) / QUERY_COUNT
+    print(f"  k=10 최근접                   : {nearest_ms:8.3f} ms/건")
+    print(f"  k=10 최근접 (종별=종합병원)     : {filtered_ms:8.3f} ms/건")
+
+    changed = moved_copy(hospitals, 10, rng)
+    rebuild_ms = measure(lambda: HospitalSpatialIndex(changed), repeat=3)
+    update_ms = measure(lambda: index.updated(changed), repeat=3)
+    print(f"  10건 변경 후 전체 재생성       : {rebuild_ms:8.2f} ms")
+    print(f"  10건 변경 후 증분 갱신         : {update_ms:8.2f} ms")
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [
+        BASE_ROW_COUNT, BASE_ROW_COUNT * 10, BASE_ROW_COUNT * 100
+    ]
+    print("=" * 60)
+    print("🗺️  반경 검색 공간 색인 벤치마크")
+    print("=" * 60)
+    for count in counts:
+        run(count)
+
+
+if __name__ == '__main__':
+    main()
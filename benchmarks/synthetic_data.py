@@ -0,0 +1,49 @@
+"""
+Synthetic Hospital Data
+벤치마크용 가상 위탁병원 데이터 생성 (DB 연결 없이 실행)
+"""
+
+import os
+import random
+import sys
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.hospital import Hospital
+
+# 현재 위탁병원현황 행 수 (2025-10 기준)
+BASE_ROW_COUNT = 905
+
+HOSPITAL_TYPES = ['종합병원', '병원', '의원', '요양병원']
+SIDO = ['서울특별시', '부산광역시', '대구광역시', '인천광역시', '광주광역시', '대전광역시',
+        '울산광역시', '세종특별자치시', '경기도', '강원특별자치도', '충청북도', '충청남도',
+        '전북특별자치도', '전라남도', '경상북도', '경상남도', '제주특별자치도']
+SIGUNGU = ['중구', '동구', '서구', '남구', '북구', '강남구', '수원시', '강릉시', '청주시', '전주시']
+
+
+def make_hospitals(count: int, seed: int = 42):
+    """한반도 범위에 흩어진 가상 병원 목록 생성"""
+    rng = random.Random(seed)
+    hospitals = []
+    for i in range(1, count + 1):
+        sido = rng.choice(SIDO)
+        sigungu = rng.choice(SIGUNGU)
+        hospital_type = rng.choice(HOSPITAL_TYPES)
+        street = f'{rng.choice(["중앙로", "대학로", "시청로"])} {rng.randint(1, 999)}'
+        detail = f'{sido} {sigungu} {street}'
+        hospitals.append(Hospital(
+            hospital_id=i,
+            name=f'가상{hospital_type}{i}',
+            address=f'{street} {detail}',
+            latitude=rng.uniform(33.2, 38.6),
+            longitude=rng.uniform(126.1, 129.6),
+            medical_departments=[hospital_type],
+            bed_count=rng.randint(0, 800),
+            department_count=rng.randint(1, 30),
+            sigungu=sigungu,
+            phone=f'0{rng.randint(2, 64)}-{rng.randint(100, 9999)}-{rng.randint(1000, 9999)}',
+            street_address=street,
+            detail_address=detail
+        ))
+    return hospitals
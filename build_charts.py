@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+차트 일괄 생성 스크립트
+원천 테이블을 한 번씩만 읽고 Plotly HTML 9개, 정적 이미지 2개, 차트 앱 데이터(JSON)를 작업 프로세스에서 병렬 생성
+입력(원천 내용 해시 + 생성 코드 버전)이 지난 생성 때와 같은 차트는 건너뜀 (Chart/chart_build_manifest.json)
+
+사용법:
+    python build_charts.py
+    python build_charts.py --only chart3 chart4_yearly_area --workers 2
+    python build_charts.py --csv Chart/data/지역별위탁병원이용인원2.csv --only chart3 chart4 chart5 chart6 chart7 chartData
+    python build_charts.py --force
+    python build_charts.py --format spec
+    python build_charts.py --list
+"""
+
+import argparse
+import sys
+
+from app.services.chart_build import CHART_TARGETS, FIGURE_FORMATS, ChartBuilder
+
+
+def print_summary(summary):
+    """차트별 소요 시간과 전체 결과 출력"""
+    for source, seconds in summary['load'].items():
+        print(f"  📥 {source:<28} {seconds:7.2f}초 (원천 로드)")
+    for item in summary['built']:
+        print(f"  📊 {item['name']:<28} {item['seconds']:7.2f}초 {item['bytes'] / 1024:9.1f}KB  {item['path']}")
+    for failure in summary['failed']:
+        print(f"  ❌ {failure['name']}: {failure['error']}")
+
+    total = sum(item['seconds'] for item in summary['built'])
+    slowest = max((item['seconds'] for item in summary['built']), default=0)
+    print(f"✅ 생성 {len(summary['built'])}, 변경 없음 {len(summary['skipped'])}, 실패 {len(summary['failed'])} "
+          f"(전체 {summary['elapsed']:.1f}초, 차트 시간 합 {total:.1f}초, 가장 느린 차트 {slowest:.1f}초, "
+          f"작업 프로세스 {summary['workers']}개)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='위탁병원 차트(HTML/이미지/JSON) 일괄 생성')
+    parser.add_argument('--only', nargs='+', metavar='NAME',
+                        help='생성할 차트 이름 또는 접두어 (예: chart3, image1, chartData, 기본: 전체)')
+    parser.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (0이면 현재 프로세스에서 생성)')
+    parser.add_argument('--csv', help='이용인원을 DB 대신 읽을 원본 CSV 파일')
+    parser.add_argument('--chart-dir', help='차트 앱 폴더 (기본: Chart)')
+    parser.add_argument('--public-dir', help='Plotly HTML을 같이 저장할 폴더 (기본: public, ""이면 생략)')
+    parser.add_argument('--format', choices=FIGURE_FORMATS, default='both',
+                        help='Plotly 차트 출력 형식 (html: 단독 HTML, spec: 공유 페이지용 Figure JSON, 기본: both)')
+    parser.add_argument('--force', action='store_true', help='입력이 바뀌지 않은 차트도 모두 다시 생성')
+    parser.add_argument('--list', action='store_true', help='차트 목록만 출력')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (source, kind, _, path) in CHART_TARGETS.items():
+            print(f"  {name:<28} {kind:<6} {source:<9} {path}")
+        return 0
+
+    builder = ChartBuilder(csv_path=args.csv, chart_dir=args.chart_dir,
+                           public_dir=args.public_dir, workers=args.workers, figure_format=args.format)
+    print(f"📊 차트 일괄 생성: {builder.chart_dir} (작업 프로세스 최대 {builder.workers}개)")
+    try:
+        summary = builder.run(args.only, force=args.force)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    except Exception as e:
+        print(f"❌ 차트 생성 오류: {e}")
+        return 1
+
+    print_summary(summary)
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
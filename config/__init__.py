@@ -15,6 +15,43 @@ class Config:
     # 데이터베이스 설정
     DATABASE_PATH = os.environ.get('DATABASE_PATH') or os.path.join(BASE_DIR, 'hospital.db')
     
+    # MySQL 설정 (모든 리포지토리가 공유하는 커넥션 풀)
+    MYSQL_HOST = os.environ.get('MYSQL_HOST') or '121.157.160.22'
+    MYSQL_PORT = int(os.environ.get('MYSQL_PORT') or 3306)
+    MYSQL_USER = os.environ.get('MYSQL_USER') or 'root'
+    MYSQL_PASSWORD = os.environ.get('MYSQL_PASSWORD') or 'zzaaqq'
+    MYSQL_DATABASE = os.environ.get('MYSQL_DATABASE') or 'testdb'
+    MYSQL_CONNECT_TIMEOUT = int(os.environ.get('MYSQL_CONNECT_TIMEOUT') or 30)
+    
+    # 커넥션 풀 설정
+    MYSQL_POOL_MIN_SIZE = int(os.environ.get('MYSQL_POOL_MIN_SIZE') or 1)
+    MYSQL_POOL_MAX_SIZE = int(os.environ.get('MYSQL_POOL_MAX_SIZE') or 8)
+    MYSQL_POOL_IDLE_TIMEOUT = float(os.environ.get('MYSQL_POOL_IDLE_TIMEOUT') or 300)  # 초과 시 재연결
+    MYSQL_POOL_WAIT_TIMEOUT = float(os.environ.get('MYSQL_POOL_WAIT_TIMEOUT') or 30)   # 대여 대기 한도
+    MYSQL_POOL_PING_INTERVAL = float(os.environ.get('MYSQL_POOL_PING_INTERVAL') or 5)  # 대여 시 ping 간격
+    
+    # 병원 스냅샷 캐시 설정
+    HOSPITAL_CACHE_TTL = float(os.environ.get('HOSPITAL_CACHE_TTL') or 300)  # 초
+    HOSPITAL_CACHE_STALE_WHILE_REVALIDATE = (
+        os.environ.get('HOSPITAL_CACHE_STALE_WHILE_REVALIDATE', 'true').lower() in ('1', 'true', 'yes', 'on')
+    )
+    
+    # 이용인원 롤업 - USAGE_ROLLUP_TTL마다 마지막 연월부터만 증분 반영, USAGE_ROLLUP_FULL_REFRESH마다 전체 재집계
+    USAGE_ROLLUP_TTL = float(os.environ.get('USAGE_ROLLUP_TTL') or 600)  # 초
+    USAGE_ROLLUP_FULL_REFRESH = float(os.environ.get('USAGE_ROLLUP_FULL_REFRESH') or 24 * 3600)  # 초
+    
+    # 생성 파일(지도 HTML, Excel) 저장소 - 색인(index.json), 보존 기간, 전체 용량 상한으로 관리
+    # (MAP_CACHE_DIR은 이전 설정 이름으로 계속 지원)
+    ARTIFACT_DIR = (os.environ.get('ARTIFACT_DIR') or os.environ.get('MAP_CACHE_DIR')
+                    or os.path.join(BASE_DIR.parent, 'generated_maps'))
+    ARTIFACT_MAX_BYTES = int(os.environ.get('ARTIFACT_MAX_MB') or 512) * 1024 * 1024
+    ARTIFACT_TTL = float(os.environ.get('ARTIFACT_TTL_DAYS') or 7) * 24 * 3600  # 마지막 접근 후 보존 기간 (초)
+    
+    # 전국/시도별 지도 사전 생성 (데이터 버전이 바뀌면 작업 프로세스에서 다시 생성)
+    MAP_PRERENDER = os.environ.get('MAP_PRERENDER', 'false').lower() in ('1', 'true', 'yes', 'on')
+    MAP_PRERENDER_WORKERS = int(os.environ['MAP_PRERENDER_WORKERS']) if os.environ.get('MAP_PRERENDER_WORKERS') else None
+    MAP_PRERENDER_INTERVAL = float(os.environ.get('MAP_PRERENDER_INTERVAL') or 30)  # 버전 확인 간격 (초)
+    
     # 보안 설정
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     
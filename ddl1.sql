@@ -54,3 +54,13 @@ CREATE TABLE testdb.보훈병원_이용현황 (
 ENGINE=InnoDB
 DEFAULT CHARSET=utf8mb4
 COLLATE=utf8mb4_0900_ai_ci;
+
+
+-- /api/hospitals/crud 정렬/keyset 페이지네이션용 인덱스
+-- InnoDB 보조 인덱스에는 PK(연번)가 포함되므로 ORDER BY <컬럼>, 연번 을 인덱스 순서로 읽을 수 있음
+ALTER TABLE testdb.위탁병원현황
+    ADD INDEX idx_위탁병원현황_요양기관명 (요양기관명),
+    ADD INDEX idx_위탁병원현황_시군구 (시군구),
+    ADD INDEX idx_위탁병원현황_종별 (종별),
+    ADD INDEX idx_위탁병원현황_병상수 (병상수),
+    ADD INDEX idx_위탁병원현황_진료과수 (진료과수);
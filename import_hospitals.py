@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+병원 목록 가져오기 스크립트
+xlsx/csv 파일을 묶음 단위로 읽어 위탁병원현황 테이블에 저장
+
+사용법:
+    python import_hospitals.py 병원목록.xlsx
+    python import_hospitals.py 병원목록.csv --chunk-size 1000 --dry-run
+"""
+
+import argparse
+import sys
+
+from app.services.hospital_import_service import HospitalImportError, HospitalImportService
+
+
+def print_progress(summary):
+    """묶음마다 진행 상황 출력"""
+    print(f"  📦 {summary['chunks']}번째 묶음: {summary['rows']:,}행 처리 "
+          f"(저장 대상 {summary['valid']:,}, 오류 {summary['rejected']:,}) {summary['elapsed']:.1f}초")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='병원 목록 파일을 위탁병원현황 테이블로 가져오기')
+    parser.add_argument('path', help='가져올 xlsx 또는 csv 파일')
+    parser.add_argument('--chunk-size', type=int, default=500, help='한 트랜잭션에 저장할 행 수 (기본 500)')
+    parser.add_argument('--dry-run', action='store_true', help='검증만 하고 저장하지 않음')
+    args = parser.parse_args()
+
+    print(f"📥 가져오기 시작: {args.path}{' (검증만)' if args.dry_run else ''}")
+    service = HospitalImportService(chunk_size=args.chunk_size)
+    try:
+        summary = service.import_file(args.path, dry_run=args.dry_run, progress=print_progress)
+    except HospitalImportError as e:
+        print(f"❌ 가져오기 실패: {e}")
+        return 1
+    except Exception as e:
+        print(f"❌ 가져오기 오류: {e}")
+        return 1
+
+    print(f"✅ 완료: 전체 {summary['rows']:,}행, 추가 {summary['inserted']:,}, "
+          f"연번 기준 추가/수정 {summary['upserted']:,}, 오류 {summary['rejected']:,} "
+          f"({summary['elapsed']:.1f}초)")
+    for error in summary['errors']:
+        print(f"  ⚠️ {error['row']}행: {error['error']}")
+    if summary['rejected'] > len(summary['errors']):
+        print(f"  ... 외 {summary['rejected'] - len(summary['errors']):,}건")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지도 사전 생성 스크립트
+전국 지도와 17개 시도 지도를 작업 프로세스에서 병렬로 미리 생성 (이미 있는 지도는 건너뜀)
+
+사용법:
+    python prerender_maps.py
+    python prerender_maps.py --regions 서울 부산 --workers 2
+    python prerender_maps.py --watch 60
+"""
+
+import argparse
+import sys
+import time
+
+from app.services.artifact_store import artifact_store
+from app.services.map_cache import folium_map_cache
+from app.services.map_prerender import MapPrerenderer
+
+
+def print_summary(summary):
+    """실행 결과 출력"""
+    print(f"✅ 데이터 버전 {summary['data_version']}: 생성 {len(summary['rendered'])}, "
+          f"기존 지도 {len(summary['skipped'])}, 병원 없음 {len(summary['empty'])} "
+          f"({summary['elapsed']:.1f}초)")
+    for filename in summary['rendered']:
+        print(f"  🗺️  {filename}")
+    for failure in summary['failed']:
+        print(f"  ❌ {failure['region']}: {failure['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='전국/시도별 Folium 지도 사전 생성')
+    parser.add_argument('--regions', nargs='+', help='생성할 지역 (기본: 전국 + 17개 시도, 전국은 "")')
+    parser.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (0이면 현재 프로세스에서 생성)')
+    parser.add_argument('--output', help='지도 저장 폴더 (기본: ARTIFACT_DIR 또는 generated_maps)')
+    parser.add_argument('--watch', type=float, metavar='SECONDS',
+                        help='종료하지 않고 SECONDS초마다 데이터 버전을 확인해 바뀌면 다시 생성')
+    args = parser.parse_args()
+
+    if args.output:
+        artifact_store.configure(directory=args.output)
+    prerenderer = MapPrerenderer(folium_map_cache, workers=args.workers)
+    print(f"🗺️  지도 사전 생성: {folium_map_cache.directory} (작업 프로세스 {prerenderer.workers}개)")
+
+    try:
+        if not args.watch:
+            summary = prerenderer.run(regions=args.regions)
+            print_summary(summary)
+            return 1 if summary['failed'] else 0
+
+        print(f"⏱️  {args.watch:g}초마다 데이터 버전 확인 (Ctrl+C로 종료)")
+        while True:
+            summary = prerenderer.poll()
+            if summary is not None:
+                print_summary(summary)
+            time.sleep(args.watch)
+    except KeyboardInterrupt:
+        return 0
+    except Exception as e:
+        print(f"❌ 지도 사전 생성 오류: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,13 +1,20 @@
 # 프로덕션 서버 실행 스크립트
 # Waitress WSGI 서버 사용
+# 지도 사전 생성 작업 프로세스(spawn)가 이 파일을 다시 import하므로 서버 시작은 main()에서만
 
 from waitress import serve
 from app import create_app
 import os
 
-app = create_app()
-app.config['DEBUG'] = False
 
-port = int(os.environ.get('PORT', 5000))
-print(' 프로덕션 서버 시작: http://0.0.0.0:' + str(port) + '/c')
-serve(app, host='0.0.0.0', port=port, threads=8)
+def main():
+    app = create_app()
+    app.config['DEBUG'] = False
+
+    port = int(os.environ.get('PORT', 5000))
+    print(' 프로덕션 서버 시작: http://0.0.0.0:' + str(port) + '/c')
+    serve(app, host='0.0.0.0', port=port, threads=8)
+
+
+if __name__ == '__main__':
+    main()
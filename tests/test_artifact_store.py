@@ -0,0 +1,129 @@
+"""
+Artifact Store Test
+생성 파일 저장소 테스트 (색인, 원자적 쓰기, TTL/용량 상한 정리)
+"""
+
+import pytest
+import sys
+import os
+import json
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services import artifact_store as artifact_module
+from app.services.artifact_store import ArtifactStore
+
+
+def write_bytes(size):
+    def writer(path):
+        with open(path, 'wb') as f:
+            f.write(b'x' * size)
+    return writer
+
+
+def test_write_is_atomic_and_indexed(tmp_path):
+    """임시 파일 없이 최종 파일만 남고, 색인을 다시 읽어도 그대로 조회"""
+    store = ArtifactStore(str(tmp_path))
+    path = store.write('map.html', write_bytes(10), kind='map')
+
+    assert os.path.getsize(path) == 10
+    assert sorted(os.listdir(tmp_path)) == ['index.json', 'map.html']
+    with open(tmp_path / 'index.json', encoding='utf-8') as f:
+        assert json.load(f)['entries']['map.html']['kind'] == 'map'
+
+    def failing(path):
+        write_bytes(5)(path)
+        raise RuntimeError('렌더링 실패')
+
+    with pytest.raises(RuntimeError):
+        store.write('broken.html', failing)
+    assert not store.contains('broken.html')
+    assert sorted(os.listdir(tmp_path)) == ['index.json', 'map.html']
+
+    reloaded = ArtifactStore(str(tmp_path))
+    assert reloaded.get('map.html')['size'] == 10
+    assert reloaded.get('missing.html') is None
+    with pytest.raises(ValueError):
+        reloaded.path('../app.py')
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path, monkeypatch):
+    """전체 용량이 상한을 넘으면 가장 오래 쓰지 않은 파일부터 삭제"""
+    clock = [1000.0]
+    monkeypatch.setattr(artifact_module.time, 'time', lambda: clock[0])
+    store = ArtifactStore(str(tmp_path), max_bytes=25, ttl=0)
+
+    for name in ('a.html', 'b.html'):
+        store.write(name, write_bytes(10))
+        clock[0] += 1
+    store.get('a.html')  # b가 가장 오래 쓰지 않은 파일이 됨
+    clock[0] += 1
+    store.write('c.html', write_bytes(10))
+
+    assert [entry['name'] for entry in store.entries()] == ['c.html', 'a.html']
+    assert not os.path.exists(tmp_path / 'b.html')
+    assert store.stats()['total_bytes'] == 20 and store.stats()['evictions'] == 1
+
+
+def test_ttl_expires_idle_files_and_reload_adopts_orphans(tmp_path, monkeypatch):
+    """마지막 접근 후 TTL이 지난 파일은 조회되지 않고 정리되며, 색인에 없는 파일은 다시 읽을 때 등록"""
+    clock = [1000.0]
+    monkeypatch.setattr(artifact_module.time, 'time', lambda: clock[0])
+    store = ArtifactStore(str(tmp_path), ttl=60)
+    store.write('old.html', write_bytes(3))
+
+    clock[0] += 61
+    assert store.get('old.html') is None
+    assert store.evict() == ['old.html']
+    assert not os.path.exists(tmp_path / 'old.html')
+
+    (tmp_path / 'orphan.xlsx').write_bytes(b'1234')
+    os.utime(tmp_path / 'orphan.xlsx', (clock[0], clock[0]))
+    reloaded = ArtifactStore(str(tmp_path), ttl=60)
+    entry = reloaded.get('orphan.xlsx')
+    assert entry['size'] == 4 and entry['kind'] == 'export'
+
+
+def test_processes_sharing_folder_see_each_others_files(tmp_path):
+    """다른 프로세스가 쓴 파일은 색인에 없어도 조회되고, 색인 저장은 서로의 항목을 덮어쓰지 않음"""
+    first = ArtifactStore(str(tmp_path))
+    second = ArtifactStore(str(tmp_path))
+    first.write('a.html', write_bytes(3), kind='map')
+    assert second.stats()['files'] == 1
+
+    second.write('b.html', write_bytes(4), kind='map')
+    assert first.get('b.html')['size'] == 4
+    assert first.contains('b.html')
+
+    second.remove('a.html')
+    first.write('c.html', write_bytes(5), kind='export')
+    with open(tmp_path / 'index.json', encoding='utf-8') as f:
+        entries = json.load(f)['entries']
+    assert sorted(entries) == ['b.html', 'c.html']
+    assert entries['c.html']['kind'] == 'export'
+    assert sorted(entry['name'] for entry in ArtifactStore(str(tmp_path)).entries()) == ['b.html', 'c.html']
+    assert first.get('missing.html') is None and first.get('../app.py') is None
+
+
+def test_map_written_by_another_store_is_served(tmp_path, monkeypatch):
+    """다른 프로세스(저장소 인스턴스)가 쓴 지도/내보내기 파일도 /maps, /downloads로 제공"""
+    from app import create_app
+    from app import routes
+
+    client = create_app('testing').test_client()
+    served = ArtifactStore(str(tmp_path))
+    assert served.stats()['files'] == 0   # 색인을 먼저 읽어 둔 서버 프로세스
+    monkeypatch.setattr(routes, 'artifact_store', served)
+
+    writer = ArtifactStore(str(tmp_path))
+    writer.write('hospital_map_prerendered.html', write_bytes(8), kind='map')
+    writer.write('hospital_data.xlsx', write_bytes(6), kind='export')
+    (tmp_path / 'orphan_map.html').write_bytes(b'<html></html>')   # 색인에 기록되지 않은 파일
+
+    assert client.get('/maps/hospital_map_prerendered.html').status_code == 200
+    assert client.get('/maps/orphan_map.html').status_code == 200
+    response = client.get('/downloads/hospital_data.xlsx')
+    assert response.status_code == 200 and 'attachment' in response.headers['Content-Disposition']
+    assert client.get('/downloads/hospital_map_prerendered.html').status_code == 404
+    assert served.get('hospital_map_prerendered.html')['kind'] == 'map'
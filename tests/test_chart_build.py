@@ -0,0 +1,144 @@
+"""
+Chart Build Test
+차트 일괄 생성 - 원천 1회 로드, 대상 선택, 작업 프로세스 병렬 생성, 입력 fingerprint 기반 증분 생성 테스트 (DB 대신 가짜 리포지토리 사용)
+"""
+
+import json
+import pandas as pd
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.chart_build import CHART_TARGETS, ChartBuilder, select_targets
+from app.services.chart_figures import aggregate_usage, build_chart_data
+
+RAW_ROWS = [
+    {'연도': 2023, '월': 3, '연월': 202303, '광역지자체': '서울특별시', '광역지자체코드': 11, '인원': 120},
+    {'연도': 2023, '월': 3, '연월': 202303, '광역지자체': '부산광역시', '광역지자체코드': 26, '인원': 80},
+    {'연도': 2023, '월': 4, '연월': 202304, '광역지자체': '서울특별시', '광역지자체코드': 11, '인원': 130},
+    {'연도': 2024, '월': 1, '연월': 202401, '광역지자체': '서울특별시', '광역지자체코드': 11, '인원': 150},
+    {'연도': 2024, '월': 1, '연월': 202401, '광역지자체': '경기도', '광역지자체코드': 41, '인원': 60},
+]
+
+
+class FakeUsageRepository:
+    def __init__(self):
+        self.calls = []
+
+    def load_usage_rows(self):
+        self.calls.append('raw')
+        return RAW_ROWS
+
+    def load_monthly_totals(self, since=None):
+        self.calls.append('monthly')
+        return aggregate_usage(pd.DataFrame(RAW_ROWS)).rows()
+
+    def load_facility_counts(self):
+        self.calls.append('facility')
+        return [
+            {'광역지자체': '서울특별시', '2022년12월': 10, '2023년12월': 12, '2024년12월': 15},
+            {'광역지자체': '부산광역시', '2022년12월': 5, '2023년12월': 6, '2024년12월': 8},
+        ]
+
+
+# matplotlib 이미지는 느리고 폰트 경고가 많아 제외
+NON_IMAGE_TARGETS = [name for name, target in CHART_TARGETS.items() if target[1] != 'image']
+
+
+def test_select_targets():
+    """이름/접두어로 대상 선택 (정의 순서 유지), 없는 이름은 ValueError"""
+    assert select_targets(['chart4_yearly_area', 'chart3']) == [
+        'chart3_scatter_matrix', 'chart3_correlation_heatmap', 'chart3_regional_trend', 'chart4_yearly_area']
+    assert select_targets() == list(CHART_TARGETS)
+    with pytest.raises(ValueError):
+        select_targets(['chart9'])
+
+
+def test_build_loads_each_source_once(tmp_path):
+    """원천 테이블마다 한 번만 읽고 모든 대상 생성, HTML은 public 폴더에도 저장"""
+    repository = FakeUsageRepository()
+    builder = ChartBuilder(repository, chart_dir=str(tmp_path / 'Chart'),
+                           public_dir=str(tmp_path / 'public'), workers=0)
+    summary = builder.run(NON_IMAGE_TARGETS)
+
+    assert summary['failed'] == [] and summary['workers'] == 0
+    # 이용인원은 월별 합계(롤업 fingerprint)로 변경 여부를 판단한 뒤 원본 행을 읽음
+    assert sorted(repository.calls) == ['facility', 'monthly', 'raw']
+    assert set(summary['load']) == {'facility', 'raw', 'usage'}
+    assert [item['name'] for item in summary['built']] == NON_IMAGE_TARGETS
+    assert all(item['seconds'] >= 0 and item['bytes'] > 0 for item in summary['built'])
+
+    assert (tmp_path / 'public' / 'chart5_regional_bar.html').read_bytes() == \
+        (tmp_path / 'Chart' / 'public' / 'chart5_regional_bar.html').read_bytes()
+    chart_data = json.loads((tmp_path / 'Chart' / 'data' / 'chartData.json').read_text(encoding='utf-8'))
+    assert chart_data == json.loads(json.dumps(build_chart_data(aggregate_usage(pd.DataFrame(RAW_ROWS)))))
+    sync_info = json.loads((tmp_path / 'Chart' / 'data' / 'chart_sync_info.json').read_text(encoding='utf-8'))
+    assert sync_info['yearly_totals'] == {'2022': 15, '2023': 18, '2024': 23}
+
+    # 롤업만 필요하면 원본 행 대신 월별 합계만 조회
+    repository.calls.clear()
+    builder.run(['chart4', 'chartData'], force=True)
+    assert repository.calls == ['monthly']
+
+
+def test_failed_source_marks_its_targets(tmp_path):
+    """원천 로드에 실패하면 그 원천의 대상만 실패로 기록"""
+    class BrokenFacilityRepository(FakeUsageRepository):
+        def load_facility_counts(self):
+            raise RuntimeError('연결 실패')
+
+    builder = ChartBuilder(BrokenFacilityRepository(), chart_dir=str(tmp_path), public_dir='', workers=0)
+    summary = builder.run(['chart1', 'chart4'])
+    assert [item['name'] for item in summary['built']] == ['chart4_yearly_area']
+    assert summary['failed'][0]['name'] == 'chart1_regional_yearly'
+    assert '연결 실패' in summary['failed'][0]['error']
+
+
+def test_build_in_worker_processes(tmp_path):
+    """작업 프로세스에서 생성해도 같은 결과"""
+    repository = FakeUsageRepository()
+    builder = ChartBuilder(repository, chart_dir=str(tmp_path), public_dir='', workers=2)
+    summary = builder.run(['chartData', 'chart_sync_info'])
+
+    assert summary['failed'] == [] and summary['workers'] == 2
+    assert [item['name'] for item in summary['built']] == ['chartData', 'chart_sync_info']
+    assert (tmp_path / 'data' / 'chartData.json').exists()
+    assert not list(tmp_path.rglob('*.tmp'))
+
+
+def test_rebuilds_only_changed_inputs(tmp_path):
+    """입력 fingerprint가 같으면 건너뛰고, 바뀐 원천의 차트와 지워진 파일만 다시 생성"""
+    repository = FakeUsageRepository()
+    builder = ChartBuilder(repository, chart_dir=str(tmp_path), public_dir='', workers=0)
+    targets = ['chart1', 'chart4', 'chart3_scatter_matrix', 'chartData']
+    first = builder.run(targets)
+    assert len(first['built']) == 4 and first['skipped'] == []
+    manifest = builder.read_manifest()
+    assert set(manifest) == {'chart1_regional_yearly', 'chart4_yearly_area', 'chart3_scatter_matrix', 'chartData'}
+    assert manifest['chartData']['inputs']['code']
+
+    # 변경 없음: 원본 행을 읽지 않고 모두 건너뜀
+    repository.calls.clear()
+    second = builder.run(targets)
+    assert second['built'] == [] and sorted(second['skipped']) == sorted(manifest)
+    assert sorted(repository.calls) == ['facility', 'monthly']
+
+    # 시설 현황만 바뀌면 chart1만, 파일이 지워지면 그 차트만 다시 생성
+    original = repository.load_facility_counts
+    repository.load_facility_counts = lambda: [dict(row, **{'2024년12월': 20}) for row in original()]
+    (tmp_path / 'data' / 'chartData.json').unlink()
+    third = builder.run(targets)
+    assert [item['name'] for item in third['built']] == ['chart1_regional_yearly', 'chartData']
+    assert builder.read_manifest()['chart1_regional_yearly']['fingerprint'] != manifest['chart1_regional_yearly']['fingerprint']
+
+    # 이용인원이 바뀌면 이용인원 차트만
+    RAW_ROWS.append({'연도': 2024, '월': 2, '연월': 202402, '광역지자체': '경기도', '광역지자체코드': 41, '인원': 5})
+    try:
+        fourth = builder.run(targets)
+    finally:
+        RAW_ROWS.pop()
+    assert [item['name'] for item in fourth['built']] == ['chart3_scatter_matrix', 'chart4_yearly_area', 'chartData']
+    assert builder.run(targets, force=True)['skipped'] == []
@@ -0,0 +1,107 @@
+"""
+Chart Service Test
+차트 Figure/차트 앱 데이터 API - 데이터 버전 단위 캐시 테스트 (DB 대신 가짜 리포지토리 사용)
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app import create_app
+from app.repositories.usage_rollup_store import UsageRollupStore
+from app.services.chart_figures import aggregate_usage, build_chart_data
+from app.services.chart_service import CHART_IDS, ChartService
+
+
+class FakeUsageRepository:
+    def __init__(self):
+        self.monthly = [
+            (2023, 3, '서울특별시', 120.0, 2),
+            (2023, 3, '부산광역시', 80.0, 1),
+            (2023, 4, '서울특별시', 130.0, 2),
+            (2024, 1, '서울특별시', 150.0, 2),
+            (2024, 1, '경기도', 60.0, 3),
+        ]
+        self.facility = [
+            {'광역지자체': '서울특별시', '2022년12월': 10, '2023년12월': 12, '2024년12월': 15},
+            {'광역지자체': '부산광역시', '2022년12월': 5, '2023년12월': 6, '2024년12월': 8},
+        ]
+
+    def load_monthly_totals(self, since=None):
+        return [row for row in self.monthly if not since or row[0] * 100 + row[1] >= since]
+
+    def load_facility_counts(self):
+        return self.facility
+
+
+def make_service(repository):
+    # ttl=0: 조회할 때마다 롤업 증분 갱신
+    return ChartService(repository, UsageRollupStore(repository, ttl=0))
+
+
+def test_every_chart_builds_and_is_cached_per_version():
+    """모든 차트 생성, 원천이 같으면 재사용, 내용이 바뀌면 새 버전"""
+    repository = FakeUsageRepository()
+    service = make_service(repository)
+
+    for chart_id in CHART_IDS:
+        content = json.loads(service.get_chart(chart_id)['body'])
+        assert content['chart7' if chart_id == 'chartData' else 'data']
+
+    chart = service.get_chart('chart5')
+    assert service.get_chart('chart5') is chart
+    figure = json.loads(chart['body'])
+    assert '2023년3월 ~ 2024년1월' in figure['layout']['title']['text']
+
+    # 다시 읽었지만 내용이 같으면 같은 버전/캐시
+    repository.monthly = list(repository.monthly)
+    assert service.get_chart('chart5') is chart
+
+    repository.monthly = repository.monthly + [(2024, 2, '부산광역시', 10.0, 1)]
+    changed = service.get_chart('chart5')
+    assert changed['data_version'] != chart['data_version'] and changed['etag'] != chart['etag']
+
+    with pytest.raises(ValueError):
+        service.get_chart('chart9')
+
+
+def test_chart_data_matches_raw_rows():
+    """월별 합계로 만든 chartData가 원본 행으로 만든 것과 같음 (건수는 원본 행 수)"""
+    import pandas as pd
+
+    raw = pd.DataFrame([
+        {'연도': 2023, '월': '03', '광역지자체': '서울특별시', '인원': 70},
+        {'연도': 2023, '월': '03', '광역지자체': '서울특별시', '인원': 50},
+        {'연도': 2023, '월': '04', '광역지자체': '부산광역시', '인원': 'x'},
+        {'연도': 2024, '월': '01', '광역지자체': '부산광역시', '인원': 30},
+    ])
+    rollup = aggregate_usage(raw)
+    assert rollup.rows() == [(2023, 3, '서울특별시', 120, 2), (2023, 4, '부산광역시', 0, 1),
+                             (2024, 1, '부산광역시', 30, 1)]
+
+    chart_data = build_chart_data(rollup)
+    assert chart_data['chart4']['data'] == [{'year': '2023년', 'total': 120, 'count': 3},
+                                            {'year': '2024년', 'total': 30, 'count': 1}]
+    assert chart_data['chart7']['data']['data_period'] == '2023-2024'
+
+
+def test_chart_endpoint(monkeypatch):
+    """차트 API는 ETag/데이터 버전 헤더 제공, 없는 차트는 404"""
+    from app.routes import hospital_controller
+
+    client = create_app('testing').test_client()
+    monkeypatch.setattr(hospital_controller, 'chart_service', make_service(FakeUsageRepository()))
+
+    response = client.get('/api/charts/chart1')
+    assert response.status_code == 200 and response.mimetype == 'application/json'
+    assert response.headers['X-Data-Version']
+    assert json.loads(response.data)['layout']['title']['text'].startswith('광역지자체별 연도별 위탁병원 현황')
+
+    cached = client.get('/api/charts/chart1', headers={'If-None-Match': response.headers['ETag']})
+    assert cached.status_code == 304
+    assert client.get('/api/charts/chartData').status_code == 200
+    assert client.get('/api/charts/unknown').status_code == 404
@@ -0,0 +1,126 @@
+"""
+Connection Pool Test
+공유 MySQL 커넥션 풀 테스트 (실제 DB 대신 가짜 커넥션 사용)
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.repositories.connection_pool import ConnectionPool, PoolTimeoutError
+
+
+class FakeConnection:
+    def __init__(self):
+        self.open = True
+        self.pings = 0
+        self.rollbacks = 0
+        self.fail_ping = False
+
+    def ping(self, reconnect=False):
+        self.pings += 1
+        if self.fail_ping:
+            raise ConnectionError('server has gone away')
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.open = False
+
+
+def make_pool(**kwargs):
+    created = []
+
+    def connect(**_):
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    pool = ConnectionPool({}, connect=connect, **kwargs)
+    return pool, created
+
+
+def test_connection_is_reused_and_counted():
+    """반납한 커넥션을 재사용하고 대여 횟수를 기록"""
+    pool, created = make_pool(max_size=2)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert len(created) == 1
+    assert first.rollbacks == 2
+    stats = pool.stats()
+    assert stats['checkouts'] == 2
+    assert stats['idle'] == 1 and stats['in_use'] == 0
+
+
+def test_nested_checkout_uses_same_connection():
+    """같은 스레드에서 중첩 대여하면 같은 커넥션 사용"""
+    pool, created = make_pool(max_size=1, wait_timeout=0.1)
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert inner is outer
+        assert pool.stats()['in_use'] == 1
+    assert pool.stats()['in_use'] == 0
+    assert pool.stats()['checkouts'] == 1
+
+
+def test_health_check_reconnects_broken_connection():
+    """대여 시 ping 실패한 커넥션은 재연결"""
+    pool, created = make_pool(ping_interval=0)
+    with pool.connection() as conn:
+        conn.fail_ping = True
+    with pool.connection() as fresh:
+        assert fresh is not conn
+    assert not conn.open
+    assert pool.stats()['reconnects'] == 1
+
+
+def test_idle_timeout_reconnects():
+    """idle_timeout을 넘긴 커넥션은 새로 연결"""
+    pool, created = make_pool(idle_timeout=0.0001, ping_interval=60)
+    with pool.connection() as conn:
+        pass
+    threading.Event().wait(0.01)
+    with pool.connection() as fresh:
+        assert fresh is not conn
+    assert pool.stats()['reconnects'] == 1
+
+
+def test_wait_and_timeout_when_exhausted():
+    """풀이 가득 차면 대기 후 시간 초과"""
+    pool, _ = make_pool(max_size=1, wait_timeout=0.05)
+    holder = pool.acquire()
+    errors = []
+
+    def borrow():
+        try:
+            with pool.connection():
+                pass
+        except PoolTimeoutError as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=borrow)
+    worker.start()
+    worker.join()
+    pool.release(holder)
+
+    assert len(errors) == 1
+    stats = pool.stats()
+    assert stats['waits'] == 1
+    assert stats['timeouts'] == 1
+
+
+def test_fill_opens_min_size():
+    """fill()은 min_size만큼 커넥션을 미리 생성"""
+    pool, created = make_pool(min_size=2, max_size=4)
+    pool.fill()
+    assert len(created) == 2
+    assert pool.stats()['idle'] == 2
@@ -0,0 +1,79 @@
+"""
+Density Grid Test
+밀도 격자 집계, 병원/이용인원 밀도, Folium HeatMap 방식 테스트 (DB 대신 가짜 리포지토리 사용)
+"""
+
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.density_grid import bin_density, cell_size
+from app.services.density_service import DensityService
+from app.services.folium_map_service import FoliumMapService
+from benchmarks.synthetic_data import make_hospitals
+from test_hospital_geojson import FakeRepository
+
+
+class FakeUsageRepository:
+    def __init__(self):
+        self.calls = []
+
+    def load_usage(self, period=None):
+        self.calls.append(period)
+        return period or '202409', [
+            ('서울특별시', '강남구', 100.0),   # 강남구 병원 좌표
+            ('부산광역시', '기장군', 40.0),    # 기장군 병원이 없어 부산 중심
+            ('알수없음', '', 7.0),
+        ]
+
+
+def test_bin_density_sums_weights_per_cell():
+    """가중치 합계 보존, 줌이 오를수록 셀이 작아짐, 범위 밖 점 제외"""
+    hospitals = make_hospitals(905)
+    lats = [hospital.latitude for hospital in hospitals]
+    lngs = [hospital.longitude for hospital in hospitals]
+
+    national = bin_density(lats, lngs, zoom=7)
+    detailed = bin_density(lats, lngs, zoom=10)
+    assert national['total'] == 905 and detailed['total'] == 905
+    assert len(national['cells']) < len(detailed['cells'])
+    assert cell_size(8)[1] == pytest.approx(cell_size(7)[1] / 2)
+
+    weighted = bin_density([37.5, 37.5001, 10.0], [127.0, 127.0001, 10.0], weights=[2, 3, 100], zoom=7)
+    assert weighted['cells'] == [[pytest.approx(37.5, abs=0.3), pytest.approx(127.0, abs=0.3), 5]]
+    assert weighted['max'] == 5 and bin_density([], [], zoom=7)['cells'] == []
+
+
+def test_hospital_and_usage_density():
+    """병원 밀도는 스냅샷에 캐시, 이용인원은 시군구 대표 좌표(없으면 시도 중심)에 배치"""
+    usage = FakeUsageRepository()
+    service = DensityService(FakeRepository(), usage)
+
+    grid = service.get_grid('hospitals', zoom=7)
+    assert grid['total'] == 2 and grid['data_version'] == 1
+    assert service.get_grid('hospitals', zoom=7)['cells'] is grid['cells']
+    assert service.get_grid('hospitals', zoom=7, bbox=(126, 37, 128, 38))['cells'] == [grid['cells'][1]]
+
+    usage_grid = service.get_grid('usage', zoom=9)
+    assert usage_grid['period'] == '202409' and usage_grid['total'] == 140
+    assert usage_grid['unplaced'] == 7
+    gangnam = max(usage_grid['cells'], key=lambda cell: cell[2])
+    assert gangnam[2] == 100 and gangnam[0] == pytest.approx(37.50, abs=0.1)
+
+    for source, period in (('points', None), ('usage', '2024-09')):
+        with pytest.raises(ValueError):
+            service.get_grid(source, period=period)
+
+
+def test_folium_heatmap_mode_embeds_grid_not_points(tmp_path):
+    """heatmap 방식은 병원마다 마커를 넣지 않고 격자 HeatMap 레이어 하나만 넣음"""
+    filepath = str(tmp_path / 'heatmap.html')
+    FoliumMapService().create_hospital_map(hospitals=make_hospitals(905), filepath=filepath, render_mode='heatmap')
+
+    with open(filepath, encoding='utf-8') as f:
+        html = f.read()
+    assert 'L.heatLayer(' in html
+    assert 'L.circleMarker(' not in html and '/api/hospitals/{id}/popup' not in html
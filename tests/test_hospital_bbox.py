@@ -0,0 +1,89 @@
+"""
+Hospital BBox Test
+지도 영역(bbox) 병원 조회 - 공간 색인 영역 검색 및 /api/hospitals/bbox 테스트
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app import create_app
+from app.models.hospital_spatial_index import HospitalSpatialIndex
+from app.repositories.hospital_cache import HospitalSnapshot
+from app.services.hospital_geojson_service import HospitalGeoJsonService
+from benchmarks.synthetic_data import make_hospitals
+from test_hospital_geojson import FakeRepository
+
+
+class SyntheticRepository:
+    def __init__(self, hospitals):
+        self.current = HospitalSnapshot(hospitals, 1, 'v1', 0.0)
+
+    def snapshot(self):
+        return self.current
+
+
+def test_in_box_matches_full_scan():
+    """셀 후보만 확인한 결과가 전체 행을 검사한 결과와 같음 (ID 순)"""
+    hospitals = make_hospitals(800)
+    index = HospitalSpatialIndex(hospitals)
+
+    for box in ((37.4, 126.8, 37.7, 127.2), (35.0, 128.9, 35.3, 129.3), (33.0, 124.0, 39.0, 132.0)):
+        expected = sorted(h.hospital_id for h in hospitals
+                          if h.latitude is not None and h.longitude is not None
+                          and box[0] <= h.latitude <= box[2] and box[1] <= h.longitude <= box[3])
+        assert index.in_box(*box) == expected
+    assert index.in_box(10.0, 10.0, 11.0, 11.0) == []
+
+
+def test_limit_keeps_hospitals_near_center():
+    """영역 안의 병원이 limit보다 많으면 중심에 가까운 병원만 반환하고 truncated 표시"""
+    hospitals = make_hospitals(800)
+    service = HospitalGeoJsonService(SyntheticRepository(hospitals))
+
+    full = json.loads(service.get_in_box(33.0, 124.0, 39.0, 132.0, limit=2000)['body'])
+    assert full['truncated'] is False and len(full['features']) == full['total']
+
+    layer = service.get_in_box(33.0, 124.0, 39.0, 132.0, limit=50)
+    collection = json.loads(layer['body'])
+    assert layer['count'] == 50 and collection['truncated'] is True
+    assert collection['total'] == full['total']
+
+    def distance(feature):
+        lng, lat = feature['geometry']['coordinates']
+        return (lat - 36.0) ** 2 + (lng - 128.0) ** 2
+    kept = max(distance(feature) for feature in collection['features'])
+    kept_ids = {feature['properties']['id'] for feature in collection['features']}
+    assert all(distance(feature) >= kept - 1e-6 for feature in full['features']
+               if feature['properties']['id'] not in kept_ids)
+
+    with pytest.raises(ValueError):
+        service.get_in_box(38.0, 126.0, 37.0, 127.0)
+    with pytest.raises(ValueError):
+        service.get_in_box(37.0, 126.0, 38.0, 127.0, limit=0)
+
+
+def test_bbox_endpoint(monkeypatch):
+    """영역 안의 병원만 GeoJSON으로, 파라미터 오류는 400, 같은 ETag면 304"""
+    from app.routes import hospital_controller
+
+    client = create_app('testing').test_client()
+    monkeypatch.setattr(hospital_controller, 'geojson_service', HospitalGeoJsonService(FakeRepository()))
+
+    url = '/api/hospitals/bbox?min_lat=37&min_lng=126&max_lat=38&max_lng=128'
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/geo+json'
+    assert response.headers['X-Total-Count'] == '1'
+    features = json.loads(response.data)['features']
+    assert [feature['properties']['id'] for feature in features] == [1]
+
+    cached = client.get(url, headers={'If-None-Match': response.headers['ETag']})
+    assert cached.status_code == 304
+    assert client.get(url + '&type=기타').headers['X-Total-Count'] == '0'
+    assert client.get('/api/hospitals/bbox?min_lat=37&min_lng=126').status_code == 400
+    assert client.get(url + '&limit=5000').status_code == 400
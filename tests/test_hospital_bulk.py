@@ -0,0 +1,141 @@
+"""
+Hospital Bulk CRUD Test
+병원 일괄 생성/수정/삭제 테스트 (실제 DB 대신 가짜 커넥션 사용)
+"""
+
+import pytest
+import sys
+import os
+from contextlib import contextmanager
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.repositories.hospital_crud_repository import HospitalCrudRepository
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.lastrowid = None
+        self.rowcount = 0
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.connection.statements.append((' '.join(query.split()), params))
+        if 'FOR UPDATE' in query:
+            self._rows = [{'연번': i} for i in params if i in self.connection.existing]
+        elif query.split()[0] == 'INSERT':
+            # 다중 행 INSERT 한 문장: 첫 연번(LAST_INSERT_ID())과 추가한 행 수
+            self.rowcount = len(params) // 10 - self.connection.insert_shortfall
+            self.lastrowid = self.connection.next_id
+            self.connection.next_id += self.rowcount
+
+    def executemany(self, query, rows):
+        self.connection.statements.append((' '.join(query.split()), list(rows)))
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeConnection:
+    def __init__(self, existing):
+        self.existing = set(existing)
+        self.statements = []
+        self.next_id = 906
+        self.insert_shortfall = 0
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class FakePool:
+    def __init__(self, connection):
+        self.conn = connection
+
+    @contextmanager
+    def connection(self):
+        yield self.conn
+
+
+class FakeCache:
+    def __init__(self):
+        self.invalidations = 0
+
+    def invalidate(self):
+        self.invalidations += 1
+
+
+def row(name):
+    return {'시군구': '강남구', '요양기관명': name, '종별': '의원', '병상수': 0, '진료과수': 3,
+            '전화번호': '02-000-0000', '주소': '테헤란로 1', '상세주소': '', '경도': 127.0, '위도': 37.5}
+
+
+def test_bulk_apply_uses_one_transaction_and_invalidates_once():
+    """생성/수정/삭제를 한 번의 커밋으로 적용하고 캐시는 한 번만 무효화"""
+    connection = FakeConnection(existing={1, 2})
+    cache = FakeCache()
+    repository = HospitalCrudRepository(pool=FakePool(connection), cache=cache)
+    operations = [
+        {'op': 'create', 'data': row('새 병원 A')},
+        {'op': 'update', 'id': 1, 'data': row('수정 병원')},
+        {'op': 'create', 'data': row('새 병원 B')},
+        {'op': 'delete', 'id': 2},
+        {'op': 'delete', 'id': 99},
+    ]
+    assert repository.validate_bulk(operations) == []
+
+    results = repository.bulk_apply(operations)
+
+    assert [(r['id'], r['status']) for r in results] == [
+        (906, 'created'), (1, 'updated'), (907, 'created'), (2, 'deleted'), (99, 'not_found')
+    ]
+    assert connection.commits == 1
+    assert cache.invalidations == 1
+    inserts = [(query, params) for query, params in connection.statements
+               if query.startswith('INSERT') and 'ON DUPLICATE KEY UPDATE' not in query]
+    assert len(inserts) == 1
+    query, params = inserts[0]
+    assert query.count('(%s') == 2 and [params[1], params[11]] == ['새 병원 A', '새 병원 B']
+    executemany_rows = [params for query, params in connection.statements
+                        if isinstance(params, list) and params and isinstance(params[0], tuple)]
+    assert [len(rows) for rows in executemany_rows] == [1]
+
+
+def test_validate_bulk_reports_row_errors():
+    """잘못된 작업은 인덱스와 함께 오류를 반환"""
+    repository = HospitalCrudRepository(pool=FakePool(FakeConnection([])), cache=None)
+    errors = repository.validate_bulk([
+        {'op': 'create', 'data': row('정상')},
+        {'op': 'upsert'},
+        {'op': 'update', 'id': 3, 'data': {'요양기관명': '이름만'}},
+        {'op': 'delete', 'id': 'x'},
+        {'op': 'delete', 'id': 3},
+    ])
+    assert [error['index'] for error in errors] == [1, 2, 3, 4]
+
+
+def test_bulk_apply_rolls_back_when_insert_row_count_differs():
+    """다중 행 INSERT의 추가 행 수가 요청과 다르면 연번을 추정하지 않고 전체 롤백"""
+    connection = FakeConnection(existing=set())
+    connection.insert_shortfall = 1
+    cache = FakeCache()
+    repository = HospitalCrudRepository(pool=FakePool(connection), cache=cache)
+
+    with pytest.raises(RuntimeError):
+        repository.bulk_apply([{'op': 'create', 'data': row('A')}, {'op': 'create', 'data': row('B')}])
+    assert (connection.commits, connection.rollbacks, cache.invalidations) == (0, 1, 0)
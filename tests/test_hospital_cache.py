@@ -0,0 +1,107 @@
+"""
+Hospital Snapshot Cache Test
+병원 스냅샷 캐시 테스트 (DB 대신 가짜 로더 사용)
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.hospital import Hospital
+from app.repositories.hospital_cache import HospitalSnapshotCache
+
+
+class FakeLoader:
+    def __init__(self):
+        self.calls = 0
+        self.fingerprint = 'v1'
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self):
+        self.calls += 1
+        self.release.wait(5)
+        hospitals = [Hospital(hospital_id=1, name='테스트 병원', address='서울특별시 강남구')]
+        return hospitals, self.fingerprint
+
+
+def test_snapshot_is_cached_until_invalidated():
+    """무효화 전까지 같은 스냅샷을 반환"""
+    loader = FakeLoader()
+    cache = HospitalSnapshotCache(loader, stale_while_revalidate=False)
+
+    first = cache.get()
+    second = cache.get()
+    assert first is second
+    assert loader.calls == 1
+    assert first.version == 1
+
+    cache.invalidate()
+    loader.fingerprint = 'v2'
+    third = cache.get()
+    assert loader.calls == 2
+    assert third.version == 2
+
+
+def test_unchanged_data_keeps_version():
+    """내용이 같으면 재조회 후에도 데이터 버전 유지"""
+    loader = FakeLoader()
+    cache = HospitalSnapshotCache(loader, stale_while_revalidate=False)
+    first = cache.get()
+    cache.invalidate()
+    assert cache.get() is first
+    assert cache.data_version == 1
+
+
+def test_concurrent_misses_load_once():
+    """동시에 몰린 요청도 DB 조회는 한 번만 수행 (single-flight)"""
+    loader = FakeLoader()
+    loader.release.clear()
+    cache = HospitalSnapshotCache(loader, stale_while_revalidate=False)
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(cache.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    loader.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == 1
+    assert len({id(snapshot) for snapshot in results}) == 1
+
+
+def test_stale_while_revalidate_serves_previous_snapshot():
+    """무효화 후에도 갱신이 끝날 때까지 이전 스냅샷을 즉시 반환"""
+    loader = FakeLoader()
+    cache = HospitalSnapshotCache(loader, stale_while_revalidate=True)
+    first = cache.get()
+
+    loader.release.clear()
+    loader.fingerprint = 'v2'
+    cache.invalidate()
+    assert cache.get() is first
+    assert cache.get() is first
+
+    loader.release.set()
+    refreshed = cache.refresh()
+    assert refreshed.version == 2
+    assert loader.calls <= 3
+
+
+def test_spatial_index_is_carried_over_incrementally():
+    """이전 스냅샷의 공간 색인이 있으면 새 스냅샷에서 증분 갱신된 색인을 바로 사용"""
+    loader = FakeLoader()
+    cache = HospitalSnapshotCache(loader, stale_while_revalidate=False)
+    first = cache.get()
+    first.spatial_index
+
+    loader.fingerprint = 'v2'
+    cache.invalidate()
+    second = cache.get()
+    assert second is not first
+    assert 'spatial_index' in second._derived
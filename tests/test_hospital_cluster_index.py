@@ -0,0 +1,116 @@
+"""
+Hospital Cluster Index Test
+줌 레벨별 병원 클러스터 색인 및 클러스터 GeoJSON 테스트
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.hospital import Hospital
+from app.models.hospital_cluster_index import MAX_ZOOM, MIN_ZOOM, HospitalClusterIndex
+from app.services.hospital_geojson_service import HospitalGeoJsonService, parse_bbox
+from benchmarks.synthetic_data import make_hospitals
+from test_hospital_geojson import FakeRepository
+
+
+def make(hospital_id, lat, lng, kind='병원'):
+    return Hospital(hospital_id=hospital_id, name=f'병원{hospital_id}', latitude=lat, longitude=lng,
+                    medical_departments=[kind])
+
+
+def summary(index, zoom):
+    return sorted((item['cell'], item['count'], tuple(sorted(item['types'].items())))
+                  for item in index.clusters(zoom))
+
+
+def test_every_zoom_keeps_all_points():
+    """모든 줌에서 클러스터 수 합계가 병원 수와 같고, 줌이 낮을수록 클러스터가 적음"""
+    hospitals = make_hospitals(905)
+    index = HospitalClusterIndex(hospitals)
+
+    sizes = []
+    for zoom in range(MIN_ZOOM, MAX_ZOOM + 1):
+        clusters = index.clusters(zoom)
+        assert sum(item['count'] for item in clusters) == 905
+        sizes.append(len(clusters))
+    assert sizes == sorted(sizes) and sizes[0] < 10 and sizes[7] < 200
+
+    # 영역과 겹치지 않는 셀 제외, 영역 안의 병원은 모두 반환된 셀에 포함
+    inside = index.clusters(7, bbox=(126.0, 37.0, 128.0, 38.0))
+    assert inside and len(inside) < sizes[7]
+    assert all(124 <= item['lng'] <= 130 and 35 <= item['lat'] <= 40 for item in inside)
+    assert sum(item['count'] for item in inside) >= sum(
+        1 for h in hospitals if 126 <= h.longitude <= 128 and 37 <= h.latitude <= 38)
+
+
+def test_cluster_centroid_types_and_expansion():
+    """중심점, 종별 개수, 나뉘는 줌 계산 / 병원이 하나면 그 병원 ID"""
+    index = HospitalClusterIndex([
+        make(1, 37.50, 127.00),
+        make(2, 37.51, 127.01, '의원'),
+        make(3, 35.18, 129.07),
+        make(4, None, None),
+    ])
+    national = {item['count']: item for item in index.clusters(5)}
+
+    pair = national[2]
+    assert pair['lat'] == pytest.approx(37.505) and pair['types'] == {'병원': 1, '의원': 1}
+    assert 5 < pair['expansion_zoom'] <= MAX_ZOOM
+    split = index.clusters(pair['expansion_zoom'])
+    assert sorted(item.get('hospital_id') for item in split if item['count'] == 1)[:2] == [1, 2]
+    assert national[1]['hospital_id'] == 3
+
+
+def test_bbox_keeps_cluster_straddling_viewport_edge():
+    """중심점이 영역 밖이어도 셀이 영역과 겹치면 (영역 안에 병원이 있으면) 클러스터 포함"""
+    # 줌 5 셀 하나(경도 약 126.56~129.38) 안의 두 병원 - 중심점 경도 127.6은 영역(동쪽 끝 127.0) 밖
+    index = HospitalClusterIndex([make(1, 36.00, 126.90), make(2, 36.01, 128.30)])
+    [cluster] = index.clusters(5)
+    assert cluster['count'] == 2 and cluster['lng'] > 127.0
+
+    assert index.clusters(5, bbox=(126.0, 35.5, 127.0, 36.5)) == [cluster]
+    assert index.clusters(5, bbox=(124.0, 35.5, 126.0, 36.5)) == []
+    assert index.clusters(5, bbox=(127.0, 38.0, 128.0, 39.0)) == []
+
+
+def test_updated_matches_rebuild():
+    """추가/삭제/이동/종별 변경을 증분 반영한 결과가 처음부터 만든 색인과 같음"""
+    hospitals = make_hospitals(300)
+    index = HospitalClusterIndex(hospitals)
+
+    changed = hospitals[10:]
+    changed[0] = make(changed[0].hospital_id, 36.0, 128.0)
+    changed[1] = make(changed[1].hospital_id, changed[1].latitude, changed[1].longitude, '요양병원')
+    changed.append(make(1000, 33.5, 126.5))
+    updated = index.updated(changed)
+    rebuilt = HospitalClusterIndex(changed)
+
+    for zoom in (0, 6, 10, MAX_ZOOM):
+        assert summary(updated, zoom) == summary(rebuilt, zoom)
+    assert summary(index, 0) == summary(HospitalClusterIndex(hospitals), 0)
+
+
+def test_cluster_geojson_and_bbox_validation():
+    """클러스터 GeoJSON 속성과 bbox 형식 검사"""
+    service = HospitalGeoJsonService(FakeRepository())
+
+    layer = service.get_clusters(14)
+    features = json.loads(layer['body'])['features']
+    assert layer['total'] == 2 and layer['count'] == 2
+    assert {feature['properties']['id'] for feature in features} == {1, 2}
+
+    national = json.loads(service.get_clusters(0)['body'])['features']
+    assert national[0]['properties']['cluster'] is True
+    assert national[0]['properties']['types'] == {'병원': 1, '기타': 1}
+
+    assert parse_bbox('126,33,130,39') == (126.0, 33.0, 130.0, 39.0)
+    for text in ('126,33,130', '130,33,126,39', 'a,b,c,d'):
+        with pytest.raises(ValueError):
+            parse_bbox(text)
+    with pytest.raises(ValueError):
+        service.get_clusters(30)
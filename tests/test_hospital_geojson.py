@@ -0,0 +1,104 @@
+"""
+Hospital GeoJSON Test
+지도 레이어용 병원 GeoJSON, 마커 팝업 API 테스트 (DB 대신 가짜 리포지토리 사용)
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app import create_app
+from app.models.hospital import Hospital
+from app.repositories.hospital_cache import HospitalSnapshot
+from app.services.hospital_geojson_service import HospitalGeoJsonService
+from app.services.hospital_service import HospitalService
+
+
+class FakeRepository:
+    def __init__(self):
+        self.current = HospitalSnapshot([
+            Hospital(hospital_id=1, name='강남 <병원>', address='테헤란로 1 서울특별시 강남구',
+                     latitude=37.5012345, longitude=127.0398765, medical_departments=['병원']),
+            Hospital(hospital_id=2, name='해운대 한의원', address='중앙로 5 부산광역시 해운대구',
+                     latitude=35.1631, longitude=129.1635, medical_departments=['한의원']),
+            Hospital(hospital_id=3, name='좌표 없음', address='시청로 1 서울특별시 중구',
+                     medical_departments=['의원']),
+        ], 1, 'v1', 0.0)
+
+    def snapshot(self):
+        return self.current
+
+
+def test_layer_is_quantized_projected_and_cached():
+    """좌표는 반올림, 속성은 id/name/type만, 같은 스냅샷에서는 재사용"""
+    service = HospitalGeoJsonService(FakeRepository())
+
+    layer = service.get_layer(precision=4)
+    collection = json.loads(layer['body'])
+
+    assert layer['count'] == 2
+    first = collection['features'][0]
+    assert first['geometry']['coordinates'] == [127.0399, 37.5012]
+    assert first['properties'] == {'id': 1, 'name': '강남 <병원>', 'type': '병원'}
+    assert collection['features'][1]['properties']['type'] == '기타'
+    assert service.get_layer(precision=4) is layer
+
+    seoul = service.get_layer(region='서울')
+    assert seoul['count'] == 1 and seoul['etag'] != layer['etag']
+    with pytest.raises(ValueError):
+        service.get_layer(region='서울특별시 강남구')
+
+
+def test_endpoint_supports_etag(monkeypatch):
+    """같은 ETag로 다시 요청하면 304"""
+    from app.routes import hospital_controller
+
+    client = create_app('testing').test_client()
+    monkeypatch.setattr(hospital_controller, 'geojson_service', HospitalGeoJsonService(FakeRepository()))
+
+    response = client.get('/api/map/hospitals.geojson?type=병원')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/geo+json'
+    assert response.headers['X-Total-Count'] == '1'
+
+    etag = response.headers['ETag']
+    cached = client.get('/api/map/hospitals.geojson?type=병원', headers={'If-None-Match': etag})
+    assert cached.status_code == 304 and cached.data == b''
+    assert client.get('/api/map/hospitals.geojson?precision=9').status_code == 400
+
+
+def test_popup_endpoint_escapes_and_revalidates(monkeypatch):
+    """팝업은 이스케이프한 HTML, 좌표 없는 병원은 404, 같은 ETag면 304"""
+    from app.routes import hospital_controller
+
+    client = create_app('testing').test_client()
+    monkeypatch.setattr(hospital_controller, 'service', HospitalService(FakeRepository()))
+
+    response = client.get('/api/hospitals/1/popup')
+    assert response.status_code == 200 and response.mimetype == 'text/html'
+    assert '강남 &lt;병원&gt;' in response.get_data(as_text=True)
+
+    cached = client.get('/api/hospitals/1/popup', headers={'If-None-Match': response.headers['ETag']})
+    assert cached.status_code == 304
+    assert client.get('/api/hospitals/3/popup').status_code == 404
+
+
+def test_zero_coordinates_count_like_cluster_and_bbox_layers():
+    """좌표 0.0은 좌표 없음이 아님 - GeoJSON 레이어, 클러스터, bbox 조회의 병원 수가 같음"""
+    repository = FakeRepository()
+    repository.current = HospitalSnapshot(list(repository.current.hospitals) + [
+        Hospital(hospital_id=4, name='적도 병원', address='중앙로 1 서울특별시 중구',
+                 latitude=0.0, longitude=0.0, medical_departments=['병원']),
+    ], 2, 'v2', 0.0)
+    service = HospitalGeoJsonService(repository)
+
+    layer = service.get_layer()
+    features = json.loads(layer['body'])['features']
+    assert layer['count'] == 3
+    assert [0.0, 0.0] in [feature['geometry']['coordinates'] for feature in features]
+    assert service.get_clusters(14)['total'] == layer['count']
+    assert service.get_in_box(-90.0, -180.0, 90.0, 180.0)['count'] == layer['count']
@@ -0,0 +1,96 @@
+"""
+Hospital Import Test
+병원 목록 파일 가져오기 테스트 (DB 대신 가짜 리포지토리 사용)
+"""
+
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.hospital_import_service import HospitalImportError, HospitalImportService
+
+
+class FakeRepository:
+    def __init__(self):
+        self.chunks = []
+        self.invalidations = 0
+
+    def upsert_chunk(self, rows, invalidate=True):
+        self.chunks.append(rows)
+        with_id = sum(1 for row in rows if row['연번'] is not None)
+        return {'inserted': len(rows) - with_id, 'upserted': with_id}
+
+    def invalidate_cache(self):
+        self.invalidations += 1
+
+
+CSV = """연번,병원명,종별,병상수,진료과수,전화번호,주소,상세주소,위도,경도
+,새병원,의원,0,3,02-000-0000,테헤란로 1 서울특별시 강남구 테헤란로 1,,37.5,127.0
+12,수정병원,병원,30,5,,중앙로 5 부산광역시 해운대구 중앙로 5,2층,35.1,129.1
+,좌표오류,의원,0,1,,시청로 1 대전광역시 서구 시청로 1,,127.0,37.5
+,,,,,,,,,
+,병상오류,의원,-1,1,,조치원로 31 세종특별자치시 조치원로 31,,36.6,127.3
+"""
+
+
+def test_import_csv_in_chunks(tmp_path):
+    """CSV를 묶음 단위로 검증/저장하고 캐시는 한 번만 무효화"""
+    path = tmp_path / 'hospitals.csv'
+    path.write_text(CSV, encoding='utf-8-sig')
+    repository = FakeRepository()
+    progress = []
+
+    summary = HospitalImportService(repository, chunk_size=2).import_file(str(path), progress=progress.append)
+
+    assert [len(chunk) for chunk in repository.chunks] == [2]
+    assert repository.invalidations == 1
+    assert len(progress) == 3
+    assert summary['rows'] == 5
+    assert (summary['inserted'], summary['upserted'], summary['rejected']) == (1, 1, 2)
+    assert [error['row'] for error in summary['errors']] == [4, 6]
+
+    first, second = repository.chunks[0]
+    assert first['시군구'] == '강남구' and first['연번'] is None
+    assert second['연번'] == 12 and second['병상수'] == 30
+
+
+def test_dry_run_and_unsupported_file(tmp_path):
+    """dry_run은 저장하지 않고, 지원하지 않는 형식은 오류"""
+    path = tmp_path / 'hospitals.csv'
+    path.write_text(CSV, encoding='utf-8')
+    repository = FakeRepository()
+    summary = HospitalImportService(repository).import_file(str(path), dry_run=True)
+    assert summary['valid'] == 2
+    assert repository.chunks == [] and repository.invalidations == 0
+
+    with pytest.raises(HospitalImportError):
+        HospitalImportService(repository).import_file(str(tmp_path / 'hospitals.txt'))
+
+
+def test_import_endpoint_limits_size_and_removes_temp_file(tmp_path, monkeypatch):
+    """크기 상한은 파일을 읽기 전에 JSON 413, 업로드 저장 실패는 임시 파일을 지우고 JSON 500"""
+    import io
+    import tempfile
+    from werkzeug.datastructures import FileStorage
+    from app import create_app
+
+    app = create_app('testing')
+    client = app.test_client()
+    app.config['MAX_CONTENT_LENGTH'] = 1024
+    response = client.post('/api/hospitals/import',
+                           data={'file': (io.BytesIO(b'x' * 4096), 'hospitals.csv')})
+    assert response.status_code == 413 and 'error' in response.get_json()
+
+    app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+
+    def fail_save(self, dst, buffer_size=16384):
+        raise OSError('디스크 공간 부족')
+    monkeypatch.setattr(FileStorage, 'save', fail_save)
+    response = client.post('/api/hospitals/import',
+                           data={'file': (io.BytesIO(CSV.encode('utf-8')), 'hospitals.csv')})
+    assert response.status_code == 500 and response.get_json()['error'] == '디스크 공간 부족'
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,69 @@
+"""
+Hospital Region Index Test
+병원 시도/시군구 색인 테스트
+"""
+
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.hospital import Hospital
+from app.models.hospital_region_index import HospitalRegionIndex, parse_region
+
+
+def make(hospital_id, address, sigungu=None):
+    return Hospital(hospital_id=hospital_id, name=f'병원{hospital_id}', address=address, sigungu=sigungu)
+
+
+@pytest.fixture
+def hospitals():
+    return [
+        make(1, '테헤란로 1 서울특별시 강남구'),
+        make(2, '중앙로 5 부산광역시 해운대구'),
+        make(3, '대구광역시 중구 국채보상로 10'),
+        make(4, '경기도 광주시 경안로 3'),
+        make(5, '부산 중구 중앙대로 2', sigungu='중구'),
+        make(6, '주소 미상'),
+    ]
+
+
+def test_parse_region_uses_sido_token_not_substring():
+    """시도는 주소 단어로 판별 (해운대구의 '대구', 경기도 광주시의 '광주'에 걸리지 않음)"""
+    assert parse_region('중앙로 5 부산광역시 해운대구') == ('부산', '해운대구')
+    assert parse_region('경기도 광주시 경안로 3') == ('경기', '광주시')
+    assert parse_region('세종특별자치시 한누리대로 2130') == ('세종', '')
+    assert parse_region('서울 종로구 1', sigungu='서울특별시 강북구') == ('서울', '강북구')
+    assert parse_region('대구로 15') == ('', '')
+
+
+def test_region_lookups(hospitals):
+    """시도, '시도 시군구', 시군구 이름으로 조회하고 시도별 개수 집계"""
+    index = HospitalRegionIndex(hospitals)
+
+    assert index.ids('대구') == [3]
+    assert index.ids('부산') == [2, 5]
+    assert index.ids('부산광역시 중구') == [5]
+    assert index.ids('중구') == [3, 5]
+    assert index.ids('광주') == []
+    assert index.count('서울') == 1
+    assert index.sido_counts() == {'서울': 1, '부산': 2, '대구': 1, '경기': 1}
+    assert index.sigungu_counts('부산광역시') == {'해운대구': 1, '중구': 1}
+    assert index.region_of(6) == ('', '')
+
+
+def test_updated_reparses_only_changed_addresses(hospitals):
+    """주소가 바뀐 병원만 다시 파싱하고 나머지는 이전 결과 재사용"""
+    index = HospitalRegionIndex(hospitals)
+    assert index.parse_count == 6
+
+    hospitals[0] = make(1, '대전광역시 서구 둔산로 100')
+    hospitals.append(make(7, '제주특별자치도 제주시 연동 1'))
+    updated = index.updated(hospitals)
+
+    assert updated.parse_count == 2
+    assert updated.ids('서울') == [] and updated.ids('대전 서구') == [1]
+    assert updated.ids('제주') == [7]
+    assert index.ids('서울') == [1]
@@ -0,0 +1,47 @@
+"""
+Hospital Search Index Test
+병원 bigram 검색 색인 테스트
+"""
+
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.hospital import Hospital
+from app.models.hospital_search_index import HospitalSearchIndex
+
+
+@pytest.fixture
+def index():
+    hospitals = [
+        Hospital(hospital_id=1, name='서울중앙병원', sigungu='강남구',
+                 street_address='서울특별시 강남구 테헤란로 1', phone='02-123-4567'),
+        Hospital(hospital_id=2, name='강남연세의원', sigungu='서초구',
+                 street_address='서울특별시 서초구 강남대로 10', phone='02-555-0000'),
+        Hospital(hospital_id=3, name='부산해운대병원', sigungu='해운대구',
+                 street_address='부산광역시 해운대구 중앙로 5', phone='051-777-8888'),
+    ]
+    return HospitalSearchIndex(hospitals)
+
+
+def test_matches_like_substring_semantics(index):
+    """LIKE '%검색어%'처럼 부분 문자열이 포함된 병원만 반환"""
+    assert {hospital_id for hospital_id, _ in index.search_ids('중앙')} == {1, 3}
+    assert index.search_ids('대구병원') == []
+
+
+def test_name_match_ranks_above_address_match(index):
+    """요양기관명 일치가 주소 일치보다 먼저"""
+    ids = [hospital_id for hospital_id, _ in index.search_ids('강남')]
+    assert ids[0] == 2
+    assert set(ids) == {1, 2}
+
+
+def test_multiple_terms_and_phone_normalization(index):
+    """여러 단어는 모두 포함해야 하고, 전화번호는 하이픈 없이도 검색"""
+    assert [hospital_id for hospital_id, _ in index.search_ids('부산 병원')] == [3]
+    assert [hospital_id for hospital_id, _ in index.search_ids('5550000')] == [2]
+    assert [hospital_id for hospital_id, _ in index.search_ids('해')] == [3]
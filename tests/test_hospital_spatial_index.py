@@ -0,0 +1,108 @@
+"""
+Hospital Spatial Index Test
+병원 격자 공간 색인 테스트
+"""
+
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.hospital import Hospital
+from app.models.hospital_spatial_index import HospitalSpatialIndex
+
+
+def make(hospital_id, lat, lng):
+    return Hospital(hospital_id=hospital_id, name=f'병원{hospital_id}', latitude=lat, longitude=lng)
+
+
+@pytest.fixture
+def hospitals():
+    return [
+        make(1, 37.5665, 126.9780),   # 서울시청
+        make(2, 37.5700, 126.9830),   # 약 0.6km
+        make(3, 37.4979, 127.0276),   # 강남역, 약 8.8km
+        make(4, 35.1796, 129.0756),   # 부산
+        make(5, None, None),          # 좌표 없음
+    ]
+
+
+def test_within_returns_sorted_by_distance(hospitals):
+    """반경 안의 병원만 가까운 순으로 반환"""
+    index = HospitalSpatialIndex(hospitals)
+    assert len(index) == 4
+    assert [hospital_id for hospital_id, _ in index.within(37.5665, 126.9780, 1.0)] == [1, 2]
+
+    results = index.within(37.5665, 126.9780, 10.0)
+    assert [hospital_id for hospital_id, _ in results] == [1, 2, 3]
+    assert 8 < results[2][1] < 10
+
+
+def test_updated_applies_changes_without_touching_old_index(hospitals):
+    """증분 갱신은 새 색인에만 반영되고 이전 색인은 그대로"""
+    index = HospitalSpatialIndex(hospitals)
+    changed = [
+        hospitals[0],
+        make(2, 35.1800, 129.0760),   # 서울 -> 부산으로 이동
+        hospitals[2],
+        make(6, 37.5670, 126.9790),   # 새 병원
+    ]                                 # 4번(부산) 삭제
+
+    updated = index.updated(changed)
+    assert [hospital_id for hospital_id, _ in updated.within(37.5665, 126.9780, 1.0)] == [1, 6]
+    assert [hospital_id for hospital_id, _ in updated.within(35.1796, 129.0756, 1.0)] == [2]
+
+    assert [hospital_id for hospital_id, _ in index.within(37.5665, 126.9780, 1.0)] == [1, 2]
+    assert [hospital_id for hospital_id, _ in index.within(35.1796, 129.0756, 1.0)] == [4]
+
+
+def test_nearest_matches_brute_force_with_filter():
+    """k-최근접 결과가 전체 정렬 결과와 같고 필터를 적용"""
+    import random
+    from app.models.hospital_spatial_index import haversine_km
+
+    rng = random.Random(3)
+    hospitals = [make(i, rng.uniform(33.2, 38.6), rng.uniform(126.1, 129.6)) for i in range(1, 501)]
+    index = HospitalSpatialIndex(hospitals)
+    accept = lambda hospital_id: hospital_id % 3 == 0
+
+    for _ in range(20):
+        lat, lng = rng.uniform(33.5, 38.3), rng.uniform(126.5, 129.3)
+        expected = sorted(
+            (float(haversine_km(lat, lng, [h.latitude], [h.longitude])[0]), h.hospital_id)
+            for h in hospitals if accept(h.hospital_id)
+        )[:7]
+        result = index.nearest(lat, lng, 7, accept)
+        assert [hospital_id for hospital_id, _ in result] == [hospital_id for _, hospital_id in expected]
+
+
+def test_nearest_far_from_grid_and_reject_all_filter():
+    """격자 범위 밖의 중심은 전체 계산으로, 모두 거르는 필터는 범위를 넘겨 탐색하지 않음"""
+    import time
+    from app.models.hospital_spatial_index import haversine_km
+
+    hospitals = [make(i, 33.2 + (i % 50) * 0.1, 126.1 + (i // 50) * 0.1) for i in range(1, 1001)]
+    index = HospitalSpatialIndex(hospitals)
+
+    started = time.perf_counter()
+    for lat, lng in ((-80.0, -170.0), (0.0, 0.0), (90.0, 180.0)):
+        expected = sorted(
+            (float(haversine_km(lat, lng, [h.latitude], [h.longitude])[0]), h.hospital_id) for h in hospitals
+        )[:10]
+        result = index.nearest(lat, lng, 10)
+        assert [hospital_id for hospital_id, _ in result] == [hospital_id for _, hospital_id in expected]
+
+    assert index.nearest(36.0, 127.5, 5, lambda hospital_id: False) == []
+    assert index.nearest(-80.0, -170.0, 5, lambda hospital_id: False) == []
+    assert time.perf_counter() - started < 1.0
+
+
+def test_nearest_endpoint_rejects_out_of_range_coordinates():
+    """범위를 벗어난 위도/경도는 400"""
+    from app import create_app
+
+    client = create_app('testing').test_client()
+    for query in ('lat=1e6&lng=127', 'lat=37&lng=200', 'lat=-91&lng=127', 'lat=nan&lng=127'):
+        assert client.get(f'/api/hospitals/nearest?{query}').status_code == 400
@@ -0,0 +1,57 @@
+"""
+Hospital Store Test
+병원 스냅샷 직렬화 캐시 (행 JSON 조각, 종별/병상수 필터) 테스트
+"""
+
+import json
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.hospital import Hospital
+from app.models.hospital_store import HospitalStore
+
+
+def make(hospital_id, hospital_type, bed_count, lat=37.5, lng=127.0):
+    return Hospital(hospital_id=hospital_id, name=f'병원{hospital_id}', latitude=lat, longitude=lng,
+                    medical_departments=[hospital_type], bed_count=bed_count)
+
+
+HOSPITALS = [
+    make(11, '의원', 0),
+    make(12, '병원', 120),
+    make(13, '종합병원', 400, lat=None, lng=None),   # 좌표 없음
+    make(14, '병원', 30),
+    Hospital(hospital_id=15, name='병원15'),          # 종별/병상수 없음
+]
+
+
+def test_filter_by_type_and_min_beds():
+    """종별/최소 병상수 조건에 맞는 행 위치 (없는 종별은 빈 결과)"""
+    store = HospitalStore(HOSPITALS)
+
+    assert store.filter().tolist() == [0, 1, 2, 3, 4]
+    assert store.filter(hospital_type='병원').tolist() == [1, 3]
+    assert store.filter(hospital_type='병원', min_beds=100).tolist() == [1]
+    assert store.filter(min_beds=100).tolist() == [1, 2]
+    assert store.filter(hospital_type='기타').tolist() == [4]
+    assert store.filter(hospital_type='요양병원').tolist() == []
+    assert store.matches(hospital_type='요양병원').tolist() == [False] * 5
+
+
+def test_position_and_to_json():
+    """ID -> 행 위치, 위치 목록 JSON이 to_dict() 직렬화와 같고 좌표가 없으면 null"""
+    store = HospitalStore(HOSPITALS)
+
+    assert [store.position(hospital.hospital_id) for hospital in HOSPITALS] == [0, 1, 2, 3, 4]
+    assert store.position(99) is None
+
+    assert json.loads(store.to_json()) == [hospital.to_dict() for hospital in HOSPITALS]
+    assert store.to_json() is store.to_json()
+
+    rows = json.loads(store.to_json(store.filter(min_beds=100)))
+    assert [row['hospital_id'] for row in rows] == [12, 13]
+    assert rows[1]['latitude'] is None and rows[1]['longitude'] is None
+    assert store.to_json([]) == '[]'
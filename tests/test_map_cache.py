@@ -0,0 +1,82 @@
+"""
+Folium Map Cache Test
+생성된 지도 캐시 테스트 (DB, Folium 대신 가짜 리포지토리/지도 서비스 사용)
+"""
+
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.hospital import Hospital
+from app.repositories.hospital_cache import HospitalSnapshot
+from app.services.map_cache import FoliumMapCache
+
+
+class FakeRepository:
+    def __init__(self):
+        self.current = self.make_snapshot(1, 'v1')
+
+    @staticmethod
+    def make_snapshot(version, fingerprint):
+        hospitals = [
+            Hospital(hospital_id=1, name='서울 병원', address='테헤란로 1 서울특별시 강남구'),
+            Hospital(hospital_id=2, name='부산 병원', address='중앙로 5 부산광역시 해운대구'),
+        ]
+        return HospitalSnapshot(hospitals, version, fingerprint, 0.0)
+
+    def snapshot(self):
+        return self.current
+
+
+class FakeMapService:
+    def __init__(self):
+        self.calls = []
+
+    def create_hospital_map(self, center_lat=36.5, center_lng=127.5, zoom_start=7,
+                            hospitals=None, filepath=None, render_mode=None):
+        self.calls.append(('', len(hospitals)))
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write('<html></html>')
+        return filepath
+
+    def create_region_map(self, region, hospitals=None, filepath=None, render_mode=None):
+        self.calls.append((region, len(hospitals)))
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(f'<html>{region}</html>')
+        return filepath
+
+
+def test_same_inputs_reuse_rendered_file(tmp_path):
+    """지역/옵션/데이터가 같으면 다시 그리지 않음"""
+    service = FakeMapService()
+    cache = FoliumMapCache(str(tmp_path), map_service=service, repository=FakeRepository())
+
+    first = cache.get_or_render('서울')
+    second = cache.get_or_render('서울')
+
+    assert first['cache_hit'] is False and second['cache_hit'] is True
+    assert first['filepath'] == second['filepath'] and os.path.exists(first['filepath'])
+    assert first['hospital_count'] == 1
+    assert service.calls == [('서울', 1)]
+    assert cache.get_or_render('제주') is None
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_data_or_option_change_renders_new_file(tmp_path):
+    """데이터 fingerprint나 전국 지도 옵션이 바뀌면 새 파일 생성"""
+    service = FakeMapService()
+    repository = FakeRepository()
+    cache = FoliumMapCache(str(tmp_path), map_service=service, repository=repository)
+
+    default = cache.get_or_render()
+    zoomed = cache.get_or_render(zoom_start=10)
+    repository.current = repository.make_snapshot(2, 'v2')
+    changed = cache.get_or_render()
+
+    assert len({default['filename'], zoomed['filename'], changed['filename']}) == 3
+    assert changed['data_version'] == 2
+    assert len(service.calls) == 3
+    assert cache.stats()['renders'] == 3
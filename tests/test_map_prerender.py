@@ -0,0 +1,104 @@
+"""
+Map Prerender Test
+지도 사전 생성 테스트 (DB, Folium 대신 가짜 리포지토리/지도 서비스 사용)
+"""
+
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.map_cache import FoliumMapCache
+from app.services.map_prerender import MapPrerenderer
+from test_map_cache import FakeMapService, FakeRepository
+
+
+def test_run_renders_national_and_regions_once(tmp_path):
+    """전국 + 병원이 있는 시도 지도만 생성하고, 다시 실행하면 모두 건너뜀"""
+    service = FakeMapService()
+    cache = FoliumMapCache(str(tmp_path), map_service=service, repository=FakeRepository())
+    prerenderer = MapPrerenderer(cache, workers=0)
+
+    summary = prerenderer.run()
+
+    # 시도 색인 기준이라 '부산광역시 해운대구'가 '대구' 지역에 포함되지 않음
+    assert sorted(region for region, _ in service.calls) == ['', '부산', '서울']
+    assert len(summary['rendered']) == 3 and summary['failed'] == []
+    assert len(summary['empty']) == 15
+
+    again = prerenderer.run()
+    assert again['rendered'] == [] and len(again['skipped']) == 3
+    assert len(service.calls) == 3
+
+
+def test_poll_rebuilds_only_on_version_change_and_serves_stale(tmp_path):
+    """데이터 버전이 바뀔 때만 다시 생성하고, 그 전까지는 이전 지도를 내보냄"""
+    service = FakeMapService()
+    repository = FakeRepository()
+    cache = FoliumMapCache(str(tmp_path), map_service=service, repository=repository)
+    prerenderer = MapPrerenderer(cache, workers=0)
+
+    assert prerenderer.poll() is not None
+    assert prerenderer.poll() is None
+    old = cache.get_or_render('서울', allow_stale=True)
+
+    repository.current = repository.make_snapshot(2, 'v2')
+    stale = cache.get_or_render('서울', allow_stale=True)
+    assert stale['stale'] is True and stale['filename'] == old['filename']
+    assert len(service.calls) == 3
+
+    summary = prerenderer.poll()
+    assert summary['data_version'] == 2 and len(summary['rendered']) == 3
+    fresh = cache.get_or_render('서울', allow_stale=True)
+    assert fresh['stale'] is False and fresh['filename'] != old['filename']
+
+
+def test_background_render_returns_pending_until_ready(tmp_path):
+    """준비된 지도가 없으면 요청에서 그리지 않고 pending을 반환한 뒤 백그라운드에서 생성"""
+    import threading
+
+    release = threading.Event()
+
+    class SlowMapService(FakeMapService):
+        def create_region_map(self, region, hospitals=None, filepath=None, render_mode=None):
+            release.wait(5)
+            return super().create_region_map(region, hospitals, filepath, render_mode)
+
+    service = SlowMapService()
+    cache = FoliumMapCache(str(tmp_path), map_service=service, repository=FakeRepository())
+
+    pending = cache.get_or_render('서울', allow_stale=True, background=True)
+    again = cache.get_or_render('서울', allow_stale=True, background=True)
+    assert pending['pending'] is True and again['pending'] is True
+    assert not os.path.exists(pending['filepath'])
+
+    release.set()
+    for thread in [t for t in threading.enumerate() if t.name.startswith('map-render-')]:
+        thread.join(5)
+    ready = cache.get_or_render('서울', allow_stale=True, background=True)
+    assert ready['pending'] is False and ready['cache_hit'] is True
+    assert service.calls == [('서울', 1)]
+
+
+def test_spawn_workers_can_reimport_production_entry_point():
+    """spawn 작업 프로세스가 run_prod.py를 __main__으로 다시 import해도 앱을 만들거나 서버를 띄우지 않음"""
+    import subprocess
+
+    root = os.path.join(os.path.dirname(__file__), '..')
+    script = (
+        "import multiprocessing, os, sys\n"
+        "from concurrent.futures import ProcessPoolExecutor\n"
+        "import __main__\n"
+        # 실제 실행(python run_prod.py)처럼 작업 프로세스가 run_prod.py를 __mp_main__으로 import
+        "__main__.__file__ = os.path.abspath('run_prod.py')\n"
+        "context = multiprocessing.get_context('spawn')\n"
+        "with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:\n"
+        "    print(executor.submit(os.getpid).result() != os.getpid())\n"
+    )
+    completed = subprocess.run([sys.executable, '-c', script], cwd=root, capture_output=True,
+                               text=True, timeout=60)
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == 'True'
+    assert '프로덕션 서버 시작' not in completed.stdout
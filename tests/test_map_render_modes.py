@@ -0,0 +1,68 @@
+"""
+Map Render Mode Test
+지도 마커 표시 방식 테스트 (DB 대신 직접 만든 병원 목록 사용)
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.hospital import Hospital
+from app.services.folium_map_service import RENDER_MODES, FoliumMapService, choose_render_mode
+
+
+def make_hospitals():
+    return [
+        Hospital(hospital_id=1, name='<강남> 병원', address='테헤란로 1 서울특별시 강남구',
+                 latitude=37.50, longitude=127.03, medical_departments=['병원'], bed_count=30),
+        Hospital(hospital_id=2, name='해운대 종합병원', address='중앙로 5 부산광역시 해운대구',
+                 latitude=35.16, longitude=129.16, medical_departments=['종합병원']),
+        Hospital(hospital_id=3, name='한방 의원', address='시청로 1 대전광역시 서구',
+                 latitude=36.35, longitude=127.38, medical_departments=['한의원']),
+    ]
+
+
+def test_choose_render_mode_by_point_count():
+    """점이 적으면 아이콘 마커, 많으면 가벼운 방식"""
+    assert choose_render_mode(50) == 'markers'
+    assert choose_render_mode(400) == 'canvas'
+    assert choose_render_mode(905) == 'fast_cluster'
+
+
+@pytest.mark.parametrize('mode, expected', [
+    ('markers', 'L.AwesomeMarkers.icon('),
+    ('cluster', 'markercluster.js'),
+    ('fast_cluster', 'var callback = (function () {'),
+    ('canvas', 'L.circleMarker('),
+])
+def test_each_mode_keeps_type_layers(tmp_path, mode, expected):
+    """모든 방식이 종별 레이어 체크박스를 유지하고, 팝업 내용은 지도에 넣지 않음"""
+    filepath = str(tmp_path / f'{mode}.html')
+    FoliumMapService().create_hospital_map(hospitals=make_hospitals(), filepath=filepath, render_mode=mode)
+
+    with open(filepath, encoding='utf-8') as f:
+        html = f.read()
+    assert mode in RENDER_MODES
+    assert expected in html
+    # 레이어 컨트롤에는 종별 이름이 JSON 문자열로 들어감
+    assert all(json.dumps(name) in html for name in ('종합병원', '병원', '의원', '요양병원'))
+    # 좌표/ID만 내장하고 팝업은 클릭할 때 조회
+    assert '강남' not in html and '📍 주소' not in html
+    assert '/api/hospitals/{id}/popup' in html
+    assert ('markercluster' in html) == (mode in ('cluster', 'fast_cluster'))
+
+
+def test_fast_cluster_uses_fast_marker_cluster_rows(tmp_path):
+    """fast_cluster는 FastMarkerCluster에 [위도, 경도, ID] 배열만 넘기고 점 마커는 콜백에서 생성"""
+    filepath = str(tmp_path / 'fast_cluster.html')
+    FoliumMapService().create_hospital_map(hospitals=make_hospitals(), filepath=filepath, render_mode='fast_cluster')
+
+    with open(filepath, encoding='utf-8') as f:
+        html = f.read()
+    assert 'markercluster.js' in html and '"chunkedLoading": true' in html
+    assert 'L.divIcon(' in html and 'L.circleMarker(' not in html
+    assert '[37.5, 127.03, 1]' in html and '[35.16, 129.16, 2]' in html
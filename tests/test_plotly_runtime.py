@@ -0,0 +1,79 @@
+"""
+Plotly Runtime Test
+공유 plotly.js (내용 해시 파일명, 장기 캐시), Figure spec 출력 형식, spec으로 그리는 차트 대시보드 테스트
+"""
+
+import json
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app import create_app
+from app.services import chart_build
+from app.services.chart_build import ChartBuilder
+from app.services.plotly_runtime import ensure_plotly_runtime, plotly_runtime_filename, plotly_runtime_url
+
+FACILITY = [
+    {'광역지자체': '서울특별시', '2022년12월': 10, '2023년12월': 12, '2024년12월': 15},
+    {'광역지자체': '부산광역시', '2022년12월': 5, '2023년12월': 6, '2024년12월': 8},
+]
+
+
+def test_runtime_file_is_fingerprinted(tmp_path):
+    """plotly.js 파일명은 내용 해시, 한 번만 저장"""
+    filename = plotly_runtime_filename()
+    assert filename.startswith('plotly-') and filename.endswith('.min.js')
+    assert plotly_runtime_url() == '/vendor/' + filename
+
+    path = ensure_plotly_runtime(tmp_path)
+    assert path.name == filename and path.stat().st_size > 1_000_000
+    modified = path.stat().st_mtime_ns
+    assert ensure_plotly_runtime(tmp_path).stat().st_mtime_ns == modified
+
+
+def test_spec_format_writes_figure_json(tmp_path):
+    """spec 형식은 HTML 없이 Figure JSON만 저장하고 공유 plotly.js를 public/vendor에 저장"""
+    import pandas as pd
+
+    builder = ChartBuilder(chart_dir=str(tmp_path / 'Chart'), public_dir=str(tmp_path / 'public'),
+                           workers=0, figure_format='spec')
+    summary = builder.run(['chart1'], sources={'facility': pd.DataFrame(FACILITY)})
+
+    assert summary['failed'] == []
+    spec_path = tmp_path / 'public' / 'specs' / 'chart1_regional_yearly.json'
+    figure = json.loads(spec_path.read_text(encoding='utf-8'))
+    assert figure['data'] and figure['layout']['title']['text'].startswith('광역지자체별 연도별 위탁병원 현황')
+    assert (tmp_path / 'Chart' / 'public' / 'specs' / 'chart1_regional_yearly.json').exists()
+    assert not list(tmp_path.rglob('*.html'))
+    assert (tmp_path / 'public' / 'vendor' / plotly_runtime_filename()).exists()
+
+    # 형식이 바뀌면 다시 생성 (both: HTML과 spec)
+    both = ChartBuilder(chart_dir=str(tmp_path / 'Chart'), public_dir=str(tmp_path / 'public'),
+                        workers=0, figure_format='both')
+    assert both.run(['chart1'], sources={'facility': pd.DataFrame(FACILITY)})['built']
+    assert (tmp_path / 'public' / 'chart1_regional_yearly.html').exists()
+
+
+def test_dashboard_loads_runtime_once_and_serves_specs(tmp_path, monkeypatch):
+    """대시보드는 plotly.js를 한 번만 불러오고 iframe 대신 spec 사용, 런타임은 장기 캐시"""
+    monkeypatch.setattr(chart_build, 'PUBLIC_DIR', tmp_path)
+    (tmp_path / 'specs').mkdir()
+    (tmp_path / 'specs' / 'chart4_yearly_area.json').write_text('{"data": [], "layout": {}}', encoding='utf-8')
+    client = create_app('testing').test_client()
+
+    for page in ('/c', '/c1'):
+        html = client.get(page).get_data(as_text=True)
+        assert html.count(plotly_runtime_url()) == 1 and '<iframe' not in html
+        assert 'data-spec="/chart-specs/chart4_yearly_area.json"' in html
+
+    spec = client.get('/chart-specs/chart4_yearly_area.json')
+    assert spec.status_code == 200 and spec.headers['ETag']
+    assert client.get('/chart-specs/chart9.json').status_code == 404
+
+    runtime = client.get(plotly_runtime_url())
+    assert runtime.status_code == 200
+    assert 'immutable' in runtime.headers['Cache-Control'] and 'max-age=31536000' in runtime.headers['Cache-Control']
+    assert (tmp_path / 'vendor' / plotly_runtime_filename()).exists()
+    assert client.get('/vendor/plotly-0000.min.js').status_code == 404
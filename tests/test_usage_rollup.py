@@ -0,0 +1,79 @@
+"""
+Usage Rollup Test
+이용인원 롤업 - 상위 단위 합계, 일부 연월 교체, 증분/전체 갱신 테스트 (DB 대신 가짜 리포지토리 사용)
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.usage_rollup import UsageRollup
+from app.repositories.usage_rollup_store import UsageRollupStore
+
+ROWS = [
+    (2023, 11, '서울특별시', 100.0, 3),
+    (2023, 11, '부산광역시', 40.0, 2),
+    (2023, 12, '서울특별시', 110.0, 3),
+    (2024, 1, '서울특별시', 90.0, 3),
+    (2024, 1, '경기도', 70.0, 4),
+]
+
+
+class FakeUsageRepository:
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.calls = []
+
+    def load_monthly_totals(self, since=None):
+        self.calls.append(since)
+        return [row for row in self.rows if not since or row[0] * 100 + row[1] >= since]
+
+
+def test_rollup_levels():
+    """연월, 연도/광역지자체, 광역지자체, 연도별 합계와 원본 행 수"""
+    rollup = UsageRollup(ROWS)
+
+    assert rollup.periods == [(2023, 11), (2023, 12), (2024, 1)] and rollup.latest == (2024, 1)
+    assert rollup.monthly() == [(2023, 11, 140.0, 5), (2023, 12, 110.0, 3), (2024, 1, 160.0, 7)]
+    assert rollup.year_regions()[:2] == [(2023, '부산광역시', 40.0, 2), (2023, '서울특별시', 210.0, 6)]
+    assert rollup.regions() == [('경기도', 70.0, 4), ('부산광역시', 40.0, 2), ('서울특별시', 300.0, 9)]
+    assert rollup.years() == [(2023, 250.0, 8), (2024, 160.0, 7)]
+
+
+def test_replaced_matches_rebuild():
+    """일부 연월만 교체한 롤업이 처음부터 만든 롤업과 같고, 기존 롤업은 그대로"""
+    rollup = UsageRollup(ROWS)
+    new_rows = [(2024, 1, '서울특별시', 95.0, 3), (2024, 2, '부산광역시', 30.0, 2)]
+    replaced = rollup.replaced({(2024, 1), (2024, 2)}, new_rows)
+
+    expected = UsageRollup(ROWS[:3] + new_rows)
+    assert replaced.rows() == expected.rows()
+    assert replaced.regions() == expected.regions() and replaced.years() == expected.years()
+    assert replaced.fingerprint == expected.fingerprint != rollup.fingerprint
+    assert rollup.rows() == UsageRollup(ROWS).rows()
+
+
+def test_store_refreshes_from_latest_period():
+    """만료 후에는 마지막 연월부터만 다시 읽고, 내용이 같으면 같은 롤업/버전 유지"""
+    repository = FakeUsageRepository(ROWS)
+    store = UsageRollupStore(repository, ttl=0)
+
+    first = store.get()
+    assert repository.calls == [None] and store.data_version == 1
+
+    assert store.get() is first
+    assert repository.calls == [None, 202401] and store.data_version == 1
+
+    repository.rows.append((2024, 2, '서울특별시', 80.0, 3))
+    updated = store.get()
+    assert updated.latest == (2024, 2) and store.data_version == 2
+    assert updated.rows() == UsageRollup(repository.rows).rows()
+
+    # 과거 연월 수정은 전체 재조회(invalidate 또는 주기)에서 반영
+    repository.rows[0] = (2023, 11, '서울특별시', 105.0, 3)
+    assert store.get().rows()[1][3] == 100.0
+    store.invalidate()
+    assert store.get().rows()[1][3] == 105.0 and repository.calls[-1] is None
+    assert store.stats()['full_refreshes'] == 2 and store.stats()['latest_period'] == '202402'